@@ -18,6 +18,11 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Text cleaning patterns used by ResponseParser.clean_text
+_HTML_ENTITY_RE = re.compile(r"&[a-zA-Z0-9#]+;")
+_WHITESPACE_RE = re.compile(r"\s+")
+_NON_PRINTABLE_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]")
+
 
 class ResponseParser:
     """
@@ -378,13 +383,13 @@ class ResponseParser:
             return ""
 
         # Remove HTML entities
-        text = re.sub(r"&[a-zA-Z0-9#]+;", " ", text)
+        text = _HTML_ENTITY_RE.sub(" ", text)
 
         # Remove extra whitespace
-        text = re.sub(r"\s+", " ", text)
+        text = _WHITESPACE_RE.sub(" ", text)
 
         # Remove non-printable characters
-        text = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]", "", text)
+        text = _NON_PRINTABLE_RE.sub("", text)
 
         return text.strip()
 
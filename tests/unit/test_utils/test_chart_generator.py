@@ -0,0 +1,471 @@
+# tests/unit/test_utils/test_chart_generator.py
+"""
+Unit tests for chart generation utilities.
+
+Tests data aggregation helpers and chart export. Plotly figures are
+replaced by minimal stand-ins so the tests run without plotting libraries.
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+
+class FakeFigure:
+    """Stand-in for a plotly figure exposing to_dict()."""
+
+    def __init__(self, data=None, layout=None):
+        self.data = data or []
+        self.layout = layout or {}
+
+    def to_dict(self):
+        return {"data": self.data, "layout": self.layout}
+
+
+@pytest.fixture
+def generator(tmp_path):
+    """Create a ChartGenerator exporting JSON into a temporary directory."""
+    from utils.visualization.chart_generator import ChartGenerator
+
+    return ChartGenerator(
+        {
+            "output_format": "json",
+            "export": {
+                "output_dir": str(tmp_path),
+                "include_data": True,
+                "responsive": True,
+            },
+        }
+    )
+
+
+class TestLazyImports:
+    """Tests for deferred plotting library imports."""
+
+    def test_construction_imports_nothing(self, generator):
+        """Test that creating a generator does not import plotting libraries."""
+        assert "go" not in vars(generator)
+        assert "plt" not in vars(generator)
+
+    def test_availability_follows_installed_packages(self, generator, monkeypatch):
+        """Test that availability is looked up without importing."""
+        import importlib.util
+
+        monkeypatch.setattr(
+            importlib.util,
+            "find_spec",
+            lambda name: object() if name == "plotly" else None,
+        )
+
+        assert generator.plotly_available is True
+        assert generator.matplotlib_available is False
+
+
+class TestAggregation:
+    """Tests for the counting helpers."""
+
+    def test_aggregate_by_field(self, generator):
+        """Test that missing and None values are grouped as Unknown."""
+        characters = [
+            {"source": "wiki"},
+            {"source": "wiki"},
+            {"source": None},
+            {},
+            {"source": 0},
+        ]
+
+        counts = generator._aggregate_by_field(characters, "source")
+
+        assert counts == {"wiki": 2, "Unknown": 2, "0": 1}
+
+    def test_count_categories(self, generator):
+        """Test that categories are stripped and invalid entries skipped."""
+        characters = [
+            {"categories": ["Pirates", " Pirates ", "", None, 3]},
+            {"categories": ["Marines", "Pirates"]},
+            {"categories": "Pirates"},
+            {},
+        ]
+
+        counts, with_categories = generator._count_categories(characters)
+
+        assert counts == {"Pirates": 3, "Marines": 1}
+        assert with_categories == 3
+        assert counts.most_common(1) == [("Pirates", 3)]
+
+
+class TestFindQualityScore:
+    """Tests for ChartGenerator._find_quality_score."""
+
+    def test_locations_in_priority_order(self):
+        """Test that the first non-None location wins."""
+        from utils.visualization.chart_generator import ChartGenerator
+
+        find = ChartGenerator._find_quality_score
+
+        assert find({"quality_score": 0.5, "overall_score": 0.9}) == 0.5
+        assert find({"quality_score": None, "overall_score": 0.9}) == 0.9
+        assert find({"fusion_metadata": {"confidence_score": 0.8}}) == 0.8
+        assert find({"_quality_metadata": "broken"}) is None
+        assert find({}) is None
+
+
+class TestSummarizeQuality:
+    """Tests for ChartGenerator._summarize_quality."""
+
+    def test_bucket_boundaries(self, generator):
+        """Test that bucket lower bounds are inclusive."""
+        quality = generator._summarize_quality(
+            [0.9, 0.89, 0.75, 0.6, 0.59, "1", None, "bad", float("nan")]
+        )
+
+        assert quality["scores"][:6] == [0.9, 0.89, 0.75, 0.6, 0.59, 1.0]
+        assert quality["distribution"] == {
+            "excellent": 2,
+            "good": 2,
+            "fair": 1,
+            "poor": 2,
+        }
+        assert list(quality["distribution"]) == ["excellent", "good", "fair", "poor"]
+
+    def test_no_scores(self, generator):
+        """Test that an empty input yields empty buckets."""
+        quality = generator._summarize_quality([])
+
+        assert quality == {
+            "scores": [],
+            "distribution": {"excellent": 0, "good": 0, "fair": 0, "poor": 0},
+        }
+
+
+class TestCountDates:
+    """Tests for ChartGenerator._count_dates."""
+
+    def test_counts_per_local_day(self, generator, caplog):
+        """Test that dates are grouped by the day they were recorded on."""
+        from datetime import datetime
+
+        counts = generator._count_dates(
+            [
+                "2024-01-02T10:00:00Z",
+                "2024-01-01T23:30:00-05:00",
+                "2024-01-01",
+                datetime(2024, 1, 3, 12),
+                None,
+                "",
+                "not a date",
+                "still not a date",
+            ]
+        )
+
+        assert counts == {"2024-01-01": 2, "2024-01-02": 1, "2024-01-03": 1}
+        assert list(counts) == ["2024-01-01", "2024-01-02", "2024-01-03"]
+        assert "Failed to parse 2 of 5 date values" in caplog.text
+
+
+class TestDownsampleTimeline:
+    """Tests for ChartGenerator._downsample_timeline."""
+
+    def test_short_timelines_are_unchanged(self, generator):
+        """Test that timelines within the target are returned as-is."""
+        dates = ["2024-01-01", "2024-01-02"]
+
+        assert generator._downsample_timeline(dates, [1, 2], 10) == (dates, [1, 2])
+
+    def test_keeps_endpoints_and_peaks(self, generator):
+        """Test that downsampling keeps the ends and outstanding points."""
+        from datetime import date, timedelta
+
+        start = date(2024, 1, 1)
+        dates = [(start + timedelta(days=i)).isoformat() for i in range(1000)]
+        counts = [1] * 1000
+        counts[421] = 50
+
+        kept_dates, kept_counts = generator._downsample_timeline(dates, counts, 100)
+
+        assert len(kept_dates) == len(kept_counts) == 100
+        assert kept_dates[0] == dates[0] and kept_dates[-1] == dates[-1]
+        assert kept_dates == sorted(kept_dates)
+        assert 50 in kept_counts
+
+
+class TestComputeAllAggregates:
+    """Tests for the fused aggregation pass."""
+
+    def test_matches_individual_helpers(self, generator):
+        """Test that one pass yields the same aggregates as each helper."""
+        characters = [
+            {
+                "source": "wiki",
+                "quality_score": 0.95,
+                "scraped_at": "2024-01-02T10:00:00Z",
+                "categories": ["Pirates"],
+            },
+            {
+                "source": "wiki",
+                "_quality_metadata": {"overall_score": "0.7"},
+                "scraped_at": "2024-01-01T08:00:00",
+                "categories": ["Pirates", "Marines"],
+            },
+            {"source": None, "quality_score": "n/a", "scraped_at": "not a date"},
+        ]
+
+        aggregates = generator._compute_all_aggregates(characters)
+
+        assert aggregates.sources == generator._aggregate_by_field(characters, "source")
+        assert aggregates.quality == generator._extract_quality_data(characters)
+        assert aggregates.timeline == generator._process_timeline_data(
+            characters, "scraped_at"
+        )
+        assert aggregates.categories == generator._count_categories(characters)[0]
+        assert aggregates.quality["distribution"] == {
+            "excellent": 1,
+            "good": 0,
+            "fair": 1,
+            "poor": 0,
+        }
+        assert list(aggregates.timeline) == ["2024-01-01", "2024-01-02"]
+
+
+class TestFigureDicts:
+    """Tests for charts built as plain figure dicts."""
+
+    @pytest.fixture
+    def characters(self):
+        """Characters covering every chart field."""
+        return [
+            {
+                "source": "wiki",
+                "quality_score": 0.8,
+                "scraped_at": "2024-01-01T10:00:00",
+                "categories": ["Pirates"],
+            },
+            {
+                "source": "api",
+                "quality_score": 0.6,
+                "scraped_at": "2024-01-02T10:00:00",
+                "categories": ["Pirates", "Marines"],
+            },
+        ]
+
+    @staticmethod
+    def load(result):
+        with open(result["output_path"], encoding="utf-8") as f:
+            return json.load(f)
+
+    @pytest.fixture(autouse=True)
+    def plotly(self, generator):
+        """Pretend plotly is installed; JSON export does not use it."""
+        generator.plotly_available = True
+
+    def test_character_distribution(self, generator, characters):
+        """Test the pie chart payload."""
+        result = generator.generate_character_distribution(characters)
+
+        exported = self.load(result)
+        assert result["success"] is True
+        assert exported["data"][0]["type"] == "pie"
+        assert exported["data"][0]["values"] == [1, 1]
+        assert exported["layout"]["title"] == {
+            "text": "Character Distribution by Source"
+        }
+
+    def test_quality_overview_marks_average(self, generator, characters):
+        """Test that the average is drawn as a full-height line."""
+        result = generator.generate_quality_overview(characters)
+
+        layout = self.load(result)["layout"]
+        assert result["data_summary"]["average_quality"] == pytest.approx(0.7)
+        assert layout["shapes"][0]["x0"] == pytest.approx(0.7)
+        assert layout["annotations"][0]["text"] == "Average: 0.70"
+
+    def test_bar_and_line_charts(self, generator, characters):
+        """Test the category, source and timeline chart payloads."""
+        categories = self.load(generator.generate_category_analysis(characters))
+        sources = self.load(generator.generate_source_statistics(characters))
+        timeline = self.load(generator.generate_timeline_chart(characters))
+
+        assert categories["data"][0]["y"] == ["Pirates", "Marines"]
+        assert categories["layout"]["height"] == 400
+        assert (
+            generator.generate_category_analysis(characters)["data_summary"][
+                "characters_with_categories"
+            ]
+            == 2
+        )
+        assert sources["layout"]["xaxis"] == {"title": {"text": "Source"}}
+        assert timeline["data"][0]["x"] == ["2024-01-01", "2024-01-02"]
+        assert timeline["data"][0]["fill"] == "tonexty"
+        assert timeline["data"][0]["type"] == "scatter"
+
+    def test_long_timeline_uses_webgl(self, generator):
+        """Test that timelines above the SVG threshold switch to scattergl."""
+        from datetime import date, timedelta
+
+        start = date(2020, 1, 1)
+        characters = [
+            {"scraped_at": (start + timedelta(days=i)).isoformat()} for i in range(1500)
+        ]
+        generator.config["chart_size"] = {"width": 1200, "height": 600}
+
+        timeline = self.load(generator.generate_timeline_chart(characters))
+
+        assert timeline["data"][0]["type"] == "scattergl"
+        assert len(timeline["data"][0]["x"]) == 1200
+
+
+class TestWriteTextChunked:
+    """Tests for the chunked text writer."""
+
+    def test_round_trips_multibyte_text(self, tmp_path):
+        """Test that chunk boundaries do not split characters."""
+        from utils.visualization.chart_generator import _write_text_chunked
+
+        text = "ルフィ<div>" * 1000
+        path = tmp_path / "chart.html"
+
+        _write_text_chunked(path, text, chunk_size=7)
+
+        assert path.read_text(encoding="utf-8") == text
+
+
+class TestAggregateCache:
+    """Tests for memoized dashboard aggregates."""
+
+    def test_reuses_result_for_same_list(self, generator):
+        """Test that the same unchanged list is aggregated once."""
+        characters = [{"source": "wiki"}]
+
+        first = generator._compute_all_aggregates(characters)
+
+        assert generator._compute_all_aggregates(characters) is first
+        assert generator._compute_all_aggregates(list(characters)) is not first
+
+    def test_growing_list_and_clear_cache(self, generator):
+        """Test that appends and clear_cache() force a recount."""
+        characters = [{"source": "wiki"}]
+        first = generator._compute_all_aggregates(characters)
+
+        characters.append({"source": "api"})
+        second = generator._compute_all_aggregates(characters)
+        characters[0]["source"] = "fandom"
+        generator.clear_cache()
+        third = generator._compute_all_aggregates(characters)
+
+        assert first.sources == {"wiki": 1}
+        assert second.sources == {"wiki": 1, "api": 1}
+        assert third.sources == {"fandom": 1, "api": 1}
+
+    def test_cache_is_bounded(self, generator):
+        """Test that only the most recent lists are kept."""
+        lists = [[{"source": str(i)}] for i in range(10)]
+        for characters in lists:
+            generator._compute_all_aggregates(characters)
+
+        assert len(generator._aggregate_cache) == 4
+
+
+class TestExportChart:
+    """Tests for ChartGenerator._export_chart."""
+
+    def test_json_export_round_trips(self, generator):
+        """Test that figure data, including numpy arrays, is written as JSON."""
+        fig = FakeFigure(
+            data=[{"type": "bar", "x": ["a", "b"], "y": np.array([1, 2])}],
+            layout={"title": {"text": "Counts"}},
+        )
+
+        result = generator._export_chart(fig, "counts")
+
+        assert result["success"] is True
+        with open(result["output_path"], encoding="utf-8") as f:
+            exported = json.load(f)
+        assert exported["data"] == [{"type": "bar", "x": ["a", "b"], "y": [1, 2]}]
+        assert exported["layout"] == {"title": {"text": "Counts"}}
+        assert exported["config"]["output_format"] == "json"
+
+    def test_json_export_without_orjson(self, generator, monkeypatch):
+        """Test the stdlib json fallback."""
+        import builtins
+
+        real_import = builtins.__import__
+
+        def fake_import(name, *args, **kwargs):
+            if name == "orjson":
+                raise ImportError(name)
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", fake_import)
+
+        result = generator._export_chart(
+            FakeFigure(data=[{"y": np.array([0.5])}]), "fallback"
+        )
+
+        with open(result["output_path"], encoding="utf-8") as f:
+            assert json.load(f)["data"] == [{"y": [0.5]}]
+
+    def test_html_export_skips_validation(self, generator):
+        """Test that HTML is rendered once without revalidating the figure."""
+        calls = []
+
+        class FakePlotlyIO:
+            @staticmethod
+            def to_html(fig, **kwargs):
+                calls.append(kwargs)
+                return "<html>chart</html>"
+
+        generator.config["output_format"] = "html"
+        generator.pio = FakePlotlyIO
+
+        result = generator._export_chart(FakeFigure(), "chart")
+
+        assert result["success"] is True
+        assert result["output_path"].endswith(".html")
+        with open(result["output_path"], encoding="utf-8") as f:
+            assert f.read() == "<html>chart</html>"
+        assert calls[0]["validate"] is False
+        assert calls[0]["include_plotlyjs"] == "cdn"
+
+    def test_image_export_uses_kaleido(self, generator, monkeypatch):
+        """Test that PNG/SVG go through plotly's kaleido image writer."""
+        import importlib.util
+
+        calls = []
+
+        class FakePlotlyIO:
+            @staticmethod
+            def write_image(fig, path, **kwargs):
+                calls.append(kwargs)
+                with open(path, "wb") as f:
+                    f.write(b"<svg/>")
+
+        monkeypatch.setattr(importlib.util, "find_spec", lambda name: object())
+        generator.config["output_format"] = "svg"
+        generator.pio = FakePlotlyIO
+
+        result = generator._export_chart(FakeFigure(), "chart")
+
+        assert result["success"] is True
+        assert result["output_path"].endswith(".svg")
+        assert calls == [{"format": "svg", "validate": False}]
+
+    def test_image_export_without_kaleido(self, generator, monkeypatch):
+        """Test that image formats fail cleanly when kaleido is missing."""
+        import importlib.util
+
+        monkeypatch.setattr(importlib.util, "find_spec", lambda name: None)
+        generator.config["output_format"] = "png"
+
+        result = generator._export_chart(FakeFigure(), "chart")
+
+        assert result["success"] is False
+        assert "kaleido" in result["error"]
+
+    def test_unsupported_format(self, generator):
+        """Test that formats without an exporter fail cleanly."""
+        generator.config["output_format"] = "bmp"
+
+        result = generator._export_chart(FakeFigure(), "chart")
+
+        assert result["success"] is False
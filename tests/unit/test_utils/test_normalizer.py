@@ -0,0 +1,465 @@
+# tests/unit/test_utils/test_normalizer.py
+"""
+Unit tests for data normalization module.
+
+Tests text cleaning, bounty parsing and character data normalization.
+"""
+
+import pytest
+
+
+@pytest.fixture
+def normalizer():
+    """Create a DataNormalizer instance."""
+    from utils.normalizer import DataNormalizer
+
+    return DataNormalizer()
+
+
+class TestParseBounty:
+    """Tests for DataNormalizer.parse_bounty."""
+
+    def test_empty_bounty(self, normalizer):
+        """Test that empty input yields an unknown bounty."""
+        result = normalizer.parse_bounty("")
+
+        assert result == {"amount": 0, "currency": "Berry", "formatted": "Unknown"}
+
+    def test_takes_largest_amount(self, normalizer):
+        """Test that the largest number in the text is used."""
+        result = normalizer.parse_bounty("30,000,000 (initial), 1,500,000,000 (current)")
+
+        assert result["amount"] == 1500000000
+        assert result["formatted"].endswith("B Berry")
+
+    def test_zero_bounty(self, normalizer):
+        """Test that an explicit zero is kept as an amount."""
+        result = normalizer.parse_bounty("0")
+
+        assert result["amount"] == 0
+        assert result["formatted"] == "0 Berry"
+
+    def test_text_without_numbers(self, normalizer):
+        """Test that text without digits is returned as-is."""
+        result = normalizer.parse_bounty("Classified")
+
+        assert result == {"amount": 0, "currency": "Berry", "formatted": "Classified"}
+
+
+class TestFormatBerry:
+    """Tests for format_berry helper."""
+
+    @pytest.mark.parametrize(
+        "amount,expected",
+        [
+            (500, "500 Berry"),
+            (30000, "30K Berry"),
+            (300000000, "300M Berry"),
+            (1500000000, "1.5B Berry"),
+            (999999999, "999M Berry"),
+            (1999999999, "1.9B Berry"),
+        ],
+    )
+    def test_thresholds(self, amount, expected):
+        """Test each formatting threshold."""
+        from utils.normalizer import format_berry
+
+        assert format_berry(amount) == expected
+
+
+class TestDataQuality:
+    """Tests for single-record and batch quality scoring."""
+
+    RECORDS = [
+        {"name": "Luffy", "anime": "One Piece", "description": "x" * 150, "abilities": ["Gear"]},
+        {"name": "Zoro", "anime": "One Piece", "age": "21", "relationships": {}},
+        {"name": "   ", "anime": None, "gender": "male", "occupation": 42},
+        {},
+    ]
+
+    def test_complete_record_scores_high(self, normalizer):
+        """Test that a complete record reaches the maximum score."""
+        record = {
+            "name": "Luffy",
+            "anime": "One Piece",
+            "description": "x" * 150,
+            "age": "19",
+            "gender": "male",
+            "occupation": "Captain",
+            "abilities": ["Gear Fifth"],
+            "relationships": {"brother": "Ace"},
+        }
+
+        assert normalizer.validate_data_quality(record) == 1.0
+
+    def test_batch_matches_single_record_scores(self, normalizer):
+        """Test that batch scoring agrees with per-record scoring."""
+        batch = normalizer.validate_data_quality_batch(self.RECORDS)
+        single = [normalizer.validate_data_quality(record) for record in self.RECORDS]
+
+        assert batch.tolist() == pytest.approx(single)
+
+    def test_batch_non_string_columns(self, normalizer):
+        """Test that columns holding only non-string values score like singles."""
+        records = [
+            {"name": "Luffy", "occupation": ["a"], "age": {}, "description": 7},
+            {"name": "Zoro", "occupation": ["b"], "age": [], "description": None},
+        ]
+
+        batch = normalizer.validate_data_quality_batch(records)
+        single = [normalizer.validate_data_quality(record) for record in records]
+
+        assert batch.tolist() == pytest.approx(single)
+
+    def test_batch_empty(self, normalizer):
+        """Test that an empty batch returns an empty array."""
+        assert len(normalizer.validate_data_quality_batch([])) == 0
+
+
+class TestCleanCharacterName:
+    """Tests for DataNormalizer.clean_character_name."""
+
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("Monkey D. Luffy", "Monkey D. Luffy"),
+            ("Koby (Anime)", "Koby"),
+            ("Nami (One Piece character)", "Nami"),
+            ("Smoker (Vice Admiral)", "Smoker (Vice Admiral)"),
+            ("Ken Griffey (Jr.)", "Ken Griffey (Jr.)"),
+            ("Vivi (Israeli dub)", "Vivi"),
+            ("", ""),
+        ],
+    )
+    def test_suffix_handling(self, normalizer, raw, expected):
+        """Test removal of parenthetical suffixes except important descriptors."""
+        assert normalizer.clean_character_name(raw) == expected
+
+
+class TestCleanTextBatch:
+    """Tests for DataNormalizer.clean_text_batch."""
+
+    TEXTS = [
+        "<b>Monkey</b> D. Luffy[1]",
+        "{{Infobox}}Captain of the&nbsp;Straw Hat Pirates ()",
+        "a &lt; b <i>c</i> d &gt; e",
+        "",
+        "   spaced　out   text  ",
+    ]
+
+    def test_batch_matches_single(self, normalizer):
+        """Test that batch cleaning agrees with clean_text."""
+        expected = [normalizer.clean_text(text) for text in self.TEXTS]
+
+        assert normalizer.clean_text_batch(self.TEXTS) == expected
+
+    def test_re2_batch_matches_single(self, normalizer):
+        """Test that the RE2 markup path agrees with clean_text."""
+        pytest.importorskip("re2")
+        expected = [normalizer.clean_text(text) for text in self.TEXTS]
+
+        assert normalizer.clean_text_batch(self.TEXTS, use_re2=True) == expected
+
+
+class TestNormalizeAge:
+    """Tests for DataNormalizer.normalize_age."""
+
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("19 years old", "19"),
+            ("20 - 25", "20-25"),
+            ("Unknown", None),
+            ("Young child", "child"),
+            ("Grown up", "adult"),
+            ("Ancient", "ancient"),
+            ("", None),
+        ],
+    )
+    def test_normalize_age(self, normalizer, raw, expected):
+        """Test numeric extraction and special age descriptions."""
+        assert normalizer.normalize_age(raw) == expected
+
+
+class TestNormalizeUrl:
+    """Tests for DataNormalizer.normalize_url."""
+
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("/wiki/Luffy", "https://onepiece.fandom.com/wiki/Luffy"),
+            ("http://onepiece.fandom.com/wiki/Zoro", "https://onepiece.fandom.com/wiki/Zoro"),
+            (
+                "https://static.wikia.nocookie.net/onepiece/images/a/a1/Luffy.PNG/revision/latest?cb=2023",
+                "https://static.wikia.nocookie.net/onepiece/images/a/a1/Luffy.PNG/revision/latest",
+            ),
+            ("https://onepiece.fandom.com/wiki/Nami?action=edit", "https://onepiece.fandom.com/wiki/Nami?action=edit"),
+            ("https://onepiece.fandom.com/wiki/Nami?image=Nami.png", "https://onepiece.fandom.com/wiki/Nami?image=Nami.png"),
+            ("https://example.com/images/Usopp.jpg?width=200", "https://example.com/images/Usopp.jpg"),
+            ("", ""),
+        ],
+    )
+    def test_normalize_url(self, normalizer, raw, expected):
+        """Test relative resolution, image query stripping and HTTPS upgrade."""
+        assert normalizer.normalize_url(raw, "https://onepiece.fandom.com") == expected
+
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("/images/Chopper.png?cb=1", "/images/Chopper.png"),
+            ("https://cdn.example.com/a/Robin.webp#top", "https://cdn.example.com/a/Robin.webp"),
+            ("https://logo.png?x=1", "https://logo.png?x=1"),
+        ],
+    )
+    def test_image_query_stripping_without_base(self, normalizer, raw, expected):
+        """Test image detection on relative URLs, fragments and bare hosts."""
+        assert normalizer.normalize_url(raw) == expected
+
+
+class TestCleanDescription:
+    """Tests for DataNormalizer.clean_description."""
+
+    def test_truncates_at_sentence_boundary(self, normalizer):
+        """Test that long descriptions are cut after the last full sentence."""
+        text = "First sentence. Second sentence. Third sentence is long."
+
+        assert normalizer.clean_description(text, max_length=35) == "First sentence. Second sentence."
+
+    def test_boundary_ending_exactly_at_limit(self, normalizer):
+        """Test that a sentence boundary ending at max_length is used."""
+        assert normalizer.clean_description("Abc. Defghij", max_length=5) == "Abc."
+
+    def test_hard_truncates_without_boundary(self, normalizer):
+        """Test ellipsis truncation when no sentence boundary fits."""
+        text = "A" * 50
+
+        assert normalizer.clean_description(text, max_length=20) == "A" * 17 + "..."
+
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("is a pirate from East Blue.", "Pirate from East Blue."),
+            ("Was the captain of the Roger Pirates.", "Captain of the Roger Pirates."),
+            ("Island of the Straw Hats.", "Island of the Straw Hats."),
+        ],
+    )
+    def test_strips_wiki_prefixes(self, normalizer, raw, expected):
+        """Test removal of leading wiki phrasing."""
+        assert normalizer.clean_description(raw) == expected
+
+    def test_normalize_description_strips_prefix(self, normalizer):
+        """Test removal of leading character phrasing."""
+        assert normalizer.normalize_description("Is a character from One Piece") == "From One Piece"
+
+    def test_short_description_unchanged(self, normalizer):
+        """Test that descriptions within the limit are not truncated."""
+        assert normalizer.clean_description("Short. Text.", max_length=50) == "Short. Text."
+
+
+class TestNormalizeText:
+    """Tests for DataNormalizer.normalize_text."""
+
+    def test_normalizes_quotes(self, normalizer):
+        """Test that typographic quotes become ASCII quotes."""
+        result = normalizer.normalize_text("\u201cKing of the Pirates\u201d, Luffy\u2019s `dream`", preserve_case=True)
+
+        assert result == "\"King of the Pirates\", Luffy's \"dream\""
+
+    def test_strips_tags_and_whitespace(self, normalizer):
+        """Test tag removal and whitespace collapsing."""
+        assert normalizer.normalize_text("  <b>Straw</b>   Hat  ", preserve_case=True) == "Straw Hat"
+
+    def test_empty_returns_none(self, normalizer):
+        """Test that empty input yields None."""
+        assert normalizer.normalize_text("") is None
+
+
+class TestNormalizeFieldName:
+    """Tests for DataNormalizer.normalize_field_name."""
+
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("Real Name:", "name"),
+            ("Devil Fruit", "devil_fruit"),
+            ("First Appearance", "first_appearance"),
+            ("Pirate Crew Captain", "crew"),
+            ("Nick", "epithet"),
+            ("", ""),
+        ],
+    )
+    def test_normalize_field_name(self, normalizer, raw, expected):
+        """Test mapping to standard names and snake_case fallback."""
+        assert normalizer.normalize_field_name(raw) == expected
+
+    def test_repeated_names_are_cached(self, normalizer):
+        """Test that repeated field names are served from the cache."""
+        normalizer.normalize_field_name("Bounty")
+        normalizer.normalize_field_name("Bounty")
+
+        assert normalizer._field_name_cache.cache_info().hits == 1
+
+    def test_reload_field_mappings(self, normalizer):
+        """Test that edited mappings take effect after a reload."""
+        assert normalizer.normalize_field_name("Debut") == "debut"
+
+        normalizer.field_mappings["first appearance"] = "debut"
+        normalizer.reload_field_mappings()
+
+        assert normalizer.normalize_field_name("First Appearance (manga)") == "debut"
+
+
+class TestNormalizeGender:
+    """Tests for DataNormalizer.normalize_gender."""
+
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("Male", "male"),
+            ("F", "female"),
+            ("?", None),
+            ("Female (formerly male)", "female"),
+            ("Non-binary", "non-binary"),
+            ("Unknown (presumed male)", None),
+            ("Varies by form", "varies"),
+            ("Mermaid", "mermaid"),
+            ("", None),
+        ],
+    )
+    def test_normalize_gender(self, normalizer, raw, expected):
+        """Test exact mappings and keyword fallback."""
+        assert normalizer.normalize_gender(raw) == expected
+
+
+class TestListDeduplication:
+    """Tests for order-preserving deduplication of lists."""
+
+    def test_clean_abilities_list(self, normalizer):
+        """Test case-insensitive dedup keeping the first spelling."""
+        abilities = ["Haki", "Gear Second", "haki", "N/A", "ab", None, "Gear  Second", "Gear Fourth"]
+
+        assert normalizer.clean_abilities_list(abilities) == ["Haki", "Gear Second", "Gear Fourth"]
+
+    def test_normalize_list(self, normalizer):
+        """Test order-preserving dedup of normalized items."""
+        items = ["Luffy", " Luffy ", 3, None, "Zoro", 3, ""]
+
+        assert normalizer.normalize_list(items) == ["Luffy", 3, "Zoro"]
+
+
+class TestNormalizeBounty:
+    """Tests for DataNormalizer.normalize_bounty."""
+
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("Bounty: ฿3,000,000,000", "3000000000"),
+            ("1.5 billion", "1.5 billion"),
+            ("Reward: 30 million", "30 million"),
+            ("Unknown", None),
+            ("Classified", "Classified"),
+            ("", None),
+        ],
+    )
+    def test_normalize_bounty(self, normalizer, raw, expected):
+        """Test prefix and currency stripping and unit handling."""
+        assert normalizer.normalize_bounty(raw) == expected
+
+
+class TestPostProcessing:
+    """Tests for defaults applied after character normalization."""
+
+    def test_extraction_date_shared_within_batch(self, normalizer):
+        """Test that records normalized together share one timestamp."""
+        first = normalizer.normalize_character_data({"name": "Luffy"})
+        second = normalizer.normalize_character_data({"name": "Zoro"})
+
+        assert first["extraction_date"] == second["extraction_date"]
+        assert first["extraction_date"].endswith("+00:00")
+
+    def test_existing_extraction_date_kept(self, normalizer):
+        """Test that an explicit extraction date is not overwritten."""
+        result = normalizer.normalize_character_data({"name": "Nami", "extraction_date": "2024-01-01"})
+
+        assert result["extraction_date"] == "2024-01-01"
+
+
+class TestNormalizeBatch:
+    """Tests for DataNormalizer.normalize_batch."""
+
+    RECORDS = [
+        {"Name": "<b>Monkey D. Luffy</b>", "Real Name": None, "Gender": "Male", "Age": "19 years old"},
+        {"name": "Roronoa Zoro", "gender": "Male", "abilities": ["Santoryu", "santoryu"], "Bounty": "฿1,111,000,000"},
+        {"character name": 42, "Status": "Alive", "epithet": ""},
+        {},
+    ]
+
+    def test_matches_per_record_normalization(self, normalizer):
+        """Test that batch output equals per-record output, including key order."""
+        expected = [normalizer.normalize_character_data(dict(record)) for record in self.RECORDS]
+        result = normalizer.normalize_batch(self.RECORDS)
+
+        assert result == expected
+        assert [list(record) for record in result] == [list(record) for record in expected]
+
+    def test_empty_batch(self, normalizer):
+        """Test that an empty batch returns an empty list."""
+        assert normalizer.normalize_batch([]) == []
+
+
+class TestModuleFunctions:
+    """Tests for the module-level convenience functions."""
+
+    def test_get_normalizer_returns_singleton(self):
+        """Test that the global normalizer is created once."""
+        from utils.normalizer import get_normalizer
+
+        assert get_normalizer() is get_normalizer()
+
+    def test_convenience_functions_delegate(self):
+        """Test that convenience functions match the normalizer methods."""
+        from utils.normalizer import clean_character_name, clean_text, normalize_gender
+
+        assert clean_text("  <i>Hello</i>   World[1] ") == "Hello World"
+        assert clean_character_name("Koby (Anime)") == "Koby"
+        assert normalize_gender("Female") == "female"
+
+
+class TestNormalizeStatus:
+    """Tests for DataNormalizer.normalize_status."""
+
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("Alive", "alive"),
+            (" Killed ", "deceased"),
+            ("?", "unknown"),
+            ("Disappeared", "missing"),
+            ("Imprisoned", "imprisoned"),
+            ("", None),
+        ],
+    )
+    def test_normalize_status(self, normalizer, raw, expected):
+        """Test status mappings and passthrough of unknown values."""
+        assert normalizer.normalize_status(raw) == expected
+
+    def test_labels_are_shared(self, normalizer):
+        """Test that records share the canonical label objects."""
+        assert normalizer.normalize_status("dead") is normalizer.normalize_status("killed")
+
+
+class TestNormalizeRelationships:
+    """Tests for DataNormalizer.normalize_relationships."""
+
+    def test_normalize_relationships(self, normalizer):
+        """Test relationship type mapping and name cleaning."""
+        relationships = {
+            "Brother": "Portgas D. Ace (Anime)",
+            "grandfather": "Monkey D. Garp",
+            "friend": "",
+        }
+
+        assert normalizer.normalize_relationships(relationships) == {
+            "Brother": "Portgas D. Ace",
+            "Grandfather": "Monkey D. Garp",
+        }
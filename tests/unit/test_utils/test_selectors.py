@@ -0,0 +1,634 @@
+# tests/unit/test_utils/test_selectors.py
+"""
+Unit tests for selector configuration management.
+
+Tests config loading, inheritance, caching and validation.
+"""
+
+import pytest
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Create a SelectorManager backed by a temporary config directory."""
+    from utils.selectors import SelectorManager
+
+    return SelectorManager(config_dir=tmp_path)
+
+
+class TestGetSelectors:
+    """Tests for SelectorManager.get_selectors."""
+
+    def test_inherits_generic_selectors(self, manager):
+        """Test that the One Piece config extends the generic config."""
+        from utils.selectors import SelectorConfig
+
+        config = manager.get_selectors("onepiece")
+        character_page = config["selectors"]["character_page"]
+
+        assert character_page["name"].post_process == "clean_character_name"
+        assert isinstance(character_page["infobox"], SelectorConfig)
+        assert "bounty" in config["selectors"]["infobox_fields"]
+        assert "extends" not in config
+
+    def test_unknown_anime_uses_generic(self, manager):
+        """Test that unknown anime fall back to the generic config."""
+        config = manager.get_selectors("Some Unknown-Anime")
+
+        assert "bounty" not in config["selectors"]["infobox_fields"]
+
+    def test_missing_default_file_uses_builtin(self, manager, tmp_path):
+        """Test that built-in defaults are used when their files are deleted."""
+        (tmp_path / "generic_fandom.yaml").unlink()
+        (tmp_path / "onepiece.yaml").unlink()
+
+        config = manager.get_selectors("onepiece")
+
+        assert "bounty" in config["selectors"]["infobox_fields"]
+        assert config["selectors"]["character_page"]["infobox"].selector == (
+            ".portable-infobox"
+        )
+
+    def test_builtin_defaults_are_read_only(self, manager, tmp_path):
+        """Test that loaded configs never alias the built-in defaults."""
+        from utils.selector_defaults import DEFAULT_CONFIGS, GENERIC_FANDOM_CONFIG
+
+        (tmp_path / "generic_fandom.yaml").unlink()
+
+        config = manager.get_selectors("generic_fandom")
+        config["data_extraction_rules"]["text_cleanup"].append("changed")
+
+        assert (
+            "changed"
+            not in GENERIC_FANDOM_CONFIG["data_extraction_rules"]["text_cleanup"]
+        )
+        with pytest.raises(TypeError):
+            DEFAULT_CONFIGS["naruto"] = {}  # type: ignore[index]
+
+    def test_large_config_is_loaded(self, manager, tmp_path):
+        """Test that configs above the memory-map threshold load correctly."""
+        import yaml
+
+        fields = {
+            f"field_{i}": {"selector": f"[data-source='field_{i}'] .pi-data-value"}
+            for i in range(200)
+        }
+        config_file = tmp_path / "bigwiki.yaml"
+        config_file.write_text(
+            yaml.dump({"extends": "generic_fandom", "selectors": {"extra": fields}}),
+            encoding="utf-8",
+        )
+        assert config_file.stat().st_size > 4096
+
+        config = manager.get_selectors("bigwiki")
+
+        assert len(config["selectors"]["extra"]) == 200
+        assert config["selectors"]["extra"]["field_7"].selector == (
+            "[data-source='field_7'] .pi-data-value"
+        )
+
+    def test_page_and_field_keys_are_interned(self, manager):
+        """Test that section and field names are interned strings."""
+        import sys
+
+        selectors = manager.get_selectors("onepiece")["selectors"]
+        page_type = next(key for key in selectors if key == "character_page")
+        field_name = next(key for key in selectors[page_type] if key == "name")
+
+        assert page_type is sys.intern("character_page")
+        assert field_name is sys.intern("name")
+
+    def test_result_is_cached(self, manager):
+        """Test that repeated lookups return the cached configuration."""
+        assert manager.get_selectors("onepiece") is manager.get_selectors("One Piece")
+
+
+class TestGetSelector:
+    """Tests for SelectorManager.get_selector."""
+
+    def test_resolved_selectors_are_indexed(self, manager):
+        """Test that repeated lookups skip get_selectors."""
+        from unittest.mock import patch
+
+        first = manager.get_selector("onepiece", "character_page", "name")
+        missing = manager.get_selector("onepiece", "character_page", "nope")
+
+        with patch.object(manager, "get_selectors") as get_selectors:
+            assert manager.get_selector("onepiece", "character_page", "name") is first
+            assert manager.get_selector("onepiece", "character_page", "nope") is None
+
+        get_selectors.assert_not_called()
+        assert first.selector == "h1.page-header__title"
+        assert missing is None
+
+    def test_clear_cache_resets_index(self, manager):
+        """Test that clearing the cache forgets indexed selectors."""
+        manager.get_selector("onepiece", "character_page", "name")
+
+        manager.clear_cache()
+
+        assert manager._selector_index == {}
+
+
+class TestLazySelectors:
+    """Tests for LazySelectors."""
+
+    def test_fields_are_built_on_access(self):
+        """Test that SelectorConfig objects are created lazily and memoized."""
+        from utils.selectors import LazySelectors, SelectorConfig
+
+        page = LazySelectors(
+            {
+                "name": {"selector": "h1", "fallback_selectors": None},
+                "broken": {"selector": "h2", "selector_type": "unknown"},
+                "url_pattern": "https://example.com",
+            }
+        )
+
+        name = page["name"]
+
+        assert isinstance(name, SelectorConfig)
+        assert name.fallback_selectors == []
+        assert page["name"] is name
+        assert page["url_pattern"] == "https://example.com"
+        assert len(page) == 3
+        assert "broken" in page
+        with pytest.raises(ValueError):
+            page["broken"]
+
+    def test_selector_strings_are_interned(self):
+        """Test that equal selector strings from separate configs are shared."""
+        import json
+
+        from utils.selectors import LazySelectors
+
+        raw = '{"name": {"selector": ".pi-title", "fallback_selectors": ["h1.x"]}}'
+        first = LazySelectors(json.loads(raw))["name"]
+        second = LazySelectors(json.loads(raw))["name"]
+
+        assert first.selector is second.selector
+        assert first.fallback_selectors[0] is second.fallback_selectors[0]
+
+
+class TestPreloadAll:
+    """Tests for SelectorManager.preload_all."""
+
+    def test_loads_every_config(self, manager, tmp_path):
+        """Test that valid configs are cached and broken ones are skipped."""
+        (tmp_path / "broken.yaml").write_text("selectors: [", encoding="utf-8")
+
+        loaded = manager.preload_all(max_workers=2)
+
+        assert loaded == ["generic_fandom", "onepiece"]
+        assert set(manager.cache) == {"generic_fandom", "onepiece"}
+
+    def test_concurrent_cache_writes_stay_whole(self, tmp_path):
+        """Test that threads writing the same cache file never mix copies."""
+        import json
+        import threading
+
+        from utils.selectors import _write_atomically
+
+        target = tmp_path / ".cache" / "generic_fandom.json"
+        payloads = [json.dumps({"writer": i, "data": "x" * 200_000}) for i in range(8)]
+
+        def write(payload):
+            for _ in range(10):
+                _write_atomically(target, payload.encode("utf-8"))
+
+        threads = [threading.Thread(target=write, args=(p,)) for p in payloads]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert target.read_text(encoding="utf-8") in payloads
+        assert [path.name for path in target.parent.iterdir()] == [target.name]
+
+
+class TestMergeConfigs:
+    """Tests for SelectorManager._merge_configs."""
+
+    def test_nested_values_are_merged(self, manager):
+        """Test that child values override nested base values."""
+        base = {"selectors": {"page": {"a": 1, "b": {"x": 1, "y": 2}}}, "other": [1]}
+        child = {"extends": "base", "selectors": {"page": {"b": {"y": 3}, "c": 4}}}
+
+        merged = manager._merge_configs(base, child)
+
+        assert merged == {
+            "selectors": {"page": {"a": 1, "b": {"x": 1, "y": 3}, "c": 4}},
+            "other": [1],
+        }
+        assert base["selectors"]["page"]["b"] == {"x": 1, "y": 2}
+
+
+class TestParsedConfigCache:
+    """Tests for the on-disk copy of parsed YAML configs."""
+
+    def test_parsed_copy_is_reused(self, manager, tmp_path):
+        """Test that a fresh manager loads the same config from the copy."""
+        from utils.selectors import SelectorManager
+
+        first = manager.get_selectors("onepiece")
+        assert (tmp_path / ".cache" / "onepiece.json").exists()
+
+        second = SelectorManager(config_dir=tmp_path).get_selectors("onepiece")
+
+        assert second == first
+
+    def test_edited_yaml_invalidates_copy(self, manager, tmp_path):
+        """Test that editing the YAML source is picked up."""
+        import os
+
+        import yaml
+
+        from utils.selectors import SelectorManager
+
+        manager.get_selectors("onepiece")
+
+        config_file = tmp_path / "onepiece.yaml"
+        config = yaml.safe_load(config_file.read_text(encoding="utf-8"))
+        config["selectors"]["character_page"]["name"]["selector"] = "h2.title"
+        config_file.write_text(yaml.dump(config), encoding="utf-8")
+        cache_mtime = (tmp_path / ".cache" / "onepiece.json").stat().st_mtime_ns
+        os.utime(config_file, ns=(cache_mtime + 1, cache_mtime + 1))
+
+        reloaded = SelectorManager(config_dir=tmp_path).get_selectors("onepiece")
+
+        assert reloaded["selectors"]["character_page"]["name"].selector == "h2.title"
+
+    def test_restored_older_yaml_invalidates_copy(self, manager, tmp_path):
+        """Test that a YAML file replaced with an older mtime is parsed again."""
+        import os
+
+        config_file = tmp_path / "naruto.yaml"
+        config_file.write_text("title: h1.v1\n", encoding="utf-8")
+        assert manager._load_yaml(config_file) == {"title": "h1.v1"}
+
+        mtime = config_file.stat().st_mtime_ns - 3_600_000_000_000
+        config_file.write_text("title: h1.v2\n", encoding="utf-8")
+        os.utime(config_file, ns=(mtime, mtime))
+
+        assert manager._load_yaml(config_file) == {"title": "h1.v2"}
+
+    def test_non_string_keys_are_not_copied(self, manager, tmp_path):
+        """Test that documents JSON cannot round-trip are always parsed."""
+        config_file = tmp_path / "naruto.yaml"
+        config_file.write_text("episodes:\n  1: Enter\n", encoding="utf-8")
+
+        assert manager._load_yaml(config_file) == {"episodes": {1: "Enter"}}
+        assert manager._load_yaml(config_file) == {"episodes": {1: "Enter"}}
+        assert not (tmp_path / ".cache" / "naruto.json").exists()
+
+    def test_processed_config_is_reused(self, manager, tmp_path):
+        """Test that a fresh manager skips YAML when the pickle is current."""
+        from unittest.mock import patch
+
+        from utils.selectors import SelectorManager
+
+        first = manager.get_selectors("onepiece")
+        assert (tmp_path / ".cache" / "onepiece.pkl").exists()
+
+        fresh = SelectorManager(config_dir=tmp_path)
+        with patch.object(fresh, "_load_yaml") as load_yaml:
+            second = fresh.get_selectors("onepiece")
+
+        load_yaml.assert_not_called()
+        assert second == first
+
+    def test_other_cache_version_is_ignored(self, manager, tmp_path, monkeypatch):
+        """Test that pickles written in another cache format are not reused."""
+        from unittest.mock import patch
+
+        from utils import selectors
+
+        manager.get_selectors("onepiece")
+        monkeypatch.setattr(
+            selectors,
+            "_PROCESSED_CACHE_VERSION",
+            selectors._PROCESSED_CACHE_VERSION + 1,
+        )
+
+        fresh = selectors.SelectorManager(config_dir=tmp_path)
+        with patch.object(
+            fresh, "_process_config", wraps=fresh._process_config
+        ) as process:
+            fresh.get_selectors("onepiece")
+
+        process.assert_called_once()
+
+    def test_edited_base_invalidates_processed_config(self, manager, tmp_path):
+        """Test that editing the base config invalidates inheriting configs."""
+        import os
+
+        from utils.selectors import SelectorManager
+
+        manager.get_selectors("onepiece")
+
+        base_file = tmp_path / "generic_fandom.yaml"
+        base_file.write_text(
+            base_file.read_text(encoding="utf-8").replace(
+                ".portable-infobox", ".new-infobox"
+            ),
+            encoding="utf-8",
+        )
+        mtime = base_file.stat().st_mtime_ns + 1_000_000
+        os.utime(base_file, ns=(mtime, mtime))
+
+        reloaded = SelectorManager(config_dir=tmp_path).get_selectors("onepiece")
+
+        assert reloaded["selectors"]["character_page"]["infobox"].selector == (
+            ".new-infobox"
+        )
+
+
+class TestValidateSelectors:
+    """Tests for SelectorManager.validate_selectors."""
+
+    def test_default_config_is_valid(self, manager):
+        """Test that the shipped One Piece config has no errors."""
+        results = manager.validate_selectors("onepiece")
+
+        assert results["errors"] == []
+        assert results["info"]
+
+    def test_stops_at_first_fatal_error(self, manager, tmp_path):
+        """Test that default validation reports only the first fatal error."""
+        (tmp_path / "brokenwiki.yaml").write_text(
+            "selectors:\n  infobox_fields:\n    age:\n      selector: '.age'\n"
+            "      required: true\n",
+            encoding="utf-8",
+        )
+
+        results = manager.validate_selectors("brokenwiki")
+
+        assert results["errors"] == ["Missing required page type: character_list"]
+        assert results["warnings"] == []
+        assert results["info"] == []
+
+    def test_thorough_reports_everything(self, manager, tmp_path):
+        """Test that thorough validation collects all errors and warnings."""
+        (tmp_path / "brokenwiki.yaml").write_text(
+            "selectors:\n  infobox_fields:\n    age:\n      selector: '.age'\n"
+            "      required: true\n",
+            encoding="utf-8",
+        )
+
+        results = manager.validate_selectors("brokenwiki", thorough=True)
+
+        assert results["errors"] == [
+            "Missing required page type: character_list",
+            "Missing required page type: character_page",
+        ]
+        assert results["warnings"] == [
+            "Required field infobox_fields.age has no fallback selectors"
+        ]
+
+
+class TestValidateSelectorSyntax:
+    """Tests for SelectorManager._validate_selector_syntax."""
+
+    @pytest.mark.parametrize(
+        "selector,expected",
+        [
+            (".pi-data-value", True),
+            ("h2", True),
+            ("span", True),
+            ("img", True),
+            ("ul > li", False),
+            ("   ", False),
+            ("", False),
+        ],
+    )
+    def test_css_hints(self, manager, selector, expected):
+        """Test the CSS plausibility check."""
+        from utils.selectors import SelectorConfig
+
+        config = SelectorConfig(selector=selector)
+
+        assert manager._validate_selector_syntax(config) is expected
+
+    def test_xpath_prefix(self, manager):
+        """Test that XPath selectors must start with a path."""
+        from utils.selectors import SelectorConfig, SelectorType
+
+        valid = SelectorConfig(selector="//h1", selector_type=SelectorType.XPATH)
+        invalid = SelectorConfig(selector="h1", selector_type=SelectorType.XPATH)
+
+        assert manager._validate_selector_syntax(valid) is True
+        assert manager._validate_selector_syntax(invalid) is False
+
+
+class TestListConfigs:
+    """Tests for config discovery."""
+
+    def test_lists_yaml_and_json_configs(self, manager, tmp_path):
+        """Test that configs are listed by suffix, ignoring the cache directory."""
+        (tmp_path / "naruto.json").write_text("{}", encoding="utf-8")
+        manager.get_selectors("onepiece")
+
+        assert manager.list_available_configs() == ["generic_fandom", "onepiece"]
+        assert manager.get_available_configs() == ["naruto"]
+
+
+class TestModuleHelpers:
+    """Tests for the module-level convenience functions."""
+
+    def test_get_selector_is_memoized(self, manager, monkeypatch):
+        """Test that get_selector results are memoized until the cache is cleared."""
+        from utils import selectors
+
+        monkeypatch.setattr(selectors, "_selector_manager", manager)
+        selectors._clear_memoized_selectors()
+
+        first = selectors.get_selector("onepiece", "character_page", "name")
+
+        assert first is selectors.get_selector("onepiece", "character_page", "name")
+        assert selectors._memoized_selectors == {
+            ("onepiece", "character_page", "name"): first
+        }
+
+        manager.clear_cache()
+
+        assert selectors._memoized_selectors == {}
+
+    def test_failed_lookups_are_not_memoized(self, manager, monkeypatch):
+        """Test that a missing selector is looked up again on the next call."""
+        from utils import selectors
+
+        monkeypatch.setattr(selectors, "_selector_manager", manager)
+        selectors._clear_memoized_selectors()
+        lookup = manager.get_selector
+        calls = []
+
+        def flaky_lookup(*args):
+            calls.append(args)
+            return None if len(calls) == 1 else lookup(*args)
+
+        monkeypatch.setattr(manager, "get_selector", flaky_lookup)
+
+        assert selectors.get_selector("onepiece", "character_page", "name") is None
+        assert selectors._memoized_selectors == {}
+        assert selectors.get_selector("onepiece", "character_page", "name") is not None
+        assert selectors.get_compiled_selector("onepiece", "missing", "name") is None
+        assert selectors._memoized_compiled == {}
+
+    def test_get_compiled_selector(self, manager, monkeypatch):
+        """Test that compiled selectors are returned and memoized."""
+        from lxml import html
+
+        from utils import selectors
+
+        monkeypatch.setattr(selectors, "_selector_manager", manager)
+        selectors._clear_memoized_selectors()
+        tree = html.fromstring('<div><h1 class="page-header__title">Nami</h1></div>')
+
+        compiled = selectors.get_compiled_selector("onepiece", "character_page", "name")
+
+        assert [element.text for element in compiled(tree)] == ["Nami"]
+        assert selectors.get_compiled_selector("onepiece", "missing", "name") is None
+
+        manager.clear_cache()
+
+        assert selectors._memoized_compiled == {}
+
+    def test_get_selector_manager_is_singleton(self, monkeypatch):
+        """Test that the global manager is created once."""
+        from utils import selectors
+
+        monkeypatch.setattr(selectors, "_selector_manager", None)
+        monkeypatch.setattr(selectors, "SelectorManager", object)
+
+        assert selectors.get_selector_manager() is selectors.get_selector_manager()
+
+
+class TestCompileSelector:
+    """Tests for compile_selector and SelectorConfig.compiled."""
+
+    def test_compiled_css_matches_tree(self):
+        """Test that a compiled CSS selector can be applied to an lxml tree."""
+        from lxml import html
+
+        from utils.selectors import SelectorConfig
+
+        tree = html.fromstring(
+            '<div><h1 class="page-header__title x">Luffy</h1><a href="/wiki/Zoro">Z</a></div>'
+        )
+        config = SelectorConfig(
+            selector="h1.page-header__title::text", fallback_selectors=["a::attr(href)"]
+        )
+
+        assert config.compiled(tree) == ["Luffy"]
+        assert config.compiled_fallbacks[0](tree) == ["/wiki/Zoro"]
+
+    def test_compiled_selectors_are_shared(self):
+        """Test that identical expressions compile to the same object."""
+        from utils.selectors import SelectorConfig, SelectorType
+
+        first = SelectorConfig(selector="//h1", selector_type=SelectorType.XPATH)
+        second = SelectorConfig(selector="//h1", selector_type=SelectorType.XPATH)
+
+        assert first.compiled is second.compiled
+
+    def test_cssselect_fallback_without_parsel(self, monkeypatch):
+        """Test that plain CSS still compiles when parsel is unavailable."""
+        import sys
+
+        from lxml import html
+
+        from utils import selectors
+
+        monkeypatch.setitem(sys.modules, "parsel.csstranslator", None)
+        selectors._css_translator.cache_clear()
+        try:
+            translator = selectors._css_translator()
+        finally:
+            selectors._css_translator.cache_clear()
+
+        tree = html.fromstring('<div><p class="lead">Hi</p></div>')
+        xpath = translator.css_to_xpath("p.lead")
+
+        assert type(translator).__module__.startswith("cssselect")
+        assert [p.text for p in tree.xpath(xpath)] == ["Hi"]
+
+    def test_extract_uses_fallbacks(self):
+        """Test that extract strips text and falls back when nothing matches."""
+        from lxml import html
+
+        from utils.selectors import SelectorConfig
+
+        tree = html.fromstring(
+            "<div><span class='title'> Luffy <b>D.</b> </span>"
+            "<a href='/wiki/Luffy'>x</a><p> </p></div>"
+        )
+
+        assert SelectorConfig(selector=".title").extract(tree) == ["Luffy D."]
+        assert SelectorConfig(
+            selector="p::text", fallback_selectors=["h1", "a::attr(href)"]
+        ).extract(tree) == ["/wiki/Luffy"]
+        assert SelectorConfig(selector="h2").extract(tree) == []
+
+    def test_module_extract(self, manager, monkeypatch):
+        """Test the module-level extract helper."""
+        from lxml import html
+
+        from utils import selectors
+
+        monkeypatch.setattr(selectors, "_selector_manager", manager)
+        selectors._clear_memoized_selectors()
+        tree = html.fromstring("<div><h1 class='page-header__title'>Zoro</h1></div>")
+
+        assert selectors.extract(tree, "onepiece", "character_page", "name") == ["Zoro"]
+        assert selectors.extract(tree, "onepiece", "character_page", "nope") == []
+
+    def test_extract_from_etree_root(self, manager, monkeypatch):
+        """Test extraction from trees built by lxml.etree instead of lxml.html."""
+        from lxml import etree
+
+        from utils import selectors
+        from utils.selectors import SelectorConfig
+
+        monkeypatch.setattr(selectors, "_selector_manager", manager)
+        selectors._clear_memoized_selectors()
+        root = etree.HTML(
+            "<div><h1 class='page-header__title'>Monkey <b>D.</b> Luffy</h1>"
+            "<a href='/wiki/Nami'>Nami</a></div>"
+        )
+
+        assert selectors.extract(root, "onepiece", "character_page", "name") == [
+            "Monkey D. Luffy"
+        ]
+        assert SelectorConfig(selector="a", attribute="href").extract(root) == [
+            "/wiki/Nami"
+        ]
+
+    def test_extract_attribute_and_multiple(self, manager, monkeypatch):
+        """Test that configured attributes are returned instead of link text."""
+        from lxml import html
+
+        from utils import selectors
+        from utils.selectors import SelectorConfig
+
+        monkeypatch.setattr(selectors, "_selector_manager", manager)
+        selectors._clear_memoized_selectors()
+        tree = html.fromstring(
+            "<div class='category-page__members'>"
+            "<a href='/wiki/Monkey_D._Luffy'>Monkey D. Luffy</a>"
+            "<a href='/wiki/Category:Pirates'>Pirates</a>"
+            "<a href='/wiki/Roronoa_Zoro'>Roronoa Zoro</a></div>"
+        )
+
+        assert selectors.extract(
+            tree, "onepiece", "character_list", "character_links"
+        ) == ["/wiki/Monkey_D._Luffy", "/wiki/Roronoa_Zoro"]
+        assert SelectorConfig(selector="a", attribute="href").extract(tree) == [
+            "/wiki/Monkey_D._Luffy"
+        ]
+
+    def test_invalid_and_regex_selectors_compile_to_none(self):
+        """Test that uncompilable selectors yield None."""
+        from utils.selectors import SelectorType, compile_selector
+
+        assert compile_selector("//h1[", SelectorType.XPATH) is None
+        assert compile_selector(r"\d+", SelectorType.REGEX) is None
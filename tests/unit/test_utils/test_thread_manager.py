@@ -0,0 +1,297 @@
+# tests/unit/test_utils/test_thread_manager.py
+"""
+Unit tests for thread management utilities.
+
+Tests parallel execution, retries and per-thread compiled selectors.
+"""
+
+import threading
+import time
+
+import pytest
+
+
+@pytest.fixture
+def manager():
+    """Create a ThreadManager without retry delays."""
+    from utils.thread_manager import ThreadManager
+
+    return ThreadManager({"max_workers": 2, "retry_delay": 0.0, "retry_jitter": 0.0})
+
+
+class TestExecuteParallel:
+    """Tests for ThreadManager.execute_parallel."""
+
+    def test_results_and_errors_are_returned(self, manager):
+        """Test that collected outcomes survive the post-run cleanup."""
+
+        def worker(task):
+            if task["id"] == 3:
+                raise ValueError("broken")
+            return task["id"] * 2
+
+        result = manager.execute_parallel([{"id": i} for i in range(5)], worker)
+
+        assert result["successful_tasks"] == 4
+        assert sorted(r.result for r in result["results"]) == [0, 2, 4, 8]
+        assert [e.task_index for e in result["errors"]] == [3]
+        assert len(manager.results) == 0
+
+    def test_progress_callback(self, manager):
+        """Test that progress is reported once per task."""
+        calls = []
+        manager.config["progress_callback"] = lambda *args: calls.append(args)
+
+        manager.execute_parallel([{"id": i} for i in range(3)], lambda task: task)
+
+        assert [completed for _, completed, _ in calls] == [1, 2, 3]
+        assert calls[-1] == (100.0, 3, 3)
+
+    def test_outcomes_are_task_results(self, manager):
+        """Test the fields of successful and failed outcomes."""
+        from utils.thread_manager import TaskResult
+
+        def worker(task):
+            if task["id"]:
+                raise ValueError("broken")
+            return "ok"
+
+        result = manager.execute_parallel([{"id": 0}, {"id": 1}], worker)
+
+        assert result["results"] == [TaskResult(0, {"id": 0}, True, "ok")]
+        assert result["errors"] == [TaskResult(1, {"id": 1}, False, error="broken")]
+
+
+class TestRetries:
+    """Tests for retry handling."""
+
+    def test_only_retriable_exceptions_are_retried(self, manager):
+        """Test that transient errors retry and other errors fail at once."""
+        from utils.thread_manager import PermanentError
+
+        attempts = {}
+
+        def worker(task):
+            attempts[task["id"]] = attempts.get(task["id"], 0) + 1
+            raise task["error"]
+
+        result = manager.execute_parallel(
+            [
+                {"id": 0, "error": ConnectionError("reset")},
+                {"id": 1, "error": KeyError("missing")},
+                {"id": 2, "error": PermanentError("HTTP 404")},
+            ],
+            worker,
+        )
+
+        assert result["failed_tasks"] == 3
+        assert attempts == {0: 3, 1: 1, 2: 1}
+
+    def test_http_errors_are_classified_by_status(self, manager):
+        """Test that only 5xx and 429 responses are retried."""
+        import requests
+
+        def http_error(status):
+            response = requests.Response()
+            response.status_code = status
+            return requests.HTTPError(f"HTTP {status}", response=response)
+
+        attempts = {}
+
+        def worker(task):
+            attempts[task["id"]] = attempts.get(task["id"], 0) + 1
+            raise task["error"]
+
+        manager.execute_parallel(
+            [
+                {"id": 0, "error": http_error(404)},
+                {"id": 1, "error": http_error(503)},
+                {"id": 2, "error": http_error(429)},
+                {"id": 3, "error": requests.ConnectionError("reset")},
+                {"id": 4, "error": FileNotFoundError("missing.html")},
+            ],
+            worker,
+        )
+
+        assert attempts == {0: 1, 1: 3, 2: 3, 3: 3, 4: 1}
+
+    def test_custom_retriable_exceptions(self):
+        """Test that the retried exception types are configurable."""
+        from utils.thread_manager import ThreadManager
+
+        manager = ThreadManager(
+            {
+                "retry_delay": 0.0,
+                "retry_jitter": 0.0,
+                "retriable_exceptions": (KeyError,),
+            }
+        )
+        calls = []
+
+        def worker(task):
+            calls.append(task)
+            if len(calls) < 2:
+                raise KeyError("once")
+            return "ok"
+
+        result = manager.execute_parallel([{"id": 0}], worker)
+
+        assert result["results"][0].result == "ok"
+        assert len(calls) == 2
+
+    def test_backoff_does_not_hold_worker_thread(self):
+        """Test that other tasks run while a failed task waits to retry."""
+        from utils.thread_manager import ThreadManager
+
+        manager = ThreadManager(
+            {"max_workers": 1, "retry_delay": 0.1, "retry_jitter": 0.0}
+        )
+        calls = []
+
+        def worker(task):
+            calls.append(task["id"])
+            if task["id"] == 0 and calls.count(0) == 1:
+                raise ConnectionError("reset")
+            return task["id"]
+
+        result = manager.execute_parallel([{"id": 0}, {"id": 1}], worker)
+
+        assert result["successful_tasks"] == 2
+        assert calls == [0, 1, 0]
+
+    def test_timeout_fails_the_run(self):
+        """Test that tasks running past the timeout abort execution."""
+        from utils.thread_manager import ThreadManager
+
+        manager = ThreadManager({"max_workers": 1, "timeout": 0.05})
+
+        result = manager.execute_parallel([{"id": 0}], lambda task: time.sleep(0.2))
+
+        assert result["success"] is False
+        assert "unfinished" in result["error"]
+
+
+class TestIterResults:
+    """Tests for ThreadManager.iter_results."""
+
+    def test_yields_every_outcome(self, manager):
+        """Test that each task yields exactly one outcome."""
+        outcomes = list(
+            manager.iter_results([{"id": i} for i in range(6)], lambda t: t["id"])
+        )
+
+        assert sorted(o.task_index for o in outcomes) == list(range(6))
+        assert all(o.success and o.result == o.task_index for o in outcomes)
+        assert manager.active_futures == set()
+
+    def test_early_stop_cancels_pending_tasks(self):
+        """Test that closing the iterator cancels tasks not yet started."""
+        from utils.thread_manager import ThreadManager
+
+        manager = ThreadManager({"max_workers": 1})
+        started = []
+
+        def worker(task):
+            started.append(task["id"])
+            time.sleep(0.01)
+            return task["id"]
+
+        iterator = manager.iter_results([{"id": i} for i in range(50)], worker)
+        next(iterator)
+        iterator.close()
+
+        assert len(started) < 50
+
+
+class TestRetryDelay:
+    """Tests for ThreadManager._retry_delay."""
+
+    def test_exponential_backoff_is_capped(self):
+        """Test that delays double per attempt up to the cap."""
+        from utils.thread_manager import ThreadManager
+
+        manager = ThreadManager(
+            {"retry_delay": 1.0, "retry_max_delay": 5.0, "retry_jitter": 0.0}
+        )
+
+        assert [manager._retry_delay(a) for a in range(5)] == [1, 2, 4, 5, 5]
+
+    def test_jitter_is_bounded(self):
+        """Test that jitter adds at most retry_jitter seconds."""
+        from utils.thread_manager import ThreadManager
+
+        manager = ThreadManager({"retry_delay": 1.0, "retry_jitter": 0.5})
+
+        delays = [manager._retry_delay(0) for _ in range(50)]
+
+        assert all(1.0 <= delay <= 1.5 for delay in delays)
+
+
+class TestMaxWorkers:
+    """Tests for thread pool sizing."""
+
+    def test_derived_from_cpu_count(self, monkeypatch):
+        """Test that pool size follows the CPU count and workload type."""
+        from utils import thread_manager
+
+        monkeypatch.setattr(thread_manager.os, "cpu_count", lambda: 4)
+
+        assert thread_manager.default_max_workers() == 20
+        assert thread_manager.default_max_workers(io_bound=False) == 4
+        assert thread_manager.ThreadManager()._max_workers() == 20
+        assert thread_manager.ThreadManager({"io_bound": False})._max_workers() == 4
+
+    def test_explicit_max_workers_wins(self):
+        """Test that a configured pool size is used as-is."""
+        from utils.thread_manager import ThreadManager
+
+        assert ThreadManager({"max_workers": 3})._max_workers() == 3
+
+
+class TestGetCompiled:
+    """Tests for ThreadManager.get_compiled."""
+
+    def test_compiled_per_thread(self, manager):
+        """Test that each thread gets and reuses its own compiled XPath."""
+        from lxml import html
+
+        tree = html.fromstring('<div><p class="lead">Hi</p></div>')
+        first = manager.get_compiled("p.lead::text")
+        other = []
+
+        thread = threading.Thread(
+            target=lambda: other.append(manager.get_compiled("p.lead::text"))
+        )
+        thread.start()
+        thread.join()
+
+        assert manager.get_compiled("p.lead::text") is first
+        assert other[0] is not first
+        assert first(tree) == other[0](tree) == ["Hi"]
+
+    def test_invalid_selector(self, manager):
+        """Test that invalid selectors yield None."""
+        assert manager.get_compiled("//p[", "xpath") is None
+
+
+class TestExecuteParallelAsync:
+    """Tests for coroutine workers."""
+
+    def test_coroutine_workers_run_on_event_loop(self, manager):
+        """Test that coroutine workers are dispatched to the async path."""
+        attempts = {}
+
+        async def worker(task, session):
+            attempts[task["id"]] = attempts.get(task["id"], 0) + 1
+            if task["id"] == 1 and attempts[1] == 1:
+                raise ConnectionError("flaky")
+            if task["id"] == 2:
+                raise ValueError("broken")
+            return task["id"] * 10
+
+        result = manager.execute_parallel([{"id": i} for i in range(3)], worker)
+
+        assert result["success"] is True
+        assert sorted(r.result for r in result["results"]) == [0, 10]
+        assert [e.task_index for e in result["errors"]] == [2]
+        assert attempts == {0: 1, 1: 2, 2: 1}
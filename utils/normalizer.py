@@ -8,14 +8,298 @@ for text processing, URL handling, and data quality improvement.
 
 import re
 import logging
+import functools
+import time
 import unicodedata
-from typing import Dict, Any, List, Optional, Union
-from urllib.parse import urljoin, urlparse
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple, Union
+from urllib.parse import urljoin
 import html
-from datetime import datetime
+from datetime import datetime, timezone
+
+try:
+    import re2  # google-re2, optional linear-time regex engine
+except ImportError:
+    re2 = None
+
+try:
+    import ahocorasick  # pyahocorasick, optional multi-pattern matcher
+except ImportError:
+    ahocorasick = None
+
+if TYPE_CHECKING:
+    import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Text cleaning patterns, compiled once and shared by all normalizers
+_EXTRA_WHITESPACE_RE = re.compile(r"\s+")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_BRACKETS_RE = re.compile(r"\[.*?\]|\(.*?\)")
+_SPECIAL_CHARS_RE = re.compile(r"[^\w\s\-.,!?]")
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+_CITATION_RE = re.compile(r"\[[\d\w\s,]+\]")
+_EMPTY_PARENTHESES_RE = re.compile(r"\(\s*\)")
+_EMPTY_BRACKETS_RE = re.compile(r"\[\s*\]")
+_WIKI_MARKUP_RE = re.compile(r"\{\{[^}]*\}\}")
+_MARKUP_PATTERNS = (_HTML_TAG_RE, _WIKI_MARKUP_RE)
+
+# RE2 variants of the markup patterns, used only on request. Only patterns
+# without \s/\w/\d classes are compiled with RE2, since those classes are
+# ASCII-only there and would change the output. The google-re2 binding runs
+# sub() in Python, so it is much slower than the stdlib on typical inputs and
+# only worth it when linear-time matching on untrusted input is required.
+if re2 is not None:
+    _RE2_MARKUP_PATTERNS = (
+        re2.compile(_HTML_TAG_RE.pattern),
+        re2.compile(_WIKI_MARKUP_RE.pattern),
+    )
+else:
+    _RE2_MARKUP_PATTERNS = None
+
+# Typographic quotes mapped to their ASCII equivalents
+_QUOTE_TABLE = str.maketrans(
+    {"\u201c": '"', "\u201d": '"', "`": '"', "\u2018": "'", "\u2019": "'"}
+)
+
+# URL patterns
+_RELATIVE_URL_RE = re.compile(r"^/")
+_QUERY_PARAM_RE = re.compile(r"\?.*$")
+_IMAGE_EXTENSION_RE = re.compile(r"\.(?:jpe?g|png|gif|webp)(?=/|$)", re.IGNORECASE)
+
+# Character name patterns
+_TITLE_SUFFIX_RE = re.compile(r"\s*\([^)]*\)$")
+_DISAMBIGUATION_RE = re.compile(r"\s*\(.*character.*\)$", re.IGNORECASE)
+_IMPORTANT_DESCRIPTORS_RE = re.compile(
+    r"\b(?:captain|admiral|commander|lieutenant|sergeant|doctor|professor"
+    r"|king|queen|prince|princess|jr|sr|the great|the terrible)\b",
+    re.IGNORECASE,
+)
+
+# Leading phrases stripped from descriptions
+_DESCRIPTION_PREFIX_RE = re.compile(r"(?:is|was) (?:an?|the) ", re.IGNORECASE)
+_CHARACTER_PREFIX_RE = re.compile(
+    r"is a character|is a fictional character|character from|appears in",
+    re.IGNORECASE,
+)
+
+# Age patterns
+_AGE_NUMBER_RE = re.compile(r"(\d+)")
+_AGE_RANGE_RE = re.compile(r"(\d+)\s*[-–—]\s*(\d+)")
+_AGE_SUFFIX_RE = re.compile(r"\s*(years?\s*old|yrs?\.?|y\.?o\.?)\s*$")
+_AGE_VALUE_RE = re.compile(r"(\d+(?:\s*-\s*\d+)?)")
+_AGE_UNKNOWN_RE = re.compile(r"unknown|n/a|none|\?")
+_AGE_CHILD_RE = re.compile(r"child|kid|young")
+_AGE_ADULT_RE = re.compile(r"adult|grown")
+
+# Height pattern
+_HEIGHT_RE = re.compile(r"(\d+(?:\.\d+)?)\s*(cm|m|ft|in|feet|inches)", re.IGNORECASE)
+
+# Canonical gender and status labels. Built once so every normalized record
+# shares the same label objects instead of rebuilding the maps per call.
+_GENDER_MAP = {
+    "male": "male",
+    "man": "male",
+    "boy": "male",
+    "m": "male",
+    "female": "female",
+    "woman": "female",
+    "girl": "female",
+    "f": "female",
+    "unknown": None,
+    "n/a": None,
+    "none": None,
+    "?": None,
+}
+_STATUS_MAP = {
+    "alive": "alive",
+    "living": "alive",
+    "active": "alive",
+    "dead": "deceased",
+    "deceased": "deceased",
+    "killed": "deceased",
+    "died": "deceased",
+    "unknown": "unknown",
+    "n/a": "unknown",
+    "none": "unknown",
+    "?": "unknown",
+    "missing": "missing",
+    "disappeared": "missing",
+}
+
+# Relationship type labels
+_RELATIONSHIP_MAP = {
+    "father": "Father",
+    "mother": "Mother",
+    "parent": "Parent",
+    "son": "Son",
+    "daughter": "Daughter",
+    "child": "Child",
+    "brother": "Brother",
+    "sister": "Sister",
+    "sibling": "Sibling",
+    "husband": "Husband",
+    "wife": "Wife",
+    "spouse": "Spouse",
+    "crew": "Crew",
+    "captain": "Captain",
+    "mentor": "Mentor",
+    "student": "Student",
+    "friend": "Friend",
+    "rival": "Rival",
+    "enemy": "Enemy",
+}
+
+# Gender keywords for descriptive values such as "Male (formerly female)"
+_GENDER_KEYWORD_RE = re.compile(
+    r"\b(?:(?P<female>female|woman|girl|feminine)|(?P<male>male|man|boy|masculine)"
+    r"|(?P<non_binary>non[- ]?binary)|(?P<agender>agender)"
+    r"|(?P<genderless>genderless)|(?P<varies>varies)|(?P<unknown>unknown))\b"
+)
+_GENDER_KEYWORD_LABELS = {
+    "female": "female",
+    "male": "male",
+    "non_binary": "non-binary",
+    "agender": "agender",
+    "genderless": "genderless",
+    "varies": "varies",
+    "unknown": None,
+}
+
+# Bounty patterns (for One Piece)
+_BOUNTY_RE = re.compile(r"[^\d,.]")
+_BOUNTY_NUMBER_RE = re.compile(r"\d[\d,]*")
+_BOUNTY_PREFIX_RE = re.compile(r"^(bounty:?\s*|reward:?\s*)", re.IGNORECASE)
+_BOUNTY_CURRENCY_RE = re.compile(r"[฿$,]")
+_BOUNTY_VALUE_RE = re.compile(r"(\d+(?:\.\d+)?)")
+
+# Quality scoring weights shared by the single-record and batch scorers
+REQUIRED_QUALITY_FIELDS = {"name": 0.3, "anime": 0.2}
+OPTIONAL_QUALITY_FIELDS = {
+    "description": 0.2,
+    "age": 0.1,
+    "gender": 0.05,
+    "occupation": 0.05,
+    "abilities": 0.05,
+    "relationships": 0.05,
+}
+LIST_QUALITY_FIELDS = frozenset({"abilities", "relationships"})
+
+# (field, weight, is_list, is_description) in scoring order
+_QUALITY_FIELD_SPECS = tuple(
+    (field, weight, field in LIST_QUALITY_FIELDS, field == "description")
+    for field, weight in {**REQUIRED_QUALITY_FIELDS, **OPTIONAL_QUALITY_FIELDS}.items()
+)
+_QUALITY_MAX_SCORE = sum(weight for _, weight, _, _ in _QUALITY_FIELD_SPECS)
+
+
+def format_berry(amount: int) -> str:
+    """
+    Format a bounty amount as a short Berry string.
+
+    Args:
+        amount: Bounty amount in Berry
+
+    Returns:
+        Formatted bounty string (e.g. "1.5B Berry", "300M Berry")
+
+    Note:
+        Amounts are truncated rather than rounded, so 999,999,999 formats
+        as "999M Berry" instead of "1000M Berry".
+    """
+    if amount >= 1000000000:  # Billion
+        whole, tenth = divmod(amount // 100000000, 10)
+        return f"{whole}.{tenth}B Berry"
+    if amount >= 1000000:  # Million
+        return f"{amount // 1000000}M Berry"
+    if amount >= 1000:  # Thousand
+        return f"{amount // 1000}K Berry"
+    return f"{amount:,} Berry"
+
+
+def _clean_text(
+    text: str,
+    remove_citations: bool = True,
+    normalize_whitespace: bool = True,
+    markup_patterns: tuple = _MARKUP_PATTERNS,
+) -> str:
+    """
+    Clean and normalize text content.
+
+    Args:
+        text: Input text to clean
+        remove_citations: Whether to remove citation markers
+        normalize_whitespace: Whether to normalize whitespace
+        markup_patterns: Compiled (html_tag, wiki_markup) pattern pair
+
+    Returns:
+        Cleaned text string
+    """
+    if not text or not isinstance(text, str):
+        return ""
+
+    html_tag_re, wiki_markup_re = markup_patterns
+
+    # Decode HTML entities
+    cleaned = html.unescape(text)
+
+    # Each pass must see the result of the previous one ("[<sup>1</sup>]"
+    # -> "[1]", "(<br>)" -> "()"), so they are not fused into one regex.
+    # Passes whose opening character is absent are skipped instead.
+
+    # Remove HTML tags
+    if "<" in cleaned:
+        cleaned = html_tag_re.sub("", cleaned)
+
+    # Remove wiki markup
+    if "{{" in cleaned:
+        cleaned = wiki_markup_re.sub("", cleaned)
+
+    has_brackets = "[" in cleaned
+
+    # Remove citations if requested
+    if remove_citations and has_brackets:
+        cleaned = _CITATION_RE.sub("", cleaned)
+
+    # Remove empty parentheses and brackets
+    if "(" in cleaned:
+        cleaned = _EMPTY_PARENTHESES_RE.sub("", cleaned)
+    if has_brackets:
+        cleaned = _EMPTY_BRACKETS_RE.sub("", cleaned)
+
+    # Normalize unicode characters; ASCII and already-normalized text
+    # (checked with the Unicode quick-check) are left as-is
+    if not cleaned.isascii() and not unicodedata.is_normalized("NFKC", cleaned):
+        cleaned = unicodedata.normalize("NFKC", cleaned)
+
+    # Normalize whitespace if requested
+    if normalize_whitespace:
+        cleaned = _EXTRA_WHITESPACE_RE.sub(" ", cleaned)
+
+    return cleaned.strip()
+
+
+@functools.lru_cache(maxsize=4096)
+def _clean_character_name(name: str) -> str:
+    """Clean a character name; cached since names repeat across pages."""
+    # Basic text cleaning
+    cleaned = _clean_text(name)
+
+    # Remove disambiguation suffixes
+    cleaned = _DISAMBIGUATION_RE.sub("", cleaned)
+
+    # Remove common title suffixes but keep meaningful ones
+    if cleaned.endswith(")"):
+        head, sep, suffix = cleaned.rpartition("(")
+        # Keep important descriptors like "Captain", "Admiral", etc.
+        if (
+            sep
+            and ")" not in suffix[:-1]
+            and not _IMPORTANT_DESCRIPTORS_RE.search(suffix)
+        ):
+            cleaned = head
+
+    return cleaned.strip()
+
 
 class DataNormalizer:
     """
@@ -33,20 +317,19 @@ class DataNormalizer:
 
     def __init__(self):
         """Initialize the data normalizer with common patterns."""
-        # Common patterns for text cleaning
+        # Common patterns for text cleaning (compiled once at module level)
         self.text_patterns = {
-            "extra_whitespace": re.compile(r"\s+"),
-            "html_tags": re.compile(r"<[^>]+>"),
-            "brackets": re.compile(r"\[.*?\]|\(.*?\)"),
-            "quotes": re.compile(r'[""' "`]"),
-            "special_chars": re.compile(r"[^\w\s\-.,!?]"),
+            "extra_whitespace": _EXTRA_WHITESPACE_RE,
+            "html_tags": _HTML_TAG_RE,
+            "brackets": _BRACKETS_RE,
+            "special_chars": _SPECIAL_CHARS_RE,
         }
-        self.citation_pattern = re.compile(r"\[[\d\w\s,]+\]")
-        self.extra_whitespace_pattern = re.compile(r"\s+")
-        self.parentheses_pattern = re.compile(r"\(\s*\)")
-        self.brackets_pattern = re.compile(r"\[\s*\]")
-        self.wiki_markup_pattern = re.compile(r"\{\{[^}]*\}\}")
-        self.html_tag_pattern = re.compile(r"<[^>]+>")
+        self.citation_pattern = _CITATION_RE
+        self.extra_whitespace_pattern = _EXTRA_WHITESPACE_RE
+        self.parentheses_pattern = _EMPTY_PARENTHESES_RE
+        self.brackets_pattern = _EMPTY_BRACKETS_RE
+        self.wiki_markup_pattern = _WIKI_MARKUP_RE
+        self.html_tag_pattern = _HTML_TAG_RE
 
         # Field name mappings for standardization
         self.field_mappings = {
@@ -88,69 +371,72 @@ class DataNormalizer:
             "birth date": "birthday",
         }
 
+        # (monotonic time, ISO timestamp) reused for extraction dates in a batch
+        self._extraction_timestamp: Tuple[float, str] = (float("-inf"), "")
+
+        # Field names repeat across every infobox, so memoize their normalized
+        # form. Call reload_field_mappings() after editing field_mappings.
+        self._field_name_cache = functools.lru_cache(maxsize=4096)(
+            self._normalize_field_name
+        )
+        self.reload_field_mappings()
+
         # URL patterns
-        self.relative_url_pattern = re.compile(r"^/")
-        self.query_param_pattern = re.compile(r"\?.*$")
+        self.relative_url_pattern = _RELATIVE_URL_RE
+        self.query_param_pattern = _QUERY_PARAM_RE
 
         # Character name patterns
-        self.title_suffix_pattern = re.compile(r"\s*\([^)]*\)$")
-        self.disambiguation_pattern = re.compile(
-            r"\s*\(.*character.*\)$", re.IGNORECASE
-        )
+        self.title_suffix_pattern = _TITLE_SUFFIX_RE
+        self.disambiguation_pattern = _DISAMBIGUATION_RE
 
         # Age patterns
-        self.age_number_pattern = re.compile(r"(\d+)")
-        self.age_range_pattern = re.compile(r"(\d+)\s*[-–—]\s*(\d+)")
+        self.age_number_pattern = _AGE_NUMBER_RE
+        self.age_range_pattern = _AGE_RANGE_RE
 
         # Bounty patterns (for One Piece)
-        self.bounty_pattern = re.compile(r"[^\d,.]")
-        self.bounty_number_pattern = re.compile(r"[\d,]+")
+        self.bounty_pattern = _BOUNTY_RE
+        self.bounty_number_pattern = _BOUNTY_NUMBER_RE
 
-    def clean_text(
+    # Stateless; exposed as a static method so internal callers can use the
+    # module-level function directly without a bound-method lookup.
+    clean_text = staticmethod(_clean_text)
+
+    def clean_text_batch(
         self,
-        text: str,
+        texts: List[str],
         remove_citations: bool = True,
         normalize_whitespace: bool = True,
-    ) -> str:
+        use_re2: bool = False,
+    ) -> List[str]:
         """
-        Clean and normalize text content.
+        Clean and normalize many text values at once.
+
+        Produces the same output as clean_text. With use_re2, markup stripping
+        runs on google-re2's linear-time engine, which bounds matching time on
+        untrusted input but is slower than the stdlib on typical wiki text.
 
         Args:
-            text: Input text to clean
+            texts: Input texts to clean
             remove_citations: Whether to remove citation markers
             normalize_whitespace: Whether to normalize whitespace
+            use_re2: Whether to strip markup with google-re2
 
         Returns:
-            Cleaned text string
-        """
-        if not text or not isinstance(text, str):
-            return ""
+            List of cleaned text strings
 
-        # Decode HTML entities
-        cleaned = html.unescape(text)
-
-        # Remove HTML tags
-        cleaned = self.html_tag_pattern.sub("", cleaned)
-
-        # Remove wiki markup
-        cleaned = self.wiki_markup_pattern.sub("", cleaned)
-
-        # Remove citations if requested
-        if remove_citations:
-            cleaned = self.citation_pattern.sub("", cleaned)
-
-        # Remove empty parentheses and brackets
-        cleaned = self.parentheses_pattern.sub("", cleaned)
-        cleaned = self.brackets_pattern.sub("", cleaned)
-
-        # Normalize unicode characters
-        cleaned = unicodedata.normalize("NFKC", cleaned)
-
-        # Normalize whitespace if requested
-        if normalize_whitespace:
-            cleaned = self.extra_whitespace_pattern.sub(" ", cleaned)
-
-        return cleaned.strip()
+        Raises:
+            ImportError: If use_re2 is set and google-re2 is not installed
+        """
+        markup_patterns = _MARKUP_PATTERNS
+        if use_re2:
+            if _RE2_MARKUP_PATTERNS is None:
+                raise ImportError("google-re2 is required for use_re2=True")
+            markup_patterns = _RE2_MARKUP_PATTERNS
+
+        return [
+            _clean_text(text, remove_citations, normalize_whitespace, markup_patterns)
+            for text in texts
+        ]
 
     def clean_character_name(self, name: str) -> str:
         """
@@ -162,81 +448,10 @@ class DataNormalizer:
         Returns:
             Cleaned character name
         """
-        if not name:
+        if not name or not isinstance(name, str):
             return ""
 
-        # Basic text cleaning
-        cleaned = self.clean_text(name)
-
-        # Remove disambiguation suffixes
-        cleaned = self.disambiguation_pattern.sub("", cleaned)
-
-        # Remove common title suffixes but keep meaningful ones
-        if cleaned.endswith(")"):
-            # Keep important descriptors like "Captain", "Admiral", etc.
-            important_descriptors = [
-                "captain",
-                "admiral",
-                "commander",
-                "lieutenant",
-                "sergeant",
-                "doctor",
-                "professor",
-                "king",
-                "queen",
-                "prince",
-                "princess",
-                "jr",
-                "sr",
-                "the great",
-                "the terrible",
-            ]
-
-            suffix_match = self.title_suffix_pattern.search(cleaned)
-            if suffix_match:
-                suffix = suffix_match.group(0).lower()
-                if not any(desc in suffix for desc in important_descriptors):
-                    cleaned = self.title_suffix_pattern.sub("", cleaned)
-
-        return cleaned.strip()
-
-        """
-        Normalize gender information.
-
-        Args:
-            gender: Gender string to normalize
-
-        Returns:
-            Normalized gender string
-        """
-        if not gender:
-            return "Unknown"
-
-        cleaned = self.clean_text(gender).lower()
-
-        # Gender mappings
-        gender_mappings = {
-            "male": "Male",
-            "man": "Male",
-            "boy": "Male",
-            "masculine": "Male",
-            "female": "Female",
-            "woman": "Female",
-            "girl": "Female",
-            "feminine": "Female",
-            "non-binary": "Non-binary",
-            "nonbinary": "Non-binary",
-            "agender": "Agender",
-            "genderless": "Genderless",
-            "unknown": "Unknown",
-            "varies": "Varies",
-        }
-
-        for key, value in gender_mappings.items():
-            if key in cleaned:
-                return value
-
-        return "Unknown"
+        return _clean_character_name(name)
 
     def clean_description(self, description: str, max_length: int = 5000) -> str:
         """
@@ -253,31 +468,22 @@ class DataNormalizer:
             return ""
 
         # Basic cleaning
-        cleaned = self.clean_text(description)
+        cleaned = _clean_text(description)
 
         # Remove common wiki prefixes
-        prefixes_to_remove = ["is a", "was a", "is an", "was an", "is the", "was the"]
-
-        for prefix in prefixes_to_remove:
-            if cleaned.lower().startswith(prefix + " "):
-                cleaned = cleaned[len(prefix) :].strip()
-                # Capitalize first letter
-                if cleaned:
-                    cleaned = cleaned[0].upper() + cleaned[1:]
+        prefix_match = _DESCRIPTION_PREFIX_RE.match(cleaned)
+        if prefix_match:
+            cleaned = cleaned[prefix_match.end() :].strip()
+            # Capitalize first letter
+            if cleaned:
+                cleaned = cleaned[0].upper() + cleaned[1:]
 
         # Truncate if too long
         if len(cleaned) > max_length:
-            # Try to cut at sentence boundary
-            sentences = cleaned.split(". ")
-            truncated = ""
-            for sentence in sentences:
-                if len(truncated + sentence + ". ") <= max_length:
-                    truncated += sentence + ". "
-                else:
-                    break
-
-            if truncated:
-                cleaned = truncated.rstrip()
+            # Try to cut at the last sentence boundary that fits
+            cut = cleaned.rfind(". ", 0, max_length)
+            if cut != -1:
+                cleaned = cleaned[: cut + 1]
             else:
                 # Hard truncate with ellipsis
                 cleaned = cleaned[: max_length - 3] + "..."
@@ -302,21 +508,23 @@ class DataNormalizer:
         cleaned_url = url.strip()
 
         # Handle relative URLs
-        if self.relative_url_pattern.match(cleaned_url) and base_url:
+        if base_url and cleaned_url.startswith("/"):
             cleaned_url = urljoin(base_url, cleaned_url)
 
-        # Remove query parameters for image URLs (common in Fandom)
-        if any(
-            ext in cleaned_url.lower()
-            for ext in [".jpg", ".jpeg", ".png", ".gif", ".webp"]
-        ):
+        # Remove query parameters for image URLs (common in Fandom).
+        # Only the path is checked, and the extension may end any segment
+        # since Fandom image paths continue after it
+        # (".../File.png/revision/latest?cb=...").
+        base = cleaned_url.partition("#")[0].partition("?")[0]
+        scheme_end = base.find("://")
+        path_start = base.find("/", scheme_end + 3) if scheme_end != -1 else 0
+        if path_start != -1 and _IMAGE_EXTENSION_RE.search(base, path_start):
             # Keep only the path part for images
-            parsed = urlparse(cleaned_url)
-            cleaned_url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+            cleaned_url = base
 
         # Ensure HTTPS for security
         if cleaned_url.startswith("http://"):
-            cleaned_url = cleaned_url.replace("http://", "https://", 1)
+            cleaned_url = "https://" + cleaned_url[7:]
 
         return cleaned_url
 
@@ -333,26 +541,25 @@ class DataNormalizer:
         if not abilities:
             return []
 
-        cleaned_abilities = []
-        seen_abilities = set()
+        # Keyed by lower-cased text so the first spelling of each ability wins
+        cleaned_abilities: Dict[str, str] = {}
 
         for ability in abilities:
             if not ability or not isinstance(ability, str):
                 continue
 
             # Clean the ability text
-            cleaned = self.clean_text(ability)
+            cleaned = _clean_text(ability)
+            key = cleaned.lower()
 
             # Skip very short or generic abilities
-            if len(cleaned) < 3 or cleaned.lower() in ["n/a", "none", "unknown"]:
+            if len(cleaned) < 3 or key in ("n/a", "none", "unknown"):
                 continue
 
             # Remove duplicates (case-insensitive)
-            if cleaned.lower() not in seen_abilities:
-                cleaned_abilities.append(cleaned)
-                seen_abilities.add(cleaned.lower())
+            cleaned_abilities.setdefault(key, cleaned)
 
-        return cleaned_abilities
+        return list(cleaned_abilities.values())
 
     def parse_bounty(self, bounty_text: str) -> Dict[str, Any]:
         """
@@ -367,7 +574,7 @@ class DataNormalizer:
         if not bounty_text:
             return {"amount": 0, "currency": "Berry", "formatted": "Unknown"}
 
-        cleaned = self.clean_text(bounty_text)
+        cleaned = _clean_text(bounty_text)
 
         # Handle special cases
         if any(word in cleaned.lower() for word in ["unknown", "none", "n/a"]):
@@ -376,33 +583,19 @@ class DataNormalizer:
         if "former" in cleaned.lower() or "deceased" in cleaned.lower():
             return {"amount": 0, "currency": "Berry", "formatted": "Former bounty"}
 
-        # Extract numbers
-        numbers = self.bounty_number_pattern.findall(cleaned)
-        if numbers:
-            # Take the largest number found
-            amounts = [
-                int(num.replace(",", ""))
-                for num in numbers
-                if num.replace(",", "").isdigit()
-            ]
-            if amounts:
-                max_amount = max(amounts)
-
-                # Format the bounty nicely
-                if max_amount >= 1000000000:  # Billion
-                    formatted = f"{max_amount/1000000000:.1f}B Berry"
-                elif max_amount >= 1000000:  # Million
-                    formatted = f"{max_amount/1000000:.0f}M Berry"
-                elif max_amount >= 1000:  # Thousand
-                    formatted = f"{max_amount/1000:.0f}K Berry"
-                else:
-                    formatted = f"{max_amount:,} Berry"
+        # Extract numbers, keeping the largest one found in a single pass
+        max_amount = None
+        for token in _BOUNTY_NUMBER_RE.findall(cleaned):
+            amount = int(token.replace(",", ""))
+            if max_amount is None or amount > max_amount:
+                max_amount = amount
 
-                return {
-                    "amount": max_amount,
-                    "currency": "Berry",
-                    "formatted": formatted,
-                }
+        if max_amount is not None:
+            return {
+                "amount": max_amount,
+                "currency": "Berry",
+                "formatted": format_berry(max_amount),
+            }
 
         return {"amount": 0, "currency": "Berry", "formatted": cleaned}
 
@@ -421,36 +614,13 @@ class DataNormalizer:
 
         normalized = {}
 
-        # Relationship type mappings
-        relationship_mappings = {
-            "father": "Father",
-            "mother": "Mother",
-            "parent": "Parent",
-            "son": "Son",
-            "daughter": "Daughter",
-            "child": "Child",
-            "brother": "Brother",
-            "sister": "Sister",
-            "sibling": "Sibling",
-            "husband": "Husband",
-            "wife": "Wife",
-            "spouse": "Spouse",
-            "crew": "Crew",
-            "captain": "Captain",
-            "mentor": "Mentor",
-            "student": "Student",
-            "friend": "Friend",
-            "rival": "Rival",
-            "enemy": "Enemy",
-        }
-
         for rel_type, rel_name in relationships.items():
             if not rel_type or not rel_name:
                 continue
 
             # Normalize relationship type
-            rel_type_clean = self.clean_text(rel_type).lower()
-            normalized_type = relationship_mappings.get(
+            rel_type_clean = _clean_text(rel_type).lower()
+            normalized_type = _RELATIONSHIP_MAP.get(
                 rel_type_clean, rel_type.title()
             )
 
@@ -472,44 +642,95 @@ class DataNormalizer:
         Returns:
             Quality score between 0.0 and 1.0
         """
+        get = character_data.get
         score = 0.0
-        max_score = 0.0
 
-        # Required fields scoring
-        required_fields = {"name": 0.3, "anime": 0.2}
+        for field, weight, is_list, is_description in _QUALITY_FIELD_SPECS:
+            value = get(field)
 
-        for field, weight in required_fields.items():
-            max_score += weight
-            value = character_data.get(field)
-            if value and isinstance(value, str) and len(value.strip()) > 0:
-                score += weight
-
-        # Optional fields scoring
-        optional_fields = {
-            "description": 0.2,
-            "age": 0.1,
-            "gender": 0.05,
-            "occupation": 0.05,
-            "abilities": 0.05,
-            "relationships": 0.05,
-        }
-
-        for field, weight in optional_fields.items():
-            max_score += weight
-            value = character_data.get(field)
-
-            if field in ["abilities", "relationships"]:
+            if is_list:
                 if value and len(value) > 0:
                     score += weight
-            elif value and isinstance(value, str) and len(value.strip()) > 0:
+            elif isinstance(value, str) and value and not value.isspace():
                 # Bonus for longer descriptions
-                if field == "description" and len(value) > 100:
+                if is_description and len(value) > 100:
                     score += weight * 1.2
                 else:
                     score += weight
 
         # Normalize score
-        return min(score / max_score, 1.0) if max_score > 0 else 0.0
+        return min(score / _QUALITY_MAX_SCORE, 1.0) if _QUALITY_MAX_SCORE > 0 else 0.0
+
+    def validate_data_quality_batch(self, records: List[Dict[str, Any]]) -> "np.ndarray":
+        """
+        Calculate data quality scores for many records at once.
+
+        Uses the same weights as validate_data_quality, but evaluates each
+        field column-wise over the whole batch instead of record by record.
+
+        Args:
+            records: List of character data dictionaries
+
+        Returns:
+            Array of quality scores between 0.0 and 1.0, one per record
+        """
+        import numpy as np
+        import pandas as pd
+
+        if not records:
+            return np.zeros(0, dtype=np.float64)
+
+        frame = pd.DataFrame(records)
+        size = len(frame)
+
+        def has_text(field: str, min_length: int = 0) -> "np.ndarray":
+            # Checked per value: columns may hold lists, dicts or numbers,
+            # which the .str accessor rejects
+            if field not in frame:
+                return np.zeros(size, dtype=bool)
+            return np.fromiter(
+                (
+                    isinstance(value, str)
+                    and len(value) > min_length
+                    and not value.isspace()
+                    for value in frame[field]
+                ),
+                dtype=bool,
+                count=size,
+            )
+
+        def has_items(field: str) -> "np.ndarray":
+            if field not in frame:
+                return np.zeros(size, dtype=bool)
+            return np.fromiter(
+                (hasattr(value, "__len__") and len(value) > 0 for value in frame[field]),
+                dtype=bool,
+                count=size,
+            )
+
+        scores = np.zeros(size, dtype=np.float64)
+        max_score = 0.0
+
+        for field, weight in REQUIRED_QUALITY_FIELDS.items():
+            max_score += weight
+            scores += weight * has_text(field)
+
+        for field, weight in OPTIONAL_QUALITY_FIELDS.items():
+            max_score += weight
+            if field in LIST_QUALITY_FIELDS:
+                scores += weight * has_items(field)
+            elif field == "description":
+                present = has_text(field)
+                if present.any():
+                    long_text = has_text(field, min_length=100)
+                    scores += weight * present * np.where(long_text, 1.2, 1.0)
+            else:
+                scores += weight * has_text(field)
+
+        if max_score <= 0:
+            return np.zeros(size, dtype=np.float64)
+
+        return np.minimum(scores / max_score, 1.0)
 
     def normalize_character_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -536,6 +757,62 @@ class DataNormalizer:
 
         return normalized
 
+    def normalize_batch(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Normalize many character data dictionaries at once.
+
+        Produces the same output as calling normalize_character_data on each
+        record. Values are grouped into columns by normalized field name and
+        each distinct string value in a column is normalized only once, which
+        pays off for the heavily repeated values of a wiki scrape (gender,
+        status, affiliation, ...).
+
+        Args:
+            records: List of raw character data dictionaries
+
+        Returns:
+            List of normalized character data dictionaries
+        """
+        # Group values into columns, remembering where each record's came from
+        columns: Dict[str, List[Any]] = {}
+        record_refs: List[List[Tuple[str, int]]] = []
+        for data in records:
+            refs = []
+            for key, value in data.items():
+                normalized_key = self.normalize_field_name(key)
+                column = columns.setdefault(normalized_key, [])
+                refs.append((normalized_key, len(column)))
+                column.append(value)
+            record_refs.append(refs)
+
+        # Normalize each column, cleaning each distinct string value only once
+        results: Dict[str, List[Any]] = {}
+        for field_name, values in columns.items():
+            normalized_values: Dict[str, Any] = {}
+            column = []
+            for value in values:
+                if isinstance(value, str):
+                    if value not in normalized_values:
+                        normalized_values[value] = self.normalize_field_value(
+                            field_name, value
+                        )
+                    column.append(normalized_values[value])
+                else:
+                    column.append(self.normalize_field_value(field_name, value))
+            results[field_name] = column
+
+        # Reassemble records in their original field order
+        normalized_records = []
+        for refs in record_refs:
+            normalized = {}
+            for field_name, index in refs:
+                value = results[field_name][index]
+                if value is not None:
+                    normalized[field_name] = value
+            normalized_records.append(self._post_process_character_data(normalized))
+
+        return normalized_records
+
     def normalize_field_name(self, field_name: str) -> str:
         """
         Normalize field name to standard format.
@@ -549,22 +826,71 @@ class DataNormalizer:
         if not field_name:
             return field_name
 
+        return self._field_name_cache(field_name)
+
+    def reload_field_mappings(self) -> None:
+        """
+        Rebuild the field-name match indexes from field_mappings.
+
+        Call after editing field_mappings so partial matching and the
+        normalize_field_name cache pick up the change.
+        """
+        patterns = list(self.field_mappings.items())
+
+        # "cleaned in pattern": index every substring of every mapping key
+        substrings: Dict[str, int] = {}
+        if patterns:
+            substrings[""] = 0
+        for index, (pattern, _) in enumerate(patterns):
+            for start in range(len(pattern)):
+                for end in range(start + 1, len(pattern) + 1):
+                    substrings.setdefault(pattern[start:end], index)
+
+        # "pattern in cleaned": one automaton pass when pyahocorasick is available
+        automaton = None
+        if ahocorasick is not None and patterns:
+            automaton = ahocorasick.Automaton()
+            for index, (pattern, _) in enumerate(patterns):
+                automaton.add_word(pattern, index)
+            automaton.make_automaton()
+
+        self._field_patterns = patterns
+        self._field_substrings = substrings
+        self._field_automaton = automaton
+        self._field_name_cache.cache_clear()
+
+    def _normalize_field_name(self, field_name: str) -> str:
+        """Uncached implementation behind normalize_field_name."""
         # Convert to lowercase and clean
         cleaned = field_name.lower().strip()
-        cleaned = re.sub(r"[^\w\s]", "", cleaned)
-        cleaned = re.sub(r"\s+", " ", cleaned)
+        cleaned = _NON_WORD_RE.sub("", cleaned)
+        cleaned = _EXTRA_WHITESPACE_RE.sub(" ", cleaned)
 
         # Check for direct mapping
         if cleaned in self.field_mappings:
             return self.field_mappings[cleaned]
 
-        # Check for partial matches
-        for pattern, standard_name in self.field_mappings.items():
-            if pattern in cleaned or cleaned in pattern:
-                return standard_name
+        # Check for partial matches; the earliest mapping in declaration
+        # order wins, whichever direction it matched in
+        patterns = self._field_patterns
+        index = self._field_substrings.get(cleaned)
+        if index != 0:
+            if self._field_automaton is not None:
+                for _, match_index in self._field_automaton.iter(cleaned):
+                    if index is None or match_index < index:
+                        index = match_index
+            else:
+                limit = len(patterns) if index is None else index
+                for match_index in range(limit):
+                    if patterns[match_index][0] in cleaned:
+                        index = match_index
+                        break
+
+        if index is not None:
+            return patterns[index][1]
 
         # Convert to snake_case
-        snake_case = re.sub(r"\s+", "_", cleaned)
+        snake_case = _EXTRA_WHITESPACE_RE.sub("_", cleaned)
 
         return snake_case
 
@@ -634,16 +960,15 @@ class DataNormalizer:
         text = str(text)
 
         # Remove HTML tags
-        text = self.text_patterns["html_tags"].sub("", text)
+        if "<" in text:
+            text = _HTML_TAG_RE.sub("", text)
 
         # Clean quotes
-        text = self.text_patterns["quotes"].sub('"', text)
+        text = text.translate(_QUOTE_TABLE)
 
-        # Normalize whitespace
-        text = self.text_patterns["extra_whitespace"].sub(" ", text)
-
-        # Trim
-        text = text.strip()
+        # Normalize whitespace and trim; str.split() uses the same whitespace
+        # definition as the \s regex class
+        text = " ".join(text.split())
 
         # Apply case normalization if needed
         if not preserve_case:
@@ -670,18 +995,9 @@ class DataNormalizer:
             return None
 
         # Remove common prefixes
-        prefixes_to_remove = [
-            "is a character",
-            "is a fictional character",
-            "character from",
-            "appears in",
-        ]
-
-        desc_lower = desc.lower()
-        for prefix in prefixes_to_remove:
-            if desc_lower.startswith(prefix):
-                desc = desc[len(prefix) :].strip()
-                break
+        prefix_match = _CHARACTER_PREFIX_RE.match(desc)
+        if prefix_match:
+            desc = desc[prefix_match.end() :].strip()
 
         # Capitalize first letter
         if desc:
@@ -705,21 +1021,21 @@ class DataNormalizer:
         age_str = str(age).strip().lower()
 
         # Remove common suffixes
-        age_str = re.sub(r"\s*(years?\s*old|yrs?\.?|y\.?o\.?)\s*$", "", age_str)
+        age_str = _AGE_SUFFIX_RE.sub("", age_str)
 
         # Extract numbers and ranges
-        age_match = re.search(r"(\d+(?:\s*-\s*\d+)?)", age_str)
+        age_match = _AGE_VALUE_RE.search(age_str)
         if age_match:
             return age_match.group(1).replace(" ", "")
 
         # Handle special cases
-        if any(word in age_str for word in ["unknown", "n/a", "none", "?"]):
+        if _AGE_UNKNOWN_RE.search(age_str):
             return None
 
-        if any(word in age_str for word in ["child", "kid", "young"]):
+        if _AGE_CHILD_RE.search(age_str):
             return "child"
 
-        if any(word in age_str for word in ["adult", "grown"]):
+        if _AGE_ADULT_RE.search(age_str):
             return "adult"
 
         return age_str if age_str else None
@@ -739,23 +1055,15 @@ class DataNormalizer:
 
         gender_lower = str(gender).strip().lower()
 
-        # Gender mappings
-        gender_map = {
-            "male": "male",
-            "man": "male",
-            "boy": "male",
-            "m": "male",
-            "female": "female",
-            "woman": "female",
-            "girl": "female",
-            "f": "female",
-            "unknown": None,
-            "n/a": None,
-            "none": None,
-            "?": None,
-        }
+        if gender_lower in _GENDER_MAP:
+            return _GENDER_MAP[gender_lower]
 
-        return gender_map.get(gender_lower, gender_lower)
+        # Fall back to the first gender keyword in longer descriptions
+        match = _GENDER_KEYWORD_RE.search(gender_lower)
+        if match:
+            return _GENDER_KEYWORD_LABELS[match.lastgroup]
+
+        return gender_lower
 
     def normalize_status(self, status: str) -> Optional[str]:
         """
@@ -772,24 +1080,7 @@ class DataNormalizer:
 
         status_lower = str(status).strip().lower()
 
-        # Status mappings
-        status_map = {
-            "alive": "alive",
-            "living": "alive",
-            "active": "alive",
-            "dead": "deceased",
-            "deceased": "deceased",
-            "killed": "deceased",
-            "died": "deceased",
-            "unknown": "unknown",
-            "n/a": "unknown",
-            "none": "unknown",
-            "?": "unknown",
-            "missing": "missing",
-            "disappeared": "missing",
-        }
-
-        return status_map.get(status_lower, status_lower)
+        return _STATUS_MAP.get(status_lower, status_lower)
 
     def normalize_bounty(self, bounty: str) -> Optional[str]:
         """
@@ -807,26 +1098,25 @@ class DataNormalizer:
         bounty_str = str(bounty).strip()
 
         # Remove currency symbols and common prefixes
-        bounty_str = re.sub(
-            r"^(bounty:?\s*|reward:?\s*)", "", bounty_str, flags=re.IGNORECASE
-        )
-        bounty_str = re.sub(r"[฿$,]", "", bounty_str)
+        bounty_str = _BOUNTY_PREFIX_RE.sub("", bounty_str)
+        bounty_str = _BOUNTY_CURRENCY_RE.sub("", bounty_str)
+        bounty_lower = bounty_str.lower()
 
         # Extract numbers
-        number_match = re.search(r"(\d+(?:\.\d+)?)", bounty_str)
+        number_match = _BOUNTY_VALUE_RE.search(bounty_str)
         if number_match:
             number = number_match.group(1)
 
             # Handle units
-            if any(unit in bounty_str.lower() for unit in ["billion", "b"]):
+            if any(unit in bounty_lower for unit in ["billion", "b"]):
                 return f"{number} billion"
-            elif any(unit in bounty_str.lower() for unit in ["million", "m"]):
+            elif any(unit in bounty_lower for unit in ["million", "m"]):
                 return f"{number} million"
             else:
                 return number
 
         # Handle special cases
-        if any(word in bounty_str.lower() for word in ["none", "n/a", "unknown", "0"]):
+        if any(word in bounty_lower for word in ["none", "n/a", "unknown", "0"]):
             return None
 
         return bounty_str
@@ -847,9 +1137,7 @@ class DataNormalizer:
         height_str = str(height).strip()
 
         # Extract height with units
-        height_match = re.search(
-            r"(\d+(?:\.\d+)?)\s*(cm|m|ft|in|feet|inches)", height_str, re.IGNORECASE
-        )
+        height_match = _HEIGHT_RE.search(height_str)
         if height_match:
             value = height_match.group(1)
             unit = height_match.group(2).lower()
@@ -889,14 +1177,7 @@ class DataNormalizer:
                 normalized_items.append(item)
 
         # Remove duplicates while preserving order
-        seen = set()
-        unique_items = []
-        for item in normalized_items:
-            if item not in seen:
-                seen.add(item)
-                unique_items.append(item)
-
-        return unique_items
+        return list(dict.fromkeys(normalized_items))
 
     def _post_process_character_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -923,17 +1204,31 @@ class DataNormalizer:
 
         # Ensure timestamps
         if "extraction_date" not in data:
-            from datetime import datetime, timezone
-
-            data["extraction_date"] = datetime.now(timezone.utc).isoformat()
+            data["extraction_date"] = self._get_extraction_timestamp()
 
         return data
 
+    def _get_extraction_timestamp(self) -> str:
+        """
+        Get the current UTC timestamp, refreshed at most once per second.
+
+        Records normalized in the same batch share one ISO string instead of
+        formatting a new one each time.
 
-# Global normalizer instance
-_normalizer: Optional[DataNormalizer] = None
+        Returns:
+            ISO 8601 UTC timestamp
+        """
+        now = time.monotonic()
+        if now - self._extraction_timestamp[0] > 1.0:
+            self._extraction_timestamp = (
+                now,
+                datetime.now(timezone.utc).isoformat(),
+            )
+        return self._extraction_timestamp[1]
 
 
+# Global normalizer instance
+@functools.cache
 def get_normalizer() -> DataNormalizer:
     """
     Get or create the global data normalizer instance.
@@ -941,18 +1236,13 @@ def get_normalizer() -> DataNormalizer:
     Returns:
         Global DataNormalizer instance
     """
-    global _normalizer
-
-    if _normalizer is None:
-        _normalizer = DataNormalizer()
-
-    return _normalizer
+    return DataNormalizer()
 
 
 # Convenience functions for common operations
 def clean_text(text: str) -> str:
-    """Clean text using the global normalizer."""
-    return get_normalizer().clean_text(text)
+    """Clean text; stateless, so no normalizer instance is needed."""
+    return _clean_text(text)
 
 
 def clean_character_name(name: str) -> str:
@@ -0,0 +1,205 @@
+# utils/selector_defaults.py
+"""
+Default selector configurations shipped with the scraper.
+
+These are kept as Python literals so the defaults are available without
+reading or parsing YAML. SelectorManager writes them to the config
+directory as editable YAML files, and falls back to them when a default
+file is missing.
+"""
+
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
+
+# Generic Fandom wiki selectors
+GENERIC_FANDOM_CONFIG: Dict[str, Any] = {
+    "selectors": {
+        "character_list": {
+            "url_pattern": "https://{anime}.fandom.com/wiki/Category:Characters",
+            "character_links": {
+                "selector": ".category-page__members a",
+                "selector_type": "css",
+                "attribute": "href",
+                "multiple": True,
+                "description": "Links to individual character pages",
+            },
+            "next_page": {
+                "selector": ".category-page__pagination-next",
+                "selector_type": "css",
+                "attribute": "href",
+                "required": False,
+                "description": "Next page link for pagination",
+            },
+        },
+        "character_page": {
+            "name": {
+                "selector": "h1.page-header__title",
+                "selector_type": "css",
+                "required": True,
+                "fallback_selectors": [
+                    ".page-header__title",
+                    "h1",
+                    ".mw-page-title-main",
+                ],
+                "description": "Character name from page header",
+            },
+            "infobox": {
+                "selector": ".portable-infobox",
+                "selector_type": "css",
+                "required": False,
+                "fallback_selectors": [".infobox", ".character-infobox"],
+                "description": "Main character information box",
+            },
+            "description": {
+                "selector": ".mw-parser-output > p:first-of-type",
+                "selector_type": "css",
+                "required": False,
+                "fallback_selectors": [
+                    ".mw-content-text > p:first-of-type",
+                    ".WikiaArticle p:first-of-type",
+                ],
+                "description": "Character description paragraph",
+            },
+            "main_image": {
+                "selector": ".pi-image img",
+                "selector_type": "css",
+                "attribute": "src",
+                "required": False,
+                "fallback_selectors": [".infobox img", ".character-image img"],
+                "description": "Main character image",
+            },
+            "gallery_images": {
+                "selector": ".wikia-gallery img",
+                "selector_type": "css",
+                "attribute": "src",
+                "multiple": True,
+                "required": False,
+                "description": "Gallery images of character",
+            },
+        },
+        "infobox_fields": {
+            "age": {
+                "selector": "[data-source='age'] .pi-data-value",
+                "selector_type": "css",
+                "required": False,
+                "fallback_selectors": [
+                    ".age .pi-data-value",
+                    ".infobox-data[data-source='age']",
+                ],
+                "description": "Character age from infobox",
+            },
+            "gender": {
+                "selector": "[data-source='gender'] .pi-data-value",
+                "selector_type": "css",
+                "required": False,
+                "fallback_selectors": [".gender .pi-data-value"],
+                "description": "Character gender",
+            },
+            "occupation": {
+                "selector": "[data-source='occupation'] .pi-data-value",
+                "selector_type": "css",
+                "required": False,
+                "fallback_selectors": [".occupation .pi-data-value"],
+                "description": "Character occupation",
+            },
+            "status": {
+                "selector": "[data-source='status'] .pi-data-value",
+                "selector_type": "css",
+                "required": False,
+                "description": "Character status (alive, deceased, etc.)",
+            },
+        },
+    },
+    "data_extraction_rules": {
+        "text_cleanup": [
+            "strip_whitespace",
+            "remove_citations",
+            "normalize_unicode",
+        ],
+        "image_processing": [
+            "resolve_relative_urls",
+            "filter_minimum_size",
+            "deduplicate_urls",
+        ],
+    },
+    "fallback_strategies": {
+        "character_name": {
+            "primary": "h1.page-header__title",
+            "secondary": ".page-header__title",
+            "tertiary": "h1",
+        }
+    },
+}
+
+# One Piece specific configuration
+ONEPIECE_CONFIG: Dict[str, Any] = {
+    "extends": "generic_fandom",
+    "selectors": {
+        "character_list": {
+            "url_pattern": "https://onepiece.fandom.com/wiki/Category:Characters",
+            "character_links": {
+                "selector": ".category-page__members a[href*='/wiki/']:not([href*='Category:']):not([href*='File:'])",
+                "selector_type": "css",
+                "attribute": "href",
+                "multiple": True,
+                "description": "Character page links excluding categories and files",
+            },
+        },
+        "character_page": {
+            "name": {
+                "selector": "h1.page-header__title",
+                "selector_type": "css",
+                "required": True,
+                "post_process": "clean_character_name",
+                "description": "Character name with One Piece specific cleaning",
+            }
+        },
+        "infobox_fields": {
+            "bounty": {
+                "selector": "[data-source='bounty'] .pi-data-value",
+                "selector_type": "css",
+                "required": False,
+                "post_process": "parse_bounty",
+                "description": "Character bounty amount",
+            },
+            "devil_fruit": {
+                "selector": "[data-source='dfname'] .pi-data-value",
+                "selector_type": "css",
+                "required": False,
+                "description": "Devil fruit name",
+            },
+            "crew": {
+                "selector": "[data-source='crew'] .pi-data-value a",
+                "selector_type": "css",
+                "required": False,
+                "description": "Pirate crew affiliation",
+            },
+            "epithet": {
+                "selector": "[data-source='epithet'] .pi-data-value",
+                "selector_type": "css",
+                "required": False,
+                "description": "Character epithet or nickname",
+            },
+        },
+    },
+    "anime_specific": {
+        "name": "One Piece",
+        "base_url": "https://onepiece.fandom.com",
+        "special_categories": [
+            "Straw Hat Pirates",
+            "Marines",
+            "Pirates",
+            "Devil Fruit Users",
+        ],
+    },
+}
+
+
+# Default configurations keyed by config name; read-only so threads sharing
+# the module cannot swap entries (SelectorManager hands out deep copies)
+DEFAULT_CONFIGS: Mapping[str, Dict[str, Any]] = MappingProxyType(
+    {
+        "generic_fandom": GENERIC_FANDOM_CONFIG,
+        "onepiece": ONEPIECE_CONFIG,
+    }
+)
@@ -6,16 +6,57 @@ This module provides a centralized system for managing and loading
 CSS selectors and XPath expressions used in web scraping operations.
 """
 
+import copy
+import functools
 import logging
+import mmap
+import os
+import pickle
+import re
+import sys
+import tempfile
+import threading
 import yaml
 import json
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Union
-from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Any, Iterator, Optional, List, Tuple, Union
+from dataclasses import dataclass, field
 from enum import Enum
 
+from .selector_defaults import DEFAULT_CONFIGS
+
+if TYPE_CHECKING:
+    from cssselect import HTMLTranslator as CssselectTranslator
+
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper
+    from yaml import SafeLoader as _SafeLoader
+
 logger = logging.getLogger(__name__)
 
+# Subdirectory of the config directory holding parsed copies of YAML files
+_CACHE_DIR_NAME = ".cache"
+
+# Bump whenever _process_config or LazySelectors change what gets pickled
+_PROCESSED_CACHE_VERSION = 1
+
+# Marks selectors that have not been looked up yet (None is a valid result)
+_MISSING = object()
+
+# YAML files at least this large are parsed through a memory map
+_MMAP_MIN_SIZE = 4096
+
+# Drops spaces and hyphens when turning an anime name into a config key
+_ANIME_KEY_TABLE = str.maketrans("", "", " -")
+
+# Any of ".", "#", "[", ":", "h1"-"h3", "div", "span", "p", "a" or "img"
+# ("span" always contains "p")
+_CSS_HINT_RE = re.compile(r"[.#\[:pa]|h[1-3]|div|img")
+
 
 class SelectorType(str, Enum):
     """Enumeration for selector types."""
@@ -25,7 +66,7 @@ class SelectorType(str, Enum):
     REGEX = "regex"
 
 
-@dataclass
+@dataclass(slots=True)
 class SelectorConfig:
     """
     Configuration class for CSS/XPath selectors.
@@ -46,14 +87,253 @@ class SelectorConfig:
     attribute: Optional[str] = None
     multiple: bool = False
     required: bool = False
-    fallback_selectors: List[str] = None  # type: ignore
+    fallback_selectors: List[str] = field(default_factory=list)
     post_process: Optional[str] = None
     description: str = ""
 
-    def __post_init__(self):
-        """Initialize fallback selectors list if None."""
-        if self.fallback_selectors is None:
-            self.fallback_selectors = []
+    @property
+    def compiled(self) -> Optional[Any]:
+        """Compiled XPath for the primary selector (see compile_selector)."""
+        return compile_selector(self.selector, self.selector_type)
+
+    @property
+    def compiled_fallbacks(self) -> List[Any]:
+        """Compiled XPath objects for the fallback selectors."""
+        return [
+            compile_selector(fallback, self.selector_type)
+            for fallback in self.fallback_selectors
+        ]
+
+    def extract(self, root: Any) -> List[str]:
+        """
+        Extract stripped, non-empty strings from a parsed lxml tree.
+
+        The compiled primary selector is evaluated first, then each fallback
+        until one yields something. Matched elements contribute the value of
+        ``attribute`` when it is set and their text content otherwise; text
+        and attribute results are used as-is.
+
+        Args:
+            root: lxml element or tree to search
+
+        Returns:
+            Extracted strings (empty if no selector matched), at most one
+            unless ``multiple`` is set
+        """
+        for expression in (self.selector, *self.fallback_selectors):
+            compiled = compile_selector(expression, self.selector_type)
+            if compiled is None:
+                continue
+
+            values = [
+                text
+                for text in (
+                    _node_text(node, self.attribute) for node in compiled(root)
+                )
+                if text
+            ]
+            if values:
+                return values if self.multiple else values[:1]
+
+        return []
+
+
+def _node_text(value: Any, attribute: Optional[str] = None) -> str:
+    """Get the stripped text, or ``attribute`` value, of an XPath result item."""
+    if isinstance(value, str):
+        return value.strip()
+    if attribute:
+        return str(value.get(attribute) or "").strip()
+    return "".join(value.itertext()).strip()
+
+
+def _write_atomically(target: Path, data: bytes) -> None:
+    """
+    Replace a file with new contents without exposing a partial copy.
+
+    The data goes to a uniquely named temporary file next to the target,
+    which is then renamed over it, so concurrent writers in any thread or
+    process never share a temporary file.
+
+    Args:
+        target: File to replace
+        data: New file contents
+    """
+    target.parent.mkdir(exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(
+        prefix=f"{target.name}.", suffix=".tmp", dir=target.parent
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_name, target)
+    except BaseException:
+        os.unlink(temp_name)
+        raise
+
+
+def _has_str_keys(value: Any) -> bool:
+    """Check that every mapping nested in a parsed document has string keys."""
+    if isinstance(value, dict):
+        return all(
+            isinstance(key, str) and _has_str_keys(item) for key, item in value.items()
+        )
+    if isinstance(value, list):
+        return all(_has_str_keys(item) for item in value)
+    return True
+
+
+@functools.cache
+def _css_translator() -> "CssselectTranslator":
+    """Get the shared CSS to XPath translator."""
+    try:
+        from parsel.csstranslator import HTMLTranslator
+    except ImportError:  # parsel ships with Scrapy
+        from cssselect import HTMLTranslator as CssselectTranslator
+
+        return CssselectTranslator()
+
+    return HTMLTranslator()
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_selector(selector: str, selector_type: SelectorType) -> Optional[Any]:
+    """
+    Compile a CSS or XPath selector into a reusable lxml XPath object.
+
+    CSS is translated with parsel's translator, so Scrapy's ``::text`` and
+    ``::attr()`` pseudo-elements work the same as with ``response.css``
+    (plain cssselect is used when parsel is not installed). Each distinct
+    expression is parsed once and shared by all configs.
+
+    Args:
+        selector: CSS selector or XPath expression
+        selector_type: Type of the selector
+
+    Returns:
+        Compiled ``lxml.etree.XPath``, or None for regex selectors and
+        expressions that cannot be compiled
+    """
+    if selector_type == SelectorType.REGEX:
+        return None
+
+    try:
+        from lxml import etree
+
+        if selector_type == SelectorType.CSS:
+            selector = _css_translator().css_to_xpath(selector)
+
+        return etree.XPath(selector)
+    except Exception as e:
+        logger.debug(f"Could not compile selector {selector!r}: {e}")
+        return None
+
+
+def _intern(value: Any) -> Any:
+    """Intern ``value`` if it is a string, otherwise return it unchanged."""
+    return sys.intern(value) if type(value) is str else value
+
+
+# Selector type values as written in config files
+_SELECTOR_TYPES: Dict[str, SelectorType] = {
+    member.value: member for member in SelectorType
+}
+
+
+def _coerce_selector_type(value: Any) -> SelectorType:
+    """Convert a config value to SelectorType, raising ValueError if unknown."""
+    try:
+        return _SELECTOR_TYPES[value]
+    except (KeyError, TypeError):
+        return SelectorType(value)
+
+
+def _build_selector_config(field_config: Dict[str, Any]) -> SelectorConfig:
+    """
+    Build a SelectorConfig from a raw field configuration.
+
+    Args:
+        field_config: Raw field configuration containing a ``selector`` key
+
+    Returns:
+        SelectorConfig object
+    """
+    get = field_config.get
+
+    # Selector strings repeat across configs; intern them so every cached
+    # config shares one copy
+    return SelectorConfig(
+        selector=_intern(field_config["selector"]),
+        selector_type=_coerce_selector_type(get("selector_type", "css")),
+        attribute=_intern(get("attribute")),
+        multiple=get("multiple", False),
+        required=get("required", False),
+        fallback_selectors=[
+            _intern(fallback) for fallback in get("fallback_selectors") or []
+        ],
+        post_process=_intern(get("post_process")),
+        description=get("description", ""),
+    )
+
+
+class LazySelectors(Mapping):
+    """
+    Read-only mapping of one page type's fields to SelectorConfig objects.
+
+    Fields are converted from their raw configuration on first access and
+    then memoized, so looking up a single selector does not build (and
+    compile) every selector of the config. Entries without a ``selector``
+    key are returned unchanged.
+
+    Attributes:
+        raw: Raw field configuration for the page type
+    """
+
+    __slots__ = ("raw", "_built")
+
+    def __init__(self, raw: Dict[str, Any]):
+        """
+        Initialize the mapping with raw field configuration.
+
+        Args:
+            raw: Field name to raw configuration mapping
+        """
+        self.raw = raw
+        self._built: Dict[str, Any] = {}
+
+    def __getitem__(self, field_name: str) -> Any:
+        try:
+            return self._built[field_name]
+        except KeyError:
+            pass
+
+        field_config = self.raw[field_name]
+        if isinstance(field_config, dict) and "selector" in field_config:
+            selector_config = _build_selector_config(field_config)
+
+            # Compile now so the first scraped page does not pay for it
+            for expression in (
+                selector_config.selector,
+                *selector_config.fallback_selectors,
+            ):
+                compile_selector(expression, selector_config.selector_type)
+
+            field_config = selector_config
+
+        self._built[field_name] = field_config
+        return field_config
+
+    def __contains__(self, field_name: object) -> bool:
+        return field_name in self.raw
+
+    def __iter__(self):
+        return iter(self.raw)
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.raw!r})"
 
 
 class SelectorManager:
@@ -91,6 +371,8 @@ class SelectorManager:
             )
 
         self.cache: Dict[str, Dict[str, Any]] = {}
+        self._cache_lock = threading.Lock()
+        self._selector_index: Dict[Tuple[str, str, str], Any] = {}
         self._ensure_config_directory()
 
     def _ensure_config_directory(self):
@@ -102,214 +384,26 @@ class SelectorManager:
 
     def _create_default_configs(self):
         """Create default selector configurations for common anime wikis."""
-        # Generic Fandom wiki selectors
-        generic_config = {
-            "selectors": {
-                "character_list": {
-                    "url_pattern": "https://{anime}.fandom.com/wiki/Category:Characters",
-                    "character_links": {
-                        "selector": ".category-page__members a",
-                        "selector_type": "css",
-                        "attribute": "href",
-                        "multiple": True,
-                        "description": "Links to individual character pages",
-                    },
-                    "next_page": {
-                        "selector": ".category-page__pagination-next",
-                        "selector_type": "css",
-                        "attribute": "href",
-                        "required": False,
-                        "description": "Next page link for pagination",
-                    },
-                },
-                "character_page": {
-                    "name": {
-                        "selector": "h1.page-header__title",
-                        "selector_type": "css",
-                        "required": True,
-                        "fallback_selectors": [
-                            ".page-header__title",
-                            "h1",
-                            ".mw-page-title-main",
-                        ],
-                        "description": "Character name from page header",
-                    },
-                    "infobox": {
-                        "selector": ".portable-infobox",
-                        "selector_type": "css",
-                        "required": False,
-                        "fallback_selectors": [".infobox", ".character-infobox"],
-                        "description": "Main character information box",
-                    },
-                    "description": {
-                        "selector": ".mw-parser-output > p:first-of-type",
-                        "selector_type": "css",
-                        "required": False,
-                        "fallback_selectors": [
-                            ".mw-content-text > p:first-of-type",
-                            ".WikiaArticle p:first-of-type",
-                        ],
-                        "description": "Character description paragraph",
-                    },
-                    "main_image": {
-                        "selector": ".pi-image img",
-                        "selector_type": "css",
-                        "attribute": "src",
-                        "required": False,
-                        "fallback_selectors": [".infobox img", ".character-image img"],
-                        "description": "Main character image",
-                    },
-                    "gallery_images": {
-                        "selector": ".wikia-gallery img",
-                        "selector_type": "css",
-                        "attribute": "src",
-                        "multiple": True,
-                        "required": False,
-                        "description": "Gallery images of character",
-                    },
-                },
-                "infobox_fields": {
-                    "age": {
-                        "selector": "[data-source='age'] .pi-data-value",
-                        "selector_type": "css",
-                        "required": False,
-                        "fallback_selectors": [
-                            ".age .pi-data-value",
-                            ".infobox-data[data-source='age']",
-                        ],
-                        "description": "Character age from infobox",
-                    },
-                    "gender": {
-                        "selector": "[data-source='gender'] .pi-data-value",
-                        "selector_type": "css",
-                        "required": False,
-                        "fallback_selectors": [".gender .pi-data-value"],
-                        "description": "Character gender",
-                    },
-                    "occupation": {
-                        "selector": "[data-source='occupation'] .pi-data-value",
-                        "selector_type": "css",
-                        "required": False,
-                        "fallback_selectors": [".occupation .pi-data-value"],
-                        "description": "Character occupation",
-                    },
-                    "status": {
-                        "selector": "[data-source='status'] .pi-data-value",
-                        "selector_type": "css",
-                        "required": False,
-                        "description": "Character status (alive, deceased, etc.)",
-                    },
-                },
-            },
-            "data_extraction_rules": {
-                "text_cleanup": [
-                    "strip_whitespace",
-                    "remove_citations",
-                    "normalize_unicode",
-                ],
-                "image_processing": [
-                    "resolve_relative_urls",
-                    "filter_minimum_size",
-                    "deduplicate_urls",
-                ],
-            },
-            "fallback_strategies": {
-                "character_name": {
-                    "primary": "h1.page-header__title",
-                    "secondary": ".page-header__title",
-                    "tertiary": "h1",
-                }
-            },
-        }
-
-        # Save generic config
-        generic_config_path = self.config_dir / "generic_fandom.yaml"
-        if not generic_config_path.exists():
-            with open(generic_config_path, "w", encoding="utf-8") as f:
-                yaml.dump(
-                    generic_config,
-                    f,
-                    default_flow_style=False,
-                    allow_unicode=True,
-                    indent=2,
-                )
+        created = False
 
-        # One Piece specific configuration
-        onepiece_config = {
-            "extends": "generic_fandom",
-            "selectors": {
-                "character_list": {
-                    "url_pattern": "https://onepiece.fandom.com/wiki/Category:Characters",
-                    "character_links": {
-                        "selector": ".category-page__members a[href*='/wiki/']:not([href*='Category:']):not([href*='File:'])",
-                        "selector_type": "css",
-                        "attribute": "href",
-                        "multiple": True,
-                        "description": "Character page links excluding categories and files",
-                    },
-                },
-                "character_page": {
-                    "name": {
-                        "selector": "h1.page-header__title",
-                        "selector_type": "css",
-                        "required": True,
-                        "post_process": "clean_character_name",
-                        "description": "Character name with One Piece specific cleaning",
-                    }
-                },
-                "infobox_fields": {
-                    "bounty": {
-                        "selector": "[data-source='bounty'] .pi-data-value",
-                        "selector_type": "css",
-                        "required": False,
-                        "post_process": "parse_bounty",
-                        "description": "Character bounty amount",
-                    },
-                    "devil_fruit": {
-                        "selector": "[data-source='dfname'] .pi-data-value",
-                        "selector_type": "css",
-                        "required": False,
-                        "description": "Devil fruit name",
-                    },
-                    "crew": {
-                        "selector": "[data-source='crew'] .pi-data-value a",
-                        "selector_type": "css",
-                        "required": False,
-                        "description": "Pirate crew affiliation",
-                    },
-                    "epithet": {
-                        "selector": "[data-source='epithet'] .pi-data-value",
-                        "selector_type": "css",
-                        "required": False,
-                        "description": "Character epithet or nickname",
-                    },
-                },
-            },
-            "anime_specific": {
-                "name": "One Piece",
-                "base_url": "https://onepiece.fandom.com",
-                "special_categories": [
-                    "Straw Hat Pirates",
-                    "Marines",
-                    "Pirates",
-                    "Devil Fruit Users",
-                ],
-            },
-        }
+        for config_name, default_config in DEFAULT_CONFIGS.items():
+            config_path = self.config_dir / f"{config_name}.yaml"
+            if config_path.exists():
+                continue
 
-        # Save One Piece config
-        onepiece_config_path = self.config_dir / "onepiece.yaml"
-        if not onepiece_config_path.exists():
-            with open(onepiece_config_path, "w", encoding="utf-8") as f:
+            with open(config_path, "w", encoding="utf-8") as f:
                 yaml.dump(
-                    onepiece_config,
+                    default_config,
                     f,
+                    Dumper=_SafeDumper,
                     default_flow_style=False,
                     allow_unicode=True,
                     indent=2,
                 )
+            created = True
 
-        logger.info("Default selector configurations created")
+        if created:
+            logger.info("Default selector configurations created")
 
     def get_selectors(self, anime_name: str) -> Dict[str, Any]:
         """
@@ -329,7 +423,7 @@ class SelectorManager:
         config_name = self._normalize_config_name(anime_name)
 
         # Normalize anime name
-        anime_key = anime_name.lower().replace(" ", "").replace("-", "")
+        anime_key = anime_name.translate(_ANIME_KEY_TABLE).lower()
 
         # Check cache first
         if anime_key in self.cache:
@@ -337,31 +431,42 @@ class SelectorManager:
 
         # Try to load specific configuration
         config_file = self.config_dir / f"{anime_key}.yaml"
-        if not config_file.exists():
+        if not config_file.exists() and anime_key not in DEFAULT_CONFIGS:
             # Fallback to generic configuration
             logger.warning(
                 f"No specific configuration found for {anime_name}, using generic"
             )
             config_file = self.config_dir / "generic_fandom.yaml"
 
-        if not config_file.exists():
+        if not config_file.exists() and config_file.stem not in DEFAULT_CONFIGS:
             raise FileNotFoundError(f"No selector configuration found for {anime_name}")
 
+        # Reuse the processed configuration saved by an earlier run
+        processed_config = self._read_processed_cache(config_file)
+        if processed_config is not None:
+            with self._cache_lock:
+                self.cache[anime_key] = processed_config
+            return processed_config
+
         try:
             # Load configuration
-            with open(config_file, "r", encoding="utf-8") as f:
-                config = yaml.safe_load(f)
+            config = self._load_config(config_file)
+            source_files = [config_file]
 
             # Handle configuration inheritance
             if "extends" in config:
+                source_files.append(self.config_dir / f"{config['extends']}.yaml")
+                # The base is freshly loaded, so merge into it without copying
                 base_config = self._load_base_config(config["extends"])
-                config = self._merge_configs(base_config, config)
+                config = self._merge_configs(base_config, config, in_place=True)
 
             # Convert to SelectorConfig objects
             processed_config = self._process_config(config)
 
             # Cache the result
-            self.cache[anime_key] = processed_config
+            with self._cache_lock:
+                self.cache[anime_key] = processed_config
+            self._write_processed_cache(config_file, source_files, processed_config)
 
             logger.info(f"Loaded selector configuration for {anime_name}")
             return processed_config
@@ -370,6 +475,99 @@ class SelectorManager:
             logger.error(f"Failed to load selector configuration for {anime_name}: {e}")
             raise ValueError(f"Invalid configuration for {anime_name}: {e}")
 
+    def _read_processed_cache(self, config_file: Path) -> Optional[Dict[str, Any]]:
+        """
+        Load a processed configuration pickled by a previous process.
+
+        The pickle records the cache format version and the modification
+        time of every YAML file it was built from (the config and its base),
+        and is ignored as soon as either changes. Only files written by this
+        manager are unpickled.
+
+        Args:
+            config_file: YAML file the configuration was loaded from
+
+        Returns:
+            Processed configuration, or None if missing or stale
+        """
+        cache_file = self.config_dir / _CACHE_DIR_NAME / f"{config_file.stem}.pkl"
+        try:
+            with open(cache_file, "rb") as f:
+                cached: Tuple[int, Dict[str, int], Dict[str, Any]] = pickle.load(f)
+
+            version, source_mtimes, processed_config = cached
+            if version != _PROCESSED_CACHE_VERSION:
+                return None
+            for source_file, mtime in source_mtimes.items():
+                if os.stat(source_file).st_mtime_ns != mtime:
+                    return None
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable config cache {cache_file}: {e}")
+            return None
+
+        return processed_config
+
+    def _write_processed_cache(
+        self,
+        config_file: Path,
+        source_files: List[Path],
+        processed_config: Dict[str, Any],
+    ):
+        """
+        Pickle a processed configuration for reuse by later processes.
+
+        Args:
+            config_file: YAML file the configuration was loaded from
+            source_files: All YAML files the configuration depends on
+            processed_config: Processed configuration to save
+        """
+        cache_file = self.config_dir / _CACHE_DIR_NAME / f"{config_file.stem}.pkl"
+        try:
+            source_mtimes = {
+                str(source_file): source_file.stat().st_mtime_ns
+                for source_file in source_files
+            }
+            _write_atomically(
+                cache_file,
+                pickle.dumps(
+                    (_PROCESSED_CACHE_VERSION, source_mtimes, processed_config),
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                ),
+            )
+        except Exception as e:
+            logger.debug(f"Could not cache processed config {config_file}: {e}")
+
+    def preload_all(self, max_workers: Optional[int] = None) -> List[str]:
+        """
+        Load every available configuration into the cache concurrently.
+
+        Useful before starting several spiders at once, so they do not
+        each pay for the first load of their configuration.
+
+        Args:
+            max_workers: Maximum number of loader threads (defaults to
+                the CPU count)
+
+        Returns:
+            Names of the configurations that were loaded
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        def load(config_name: str) -> bool:
+            try:
+                self.get_selectors(config_name)
+                return True
+            except Exception:
+                return False  # Already logged by get_selectors
+
+        config_names = self.list_available_configs()
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            results = list(executor.map(load, config_names))
+
+        return [name for name, loaded in zip(config_names, results) if loaded]
+
     def _normalize_config_name(self, anime_name: str) -> str:
         """
         Normalize anime name to config file name.
@@ -472,13 +670,24 @@ class SelectorManager:
         Returns:
             List of available config names
         """
-        configs = []
+        return self._scan_config_names(".json")
 
-        for config_file in self.config_dir.glob("*.json"):
-            config_name = config_file.stem
-            configs.append(config_name)
+    def _scan_config_names(self, suffix: str) -> List[str]:
+        """
+        List config names with the given file suffix in one directory scan.
 
-        return sorted(configs)
+        Args:
+            suffix: File suffix including the dot (e.g. '.yaml')
+
+        Returns:
+            Sorted config names without the suffix
+        """
+        with os.scandir(self.config_dir) as entries:
+            return sorted(
+                entry.name[: -len(suffix)]
+                for entry in entries
+                if entry.name.endswith(suffix) and entry.is_file()
+            )
 
     def _load_base_config(self, base_name: str) -> Dict[str, Any]:
         """
@@ -491,14 +700,89 @@ class SelectorManager:
             Base configuration dictionary
         """
         base_file = self.config_dir / f"{base_name}.yaml"
-        if not base_file.exists():
+        if not base_file.exists() and base_name not in DEFAULT_CONFIGS:
             raise FileNotFoundError(f"Base configuration not found: {base_name}")
 
-        with open(base_file, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+        return self._load_config(base_file)
+
+    def _load_config(self, config_file: Path) -> Dict[str, Any]:
+        """
+        Load a configuration file, or the built-in default of the same name.
+
+        Files in the config directory take precedence so that edited
+        defaults are respected; the built-in copy is only used when the
+        file is missing.
+
+        Args:
+            config_file: Path to YAML configuration file
+
+        Returns:
+            Configuration dictionary
+        """
+        if not config_file.exists() and config_file.stem in DEFAULT_CONFIGS:
+            return copy.deepcopy(DEFAULT_CONFIGS[config_file.stem])
+
+        return self._load_yaml(config_file)
+
+    def _load_yaml(self, config_file: Path) -> Dict[str, Any]:
+        """
+        Load a YAML configuration, reusing a parsed JSON copy when current.
+
+        The parsed document is mirrored to ``.cache/<name>.json`` inside the
+        configuration directory together with the modification time and size
+        of the YAML source. The copy is used only while both still match, so
+        YAML is parsed again whenever the file is replaced, even by an older
+        one. Documents with non-string keys are not mirrored, since JSON
+        would turn those keys into strings.
+
+        Args:
+            config_file: Path to YAML configuration file
+
+        Returns:
+            Parsed configuration dictionary
+        """
+        cache_file = self.config_dir / _CACHE_DIR_NAME / f"{config_file.stem}.json"
+        source_stat = config_file.stat()
+        source = [source_stat.st_mtime_ns, source_stat.st_size]
+
+        config: Dict[str, Any]
+        try:
+            cached = json.loads(cache_file.read_bytes())
+            if cached["source"] == source:
+                config = cached["config"]
+                return config
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # Missing, unreadable or stale copy, parse the YAML source
+
+        with open(config_file, "rb") as f:
+            if os.fstat(f.fileno()).st_size >= _MMAP_MIN_SIZE:
+                # Let the parser pull from the page cache instead of
+                # materializing a second copy of a large file
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    config = yaml.load(mapped, Loader=_SafeLoader)
+            else:
+                config = yaml.load(f, Loader=_SafeLoader)
+
+        if not _has_str_keys(config):
+            return config
+
+        try:
+            _write_atomically(
+                cache_file,
+                json.dumps(
+                    {"source": source, "config": config}, ensure_ascii=False
+                ).encode("utf-8"),
+            )
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not cache parsed config {config_file}: {e}")
+
+        return config
 
     def _merge_configs(
-        self, base_config: Dict[str, Any], child_config: Dict[str, Any]
+        self,
+        base_config: Dict[str, Any],
+        child_config: Dict[str, Any],
+        in_place: bool = False,
     ) -> Dict[str, Any]:
         """
         Merge child configuration with base configuration.
@@ -506,26 +790,30 @@ class SelectorManager:
         Args:
             base_config: Base configuration dictionary
             child_config: Child configuration dictionary
+            in_place: Update base_config directly instead of a deep copy;
+                only safe when the caller owns base_config
 
         Returns:
             Merged configuration dictionary
         """
-        merged = base_config.copy()
+        merged = base_config if in_place else copy.deepcopy(base_config)
 
-        for key, value in child_config.items():
-            if key == "extends":
-                continue  # Skip the extends directive
+        # Walk matching subtrees iteratively, updating the copy in place
+        pending = [(merged, child_config)]
+        while pending:
+            target, source = pending.pop()
 
-            if (
-                isinstance(value, dict)
-                and key in merged
-                and isinstance(merged[key], dict)
-            ):
-                # Recursively merge dictionaries
-                merged[key] = self._merge_configs(merged[key], value)
-            else:
-                # Override with child value
-                merged[key] = value
+            for key, value in source.items():
+                if key == "extends":
+                    continue  # Skip the extends directive
+
+                existing = target.get(key)
+                if isinstance(value, dict) and isinstance(existing, dict):
+                    # Merge nested dictionaries
+                    pending.append((existing, value))
+                else:
+                    # Override with child value
+                    target[key] = value
 
         return merged
 
@@ -557,32 +845,23 @@ class SelectorManager:
             selectors: Selector configuration dictionary
 
         Returns:
-            Processed selectors with SelectorConfig objects
+            Processed selectors, one LazySelectors mapping per page type
         """
         processed_selectors = {}
 
+        # Interned keys let lookups with literal names (which the compiler
+        # interns) match by identity
         for page_type, page_selectors in selectors.items():
-            processed_selectors[page_type] = {}
-
-            for field_name, field_config in page_selectors.items():
-                if isinstance(field_config, dict) and "selector" in field_config:
-                    # Convert to SelectorConfig object
-                    selector_config = SelectorConfig(
-                        selector=field_config["selector"],
-                        selector_type=SelectorType(
-                            field_config.get("selector_type", "css")
-                        ),
-                        attribute=field_config.get("attribute"),
-                        multiple=field_config.get("multiple", False),
-                        required=field_config.get("required", False),
-                        fallback_selectors=field_config.get("fallback_selectors", []),
-                        post_process=field_config.get("post_process"),
-                        description=field_config.get("description", ""),
-                    )
-                    processed_selectors[page_type][field_name] = selector_config
-                else:
-                    # Keep non-selector configuration as-is
-                    processed_selectors[page_type][field_name] = field_config
+            if isinstance(page_selectors, dict):
+                # Fields are converted on first access
+                processed_selectors[_intern(page_type)] = LazySelectors(
+                    {
+                        _intern(field_name): field_config
+                        for field_name, field_config in page_selectors.items()
+                    }
+                )
+            else:
+                processed_selectors[_intern(page_type)] = page_selectors
 
         return processed_selectors
 
@@ -600,21 +879,41 @@ class SelectorManager:
         Returns:
             SelectorConfig object or None if not found
         """
+        # Single lookup on the flat index once a selector has been resolved
+        key = (anime_name, page_type, field_name)
+        selector_config: Optional[SelectorConfig]
+        selector_config = self._selector_index.get(key, _MISSING)
+        if selector_config is not _MISSING:
+            return selector_config
+
         try:
             selectors = self.get_selectors(anime_name)
-            return selectors.get("selectors", {}).get(page_type, {}).get(field_name)
         except Exception as e:
             logger.error(
                 f"Failed to get selector {anime_name}.{page_type}.{field_name}: {e}"
             )
             return None
 
-    def validate_selectors(self, anime_name: str) -> Dict[str, List[str]]:
+        page_selectors = selectors.get("selectors", {}).get(page_type)
+        selector_config = (
+            page_selectors.get(field_name) if page_selectors is not None else None
+        )
+        self._selector_index[key] = selector_config
+        return selector_config
+
+    def validate_selectors(
+        self, anime_name: str, thorough: bool = False
+    ) -> Dict[str, List[str]]:
         """
         Validate selector configuration for an anime.
 
+        By default validation stops at the first fatal error (missing page
+        type or required field), since warnings about a structurally broken
+        configuration are not actionable.
+
         Args:
             anime_name: Name of the anime to validate
+            thorough: Report every error and all warnings
 
         Returns:
             Dictionary with validation results (errors, warnings, info)
@@ -625,50 +924,15 @@ class SelectorManager:
             config = self.get_selectors(anime_name)
             selectors = config.get("selectors", {})
 
-            # Check for required page types
-            required_pages = ["character_list", "character_page"]
-            for page_type in required_pages:
-                if page_type not in selectors:
-                    validation_results["errors"].append(
-                        f"Missing required page type: {page_type}"
-                    )
-
-            # Validate character_page selectors
-            if "character_page" in selectors:
-                character_selectors = selectors["character_page"]
-
-                # Check for required fields
-                required_fields = ["name"]
-                for field in required_fields:
-                    if field not in character_selectors:
-                        validation_results["errors"].append(
-                            f"Missing required field: character_page.{field}"
-                        )
-                    elif isinstance(character_selectors[field], SelectorConfig):
-                        if not character_selectors[field].selector:
-                            validation_results["errors"].append(
-                                f"Empty selector for required field: character_page.{field}"
-                            )
-
-                # Check selector syntax
-                for field_name, selector_config in character_selectors.items():
-                    if isinstance(selector_config, SelectorConfig):
-                        if not self._validate_selector_syntax(selector_config):
-                            validation_results["warnings"].append(
-                                f"Potentially invalid selector syntax: {field_name}"
-                            )
-
-            # Check for fallback selectors
-            for page_type, page_selectors in selectors.items():
-                for field_name, selector_config in page_selectors.items():
-                    if isinstance(selector_config, SelectorConfig):
-                        if (
-                            selector_config.required
-                            and not selector_config.fallback_selectors
-                        ):
-                            validation_results["warnings"].append(
-                                f"Required field {page_type}.{field_name} has no fallback selectors"
-                            )
+            if thorough:
+                validation_results["errors"].extend(self._iter_fatal_errors(selectors))
+            else:
+                first_error = next(self._iter_fatal_errors(selectors), None)
+                if first_error is not None:
+                    validation_results["errors"].append(first_error)
+                    return validation_results
+
+            validation_results["warnings"].extend(self._iter_warnings(selectors))
 
             validation_results["info"].append(
                 f"Configuration loaded successfully for {anime_name}"
@@ -681,6 +945,66 @@ class SelectorManager:
 
         return validation_results
 
+    def _iter_fatal_errors(self, selectors: Dict[str, Any]) -> Iterator[str]:
+        """
+        Yield structural errors that make a configuration unusable.
+
+        Args:
+            selectors: Processed selectors section of a configuration
+
+        Yields:
+            Error messages
+        """
+        # Check for required page types
+        required_pages = ["character_list", "character_page"]
+        for page_type in required_pages:
+            if page_type not in selectors:
+                yield f"Missing required page type: {page_type}"
+
+        # Check for required character_page fields
+        if "character_page" in selectors:
+            character_selectors = selectors["character_page"]
+
+            required_fields = ["name"]
+            for field_name in required_fields:
+                if field_name not in character_selectors:
+                    yield f"Missing required field: character_page.{field_name}"
+                elif type(character_selectors[field_name]) is SelectorConfig:
+                    if not character_selectors[field_name].selector:
+                        yield (
+                            "Empty selector for required field: "
+                            f"character_page.{field_name}"
+                        )
+
+    def _iter_warnings(self, selectors: Dict[str, Any]) -> Iterator[str]:
+        """
+        Yield non-fatal issues such as suspicious syntax or missing fallbacks.
+
+        Args:
+            selectors: Processed selectors section of a configuration
+
+        Yields:
+            Warning messages
+        """
+        # Check selector syntax
+        for field_name, selector_config in selectors.get("character_page", {}).items():
+            if type(selector_config) is SelectorConfig:
+                if not self._validate_selector_syntax(selector_config):
+                    yield f"Potentially invalid selector syntax: {field_name}"
+
+        # Check for fallback selectors
+        for page_type, page_selectors in selectors.items():
+            for field_name, selector_config in page_selectors.items():
+                if type(selector_config) is SelectorConfig:
+                    if (
+                        selector_config.required
+                        and not selector_config.fallback_selectors
+                    ):
+                        yield (
+                            f"Required field {page_type}.{field_name} "
+                            "has no fallback selectors"
+                        )
+
     def _validate_selector_syntax(self, selector_config: SelectorConfig) -> bool:
         """
         Basic validation of selector syntax.
@@ -695,25 +1019,11 @@ class SelectorManager:
 
         if selector_config.selector_type == SelectorType.CSS:
             # Basic CSS selector validation
-            if not selector or len(selector.strip()) == 0:
+            if not selector or not selector.strip():
                 return False
 
             # Check for common CSS selector patterns
-            css_patterns = [
-                ".",
-                "#",
-                "[",
-                ":",
-                "h1",
-                "h2",
-                "h3",
-                "div",
-                "span",
-                "p",
-                "a",
-                "img",
-            ]
-            if not any(pattern in selector for pattern in css_patterns):
+            if not _CSS_HINT_RE.search(selector):
                 return False
 
         elif selector_config.selector_type == SelectorType.XPATH:
@@ -730,14 +1040,8 @@ class SelectorManager:
         Returns:
             List of available configuration names
         """
-        configs = []
-
         try:
-            for config_file in self.config_dir.glob("*.yaml"):
-                config_name = config_file.stem
-                configs.append(config_name)
-
-            return sorted(configs)
+            return self._scan_config_names(".yaml")
 
         except Exception as e:
             logger.error(f"Failed to list configurations: {e}")
@@ -755,7 +1059,7 @@ class SelectorManager:
             True if template created successfully, False otherwise
         """
         try:
-            anime_key = anime_name.lower().replace(" ", "").replace("-", "")
+            anime_key = anime_name.translate(_ANIME_KEY_TABLE).lower()
             config_file = self.config_dir / f"{anime_key}.yaml"
 
             if config_file.exists():
@@ -807,7 +1111,12 @@ class SelectorManager:
             # Save template
             with open(config_file, "w", encoding="utf-8") as f:
                 yaml.dump(
-                    template, f, default_flow_style=False, allow_unicode=True, indent=2
+                    template,
+                    f,
+                    Dumper=_SafeDumper,
+                    default_flow_style=False,
+                    allow_unicode=True,
+                    indent=2,
                 )
 
             logger.info(f"Created configuration template for {anime_name}")
@@ -826,19 +1135,24 @@ class SelectorManager:
         Args:
             anime_name: Name of the anime to reload
         """
-        anime_key = anime_name.lower().replace(" ", "").replace("-", "")
+        anime_key = anime_name.translate(_ANIME_KEY_TABLE).lower()
         if anime_key in self.cache:
             del self.cache[anime_key]
+            self._selector_index.clear()
+            _clear_memoized_selectors()
             logger.info(f"Reloaded configuration for {anime_name}")
 
     def clear_cache(self):
         """Clear all cached configurations."""
         self.cache.clear()
+        self._selector_index.clear()
+        _clear_memoized_selectors()
         logger.info("Cleared selector configuration cache")
 
 
 # Global selector manager instance
 _selector_manager: Optional[SelectorManager] = None
+_selector_manager_lock = threading.Lock()
 
 
 def get_selector_manager() -> SelectorManager:
@@ -851,7 +1165,9 @@ def get_selector_manager() -> SelectorManager:
     global _selector_manager
 
     if _selector_manager is None:
-        _selector_manager = SelectorManager()
+        with _selector_manager_lock:
+            if _selector_manager is None:
+                _selector_manager = SelectorManager()
 
     return _selector_manager
 
@@ -870,12 +1186,20 @@ def get_selectors(anime_name: str) -> Dict[str, Any]:
     return manager.get_selectors(anime_name)
 
 
+_memoized_selectors: Dict[Tuple[str, str, str], SelectorConfig] = {}
+_memoized_compiled: Dict[Tuple[str, str, str], Any] = {}
+
+
 def get_selector(
     anime_name: str, page_type: str, field_name: str
 ) -> Optional[SelectorConfig]:
     """
     Convenience function to get a specific selector.
 
+    Found selectors are memoized; failed lookups are not, so a selector
+    that appears later is picked up. SelectorManager.clear_cache and
+    reload_config drop the memoized entries.
+
     Args:
         anime_name: Name of the anime
         page_type: Type of page
@@ -884,19 +1208,85 @@ def get_selector(
     Returns:
         SelectorConfig object or None
     """
-    manager = get_selector_manager()
-    return manager.get_selector(anime_name, page_type, field_name)
+    key = (anime_name, page_type, field_name)
+    selector_config = _memoized_selectors.get(key)
+    if selector_config is None:
+        manager = get_selector_manager()
+        selector_config = manager.get_selector(anime_name, page_type, field_name)
+        if selector_config is not None:
+            _memoized_selectors[key] = selector_config
+    return selector_config
+
+
+def get_compiled_selector(
+    anime_name: str, page_type: str, field_name: str
+) -> Optional[Any]:
+    """
+    Convenience function to get the compiled XPath of a specific selector.
+
+    The returned ``lxml.etree.XPath`` can be called directly on a parsed
+    tree, skipping selector parsing on every page. Like get_selector,
+    only successful results are memoized.
+
+    Args:
+        anime_name: Name of the anime
+        page_type: Type of page
+        field_name: Name of the field
+
+    Returns:
+        Compiled XPath object, or None if the selector is missing or
+        cannot be compiled
+    """
+    key = (anime_name, page_type, field_name)
+    compiled = _memoized_compiled.get(key)
+    if compiled is None:
+        selector_config = get_selector(anime_name, page_type, field_name)
+        if selector_config is None:
+            return None
+        compiled = selector_config.compiled
+        if compiled is not None:
+            _memoized_compiled[key] = compiled
+    return compiled
+
+
+def extract(root: Any, anime_name: str, page_type: str, field_name: str) -> List[str]:
+    """
+    Convenience function to extract a field from a parsed lxml tree.
+
+    Evaluates the compiled selector (and its fallbacks) directly on the
+    tree, without building parsel Selector objects.
+
+    Args:
+        root: lxml element or tree to search
+        anime_name: Name of the anime
+        page_type: Type of page
+        field_name: Name of the field
+
+    Returns:
+        Extracted strings (empty if the selector is missing or matched nothing)
+    """
+    selector_config = get_selector(anime_name, page_type, field_name)
+    if selector_config is None:
+        return []
+    return selector_config.extract(root)
+
+
+def _clear_memoized_selectors():
+    """Drop memoized results of the module-level selector lookups."""
+    _memoized_selectors.clear()
+    _memoized_compiled.clear()
 
 
-def validate_selectors(anime_name: str) -> Dict[str, List[str]]:
+def validate_selectors(anime_name: str, thorough: bool = False) -> Dict[str, List[str]]:
     """
     Convenience function to validate selectors for an anime.
 
     Args:
         anime_name: Name of the anime
+        thorough: Report every error and all warnings
 
     Returns:
         Validation results dictionary
     """
     manager = get_selector_manager()
-    return manager.validate_selectors(anime_name)
+    return manager.validate_selectors(anime_name, thorough=thorough)
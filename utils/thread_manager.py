@@ -4,13 +4,86 @@ Thread management utilities for concurrent operations.
 Provides thread pool management and async operations support.
 """
 
+import asyncio
+import heapq
+import itertools
 import logging
+import os
+import random
 import threading
-from typing import Dict, List, Any, Optional, Callable
-from concurrent.futures import ThreadPoolExecutor, Future, as_completed
+from collections import deque
+from typing import (
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Any,
+    NamedTuple,
+    Optional,
+    Callable,
+    Set,
+    Tuple,
+    Type,
+)
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, Future, wait
 from queue import Queue
 import time
 
+try:
+    import requests
+except ImportError:
+    requests = None
+
+try:
+    import aiohttp  # optional async HTTP client
+except ImportError:
+    aiohttp = None
+
+# Network failures are usually transient. Errors that carry an HTTP status
+# are only retried for 5xx and RETRIABLE_STATUS_CODES (see _should_retry),
+# so a 404 from raise_for_status() fails at once.
+RETRIABLE_EXCEPTIONS: Tuple[Type[BaseException], ...] = (ConnectionError, TimeoutError)
+if requests is not None:
+    RETRIABLE_EXCEPTIONS += (
+        requests.ConnectionError,
+        requests.Timeout,
+        requests.HTTPError,
+    )
+if aiohttp is not None:
+    RETRIABLE_EXCEPTIONS += (aiohttp.ClientConnectionError, aiohttp.ClientResponseError)
+
+# Client error statuses worth retrying (rate limiting)
+RETRIABLE_STATUS_CODES = frozenset({429})
+
+
+class PermanentError(Exception):
+    """
+    Raised by worker functions for failures that retrying cannot fix.
+
+    Examples are HTTP 4xx responses or pages that no longer exist. The task
+    fails immediately instead of waiting through the retry backoff.
+    """
+
+
+class TaskResult(NamedTuple):
+    """
+    Outcome of a single task run by ThreadManager.
+
+    Attributes:
+        task_index: Position of the task in the submitted sequence
+        task: The task dictionary itself
+        success: Whether the worker returned without raising
+        result: Worker return value (None on failure)
+        error: Error message (None on success)
+    """
+
+    task_index: int
+    task: Dict[str, Any]
+    success: bool
+    result: Any = None
+    error: Optional[str] = None
+
 
 class ThreadManager:
     """
@@ -34,22 +107,29 @@ class ThreadManager:
         self.logger = logging.getLogger(__name__)
 
         # Default configuration
-        self.config = {
-            "max_workers": 4,
+        self.config: Dict[str, Any] = {
+            "max_workers": None,  # Derived from the CPU count when None
+            "io_bound": True,  # Workers mostly wait on the network
             "timeout": 300,  # 5 minutes default timeout
             "retry_attempts": 3,
-            "retry_delay": 1.0,
+            "retry_delay": 1.0,  # Base delay, doubled on each further attempt
+            "retry_max_delay": 30.0,
+            "retry_jitter": 0.5,  # Upper bound of random seconds added
+            # Transient failures worth retrying; anything else fails at once
+            "retriable_exceptions": RETRIABLE_EXCEPTIONS,
             "progress_callback": None,
+            "max_concurrency": 100,  # In-flight coroutines for async workers
+            "per_host_limit": 8,  # Concurrent connections per host (async)
         }
 
         if config:
             self.config.update(config)
 
-        self.executor = None
-        self.active_futures = []
-        self.results = []
-        self.errors = []
-        self._lock = threading.Lock()
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self.active_futures: Set[Future] = set()
+        self.results: Deque[TaskResult] = deque()
+        self.errors: Deque[TaskResult] = deque()
+        self._thread_local = threading.local()
 
     def execute_parallel(
         self, tasks: List[Dict[str, Any]], worker_function: Callable
@@ -57,6 +137,10 @@ class ThreadManager:
         """
         Execute tasks in parallel using thread pool.
 
+        Coroutine functions are run on an event loop instead (see
+        execute_parallel_async); this must not be called from a running loop
+        in that case.
+
         Args:
             tasks: List of task dictionaries
             worker_function: Function to execute for each task
@@ -67,72 +151,38 @@ class ThreadManager:
         if not tasks:
             return {"success": True, "results": [], "errors": []}
 
+        if asyncio.iscoroutinefunction(worker_function):
+            return asyncio.run(self.execute_parallel_async(tasks, worker_function))
+
         self.logger.info(f"Starting parallel execution of {len(tasks)} tasks")
 
         try:
-            with ThreadPoolExecutor(max_workers=self.config["max_workers"]) as executor:
-                self.executor = executor
-
-                # Submit all tasks
-                future_to_task = {}
-                for i, task in enumerate(tasks):
-                    future = executor.submit(
-                        self._execute_with_retry, worker_function, task, i
-                    )
-                    future_to_task[future] = (i, task)
-                    self.active_futures.append(future)
-
-                # Collect results
-                completed = 0
-                for future in as_completed(
-                    future_to_task, timeout=self.config["timeout"]
-                ):
-                    task_index, task = future_to_task[future]
-
-                    try:
-                        result = future.result()
-                        with self._lock:
-                            self.results.append(
-                                {
-                                    "task_index": task_index,
-                                    "task": task,
-                                    "result": result,
-                                    "success": True,
-                                }
-                            )
-                    except Exception as e:
-                        with self._lock:
-                            self.errors.append(
-                                {
-                                    "task_index": task_index,
-                                    "task": task,
-                                    "error": str(e),
-                                    "success": False,
-                                }
-                            )
-                        self.logger.error(f"Task {task_index} failed: {e}")
-
-                    completed += 1
+            completed = 0
+            for outcome in self.iter_results(tasks, worker_function):
+                if outcome.success:
+                    self.results.append(outcome)
+                else:
+                    self.errors.append(outcome)
+                completed += 1
 
-                    # Progress callback
-                    if self.config["progress_callback"]:
-                        progress = (completed / len(tasks)) * 100
-                        self.config["progress_callback"](
-                            progress, completed, len(tasks)
-                        )
+                # Progress callback
+                if self.config["progress_callback"]:
+                    progress = (completed / len(tasks)) * 100
+                    self.config["progress_callback"](progress, completed, len(tasks))
 
-                success_count = len(self.results)
-                error_count = len(self.errors)
+            results = list(self.results)
+            errors = list(self.errors)
+            success_count = len(results)
 
-                return {
-                    "success": True,
-                    "total_tasks": len(tasks),
-                    "successful_tasks": success_count,
-                    "failed_tasks": error_count,
-                    "success_rate": (success_count / len(tasks)) * 100,
-                    "results": self.results,
-                    "errors": self.errors,
-                }
+            return {
+                "success": True,
+                "total_tasks": len(tasks),
+                "successful_tasks": success_count,
+                "failed_tasks": len(errors),
+                "success_rate": (success_count / len(tasks)) * 100,
+                "results": results,
+                "errors": errors,
+            }
 
         except Exception as e:
             self.logger.error(f"Parallel execution failed: {e}")
@@ -140,28 +190,301 @@ class ThreadManager:
         finally:
             self.cleanup()
 
-    def _execute_with_retry(
-        self, worker_function: Callable, task: Dict[str, Any], task_index: int
-    ) -> Any:
-        """Execute task with retry logic."""
-        last_exception = None
+    def iter_results(
+        self, tasks: Iterable[Dict[str, Any]], worker_function: Callable
+    ) -> Iterator[TaskResult]:
+        """
+        Execute tasks in parallel and yield each outcome as it completes.
+
+        Outcomes are not retained, so a caller that writes them out as they
+        arrive keeps memory bounded regardless of the number of tasks. If
+        the caller stops iterating early, tasks that have not started are
+        cancelled.
+
+        Failed attempts that will be retried are not slept on in the worker
+        thread: the task is put on a delay heap and resubmitted once its
+        backoff has elapsed, so the thread picks up other tasks meanwhile.
+
+        Args:
+            tasks: Task dictionaries
+            worker_function: Function to execute for each task
+
+        Yields:
+            TaskResult for each task, in completion order
+
+        Raises:
+            TimeoutError: If tasks are still running after ``timeout`` seconds
+        """
+        timeout = self.config["timeout"]
+        deadline = time.monotonic() + timeout
+
+        with ThreadPoolExecutor(max_workers=self._max_workers()) as executor:
+            self.executor = executor
+
+            # future -> (task_index, task, attempt)
+            pending: Dict[Future, Tuple[int, Dict[str, Any], int]] = {}
+            # (wake_time, task_index, task, attempt); task_index breaks ties
+            retries: List[Tuple[float, int, Dict[str, Any], int]] = []
+
+            def submit(task_index: int, task: Dict[str, Any], attempt: int):
+                future = executor.submit(worker_function, task)
+                pending[future] = (task_index, task, attempt)
+                self.active_futures.add(future)
+
+            for i, task in enumerate(tasks):
+                submit(i, task, 0)
 
-        for attempt in range(self.config["retry_attempts"]):
             try:
-                return worker_function(task)
-            except Exception as e:
-                last_exception = e
-                if attempt < self.config["retry_attempts"] - 1:
-                    self.logger.warning(
-                        f"Task {task_index} attempt {attempt + 1} failed: {e}, retrying..."
+                while pending or retries:
+                    now = time.monotonic()
+                    while retries and retries[0][0] <= now:
+                        _, task_index, task, attempt = heapq.heappop(retries)
+                        submit(task_index, task, attempt)
+
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        raise TimeoutError(
+                            f"{len(pending) + len(retries)} tasks unfinished "
+                            f"after {timeout} seconds"
+                        )
+                    if retries:
+                        remaining = min(remaining, retries[0][0] - now)
+
+                    done, _ = wait(
+                        pending, timeout=remaining, return_when=FIRST_COMPLETED
                     )
-                    time.sleep(self.config["retry_delay"] * (attempt + 1))
-                else:
-                    self.logger.error(
-                        f"Task {task_index} failed after {self.config['retry_attempts']} attempts"
+                    for future in done:
+                        # Drop our references so finished payloads can be freed
+                        task_index, task, attempt = pending.pop(future)
+                        self.active_futures.discard(future)
+
+                        error = future.exception()
+                        if error is not None and self._should_retry(
+                            error, task_index, attempt
+                        ):
+                            wake_time = time.monotonic() + self._retry_delay(attempt)
+                            heapq.heappush(
+                                retries, (wake_time, task_index, task, attempt + 1)
+                            )
+                        else:
+                            yield self._outcome(task_index, task, future)
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _outcome(
+        self, task_index: int, task: Dict[str, Any], future: Future
+    ) -> TaskResult:
+        """Build the outcome record of a finished task."""
+        try:
+            result = future.result()
+        except Exception as e:
+            self.logger.error(f"Task {task_index} failed: {e}")
+            return TaskResult(task_index, task, False, error=str(e))
+
+        return TaskResult(task_index, task, True, result)
+
+    async def execute_parallel_async(
+        self, tasks: List[Dict[str, Any]], worker_function: Callable
+    ) -> Dict[str, Any]:
+        """
+        Execute network-bound tasks concurrently on the running event loop.
+
+        Up to ``max_concurrency`` tasks are in flight at once on a single
+        thread. Workers are called as ``await worker_function(task, session)``
+        where ``session`` is a shared ``aiohttp.ClientSession`` limited to
+        ``per_host_limit`` connections per host, or None when aiohttp is not
+        installed.
+
+        Args:
+            tasks: List of task dictionaries
+            worker_function: Coroutine function to execute for each task
+
+        Returns:
+            Execution results with statistics
+        """
+        if not tasks:
+            return {"success": True, "results": [], "errors": []}
+
+        self.logger.info(f"Starting async execution of {len(tasks)} tasks")
+
+        results = []
+        errors = []
+        completed = 0
+        semaphore = asyncio.Semaphore(self.config["max_concurrency"])
+
+        async def run_task(task_index: int, task: Dict[str, Any], session: Any):
+            nonlocal completed
+
+            async with semaphore:
+                try:
+                    result = await self._execute_with_retry_async(
+                        worker_function, task, task_index, session
                     )
+                    results.append(TaskResult(task_index, task, True, result))
+                except Exception as e:
+                    errors.append(TaskResult(task_index, task, False, error=str(e)))
+                    self.logger.error(f"Task {task_index} failed: {e}")
+
+            completed += 1
+            if self.config["progress_callback"]:
+                progress = (completed / len(tasks)) * 100
+                self.config["progress_callback"](progress, completed, len(tasks))
+
+        async def run_all(session: Any):
+            await asyncio.wait_for(
+                asyncio.gather(
+                    *(run_task(i, task, session) for i, task in enumerate(tasks))
+                ),
+                timeout=self.config["timeout"],
+            )
+
+        try:
+            if aiohttp is None:
+                self.logger.warning("aiohttp not available - workers get no session")
+                await run_all(None)
+            else:
+                connector = aiohttp.TCPConnector(
+                    limit=self.config["max_concurrency"],
+                    limit_per_host=self.config["per_host_limit"],
+                )
+                async with aiohttp.ClientSession(connector=connector) as session:
+                    await run_all(session)
+        except Exception as e:
+            self.logger.error(f"Async execution failed: {e}")
+            return {"success": False, "error": str(e)}
+
+        success_count = len(results)
+        return {
+            "success": True,
+            "total_tasks": len(tasks),
+            "successful_tasks": success_count,
+            "failed_tasks": len(errors),
+            "success_rate": (success_count / len(tasks)) * 100,
+            "results": results,
+            "errors": errors,
+        }
+
+    async def _execute_with_retry_async(
+        self,
+        worker_function: Callable,
+        task: Dict[str, Any],
+        task_index: int,
+        session: Any,
+    ) -> Any:
+        """Execute a coroutine task, retrying transient failures with backoff."""
+        for attempt in itertools.count():
+            try:
+                return await worker_function(task, session)
+            except Exception as e:
+                if not self._should_retry(e, task_index, attempt):
+                    raise
+                await asyncio.sleep(self._retry_delay(attempt))
+
+    def _should_retry(
+        self, error: BaseException, task_index: int, attempt: int
+    ) -> bool:
+        """
+        Decide whether a failed attempt is retried.
+
+        Only ``retriable_exceptions`` are retried, and only while attempts
+        remain; any other exception, including PermanentError, fails the
+        task immediately. HTTP errors are additionally classified by status:
+        only 5xx responses and RETRIABLE_STATUS_CODES are retried.
+
+        Args:
+            error: Exception raised by the worker
+            task_index: Index of the task, for logging
+            attempt: Zero-based number of the attempt that failed
+
+        Returns:
+            True if the task should be run again
+        """
+        if isinstance(error, PermanentError) or not isinstance(
+            error, self.config["retriable_exceptions"]
+        ):
+            return False
+
+        status = _http_status(error)
+        if status is not None and status < 500 and status not in RETRIABLE_STATUS_CODES:
+            return False
 
-        raise last_exception
+        if attempt < self.config["retry_attempts"] - 1:
+            self.logger.warning(
+                f"Task {task_index} attempt {attempt + 1} failed: {error}, retrying..."
+            )
+            return True
+
+        self.logger.error(
+            f"Task {task_index} failed after {self.config['retry_attempts']} attempts"
+        )
+        return False
+
+    def _max_workers(self) -> int:
+        """
+        Get the thread pool size for execute_parallel.
+
+        An explicit ``max_workers`` wins. Otherwise I/O-bound work gets
+        five threads per CPU (at most 32), since workers spend most of
+        their time waiting on responses, and CPU-bound work one per CPU.
+        Scraping workers should stagger their first request (for example
+        by ``task_index * 0.1`` seconds) so a large pool does not hit one
+        host with a burst.
+
+        Returns:
+            Number of worker threads
+        """
+        if self.config["max_workers"]:
+            return int(self.config["max_workers"])
+        return default_max_workers(self.config["io_bound"])
+
+    def _retry_delay(self, attempt: int) -> float:
+        """
+        Compute the wait before retrying after a failed attempt.
+
+        Delays grow exponentially up to ``retry_max_delay`` and include a
+        random jitter so tasks that failed together do not retry together.
+
+        Args:
+            attempt: Zero-based number of the attempt that failed
+
+        Returns:
+            Delay in seconds
+        """
+        delay = min(
+            self.config["retry_max_delay"], self.config["retry_delay"] * 2**attempt
+        )
+        return float(delay + random.random() * self.config["retry_jitter"])
+
+    def get_compiled(self, selector: str, selector_type: str = "css") -> Optional[Any]:
+        """
+        Get a compiled XPath for a selector, private to the calling thread.
+
+        A compiled ``lxml.etree.XPath`` holds a lock while it is evaluated,
+        so workers sharing one object take turns. Each worker thread gets
+        its own copy instead, compiled once from the shared translation.
+
+        Args:
+            selector: CSS selector or XPath expression
+            selector_type: Type of the selector ('css' or 'xpath')
+
+        Returns:
+            Compiled XPath object, or None if the selector cannot be compiled
+        """
+        compiled = getattr(self._thread_local, "compiled", None)
+        if compiled is None:
+            compiled = self._thread_local.compiled = {}
+
+        key = (selector, selector_type)
+        if key not in compiled:
+            from lxml import etree
+
+            from .selectors import SelectorType, compile_selector
+
+            shared = compile_selector(selector, SelectorType(selector_type))
+            compiled[key] = etree.XPath(shared.path) if shared is not None else None
+
+        return compiled[key]
 
     def cleanup(self):
         """Clean up resources."""
@@ -171,12 +494,49 @@ class ThreadManager:
         self.executor = None
 
 
+def _http_status(error: BaseException) -> Optional[int]:
+    """
+    Get the HTTP status code carried by a client exception.
+
+    Args:
+        error: Exception raised by a worker
+
+    Returns:
+        Status of a requests ``HTTPError`` response or an aiohttp
+        ``ClientResponseError``, or None for errors without one
+    """
+    status = getattr(getattr(error, "response", None), "status_code", None)
+    if status is None:
+        status = getattr(error, "status", None)
+    return status if isinstance(status, int) else None
+
+
+def default_max_workers(io_bound: bool = True) -> int:
+    """
+    Derive a thread pool size from the CPU count.
+
+    Args:
+        io_bound: Whether workers mostly wait on I/O
+
+    Returns:
+        Number of worker threads
+    """
+    cpu_count = os.cpu_count() or 1
+    return min(32, cpu_count * 5) if io_bound else cpu_count
+
+
 def create_thread_config() -> Dict[str, Any]:
     """Create default configuration for thread manager."""
     return {
-        "max_workers": 4,
+        "max_workers": default_max_workers(),
+        "io_bound": True,
         "timeout": 300,
         "retry_attempts": 3,
         "retry_delay": 1.0,
+        "retry_max_delay": 30.0,
+        "retry_jitter": 0.5,
+        "retriable_exceptions": RETRIABLE_EXCEPTIONS,
         "progress_callback": None,
+        "max_concurrency": 100,
+        "per_host_limit": 8,
     }
@@ -4,13 +4,52 @@ Chart generation utilities for character data visualization.
 Provides various chart types and customization options.
 """
 
+import importlib.util
 import logging
-from typing import Dict, List, Any, Optional, Tuple
-from datetime import datetime
+from collections import Counter
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Dict, Iterable, List, Any, Optional, Tuple
+from datetime import date, datetime
 from pathlib import Path
 import json
 
 
+# Locations of a character's quality score, split into key paths once
+_QUALITY_PATHS = (
+    ('quality_score',),
+    ('overall_score',),
+    ('_quality_metadata', 'overall_score'),
+    ('fusion_metadata', 'confidence_score'),
+)
+
+# Trailing UTC offset of an ISO timestamp ('Z', '+09:00', '-0500')
+_TZ_SUFFIX_PATTERN = r'(?:Z|[+-]\d{2}:?\d{2})$'
+
+# Number of character lists whose dashboard aggregates are kept
+_AGGREGATE_CACHE_SIZE = 4
+
+# Size of the 2x2 multi-chart dashboard in pixels
+_DASHBOARD_SIZE = {'width': 1200, 'height': 800}
+
+# Line traces with more points than this are drawn with WebGL (scattergl)
+_WEBGL_THRESHOLD = 1000
+
+# Lower bounds of the 'fair', 'good' and 'excellent' quality buckets
+_QUALITY_BINS = (0.6, 0.75, 0.9)
+_QUALITY_LABELS = ('excellent', 'good', 'fair', 'poor')
+
+
+@dataclass
+class ChartAggregates:
+    """Aggregates behind the dashboard panels, computed in a single pass."""
+
+    sources: 'Counter[str]'
+    quality: Dict[str, Any]
+    timeline: Dict[str, int]
+    categories: 'Counter[str]'
+
+
 class ChartGenerator:
     """
     Comprehensive chart generator for character data visualization.
@@ -67,31 +106,61 @@ class ChartGenerator:
         if config:
             self.config.update(config)
 
-        # Check for plotting libraries
-        self.plotly_available = False
-        self.matplotlib_available = False
+        # (id, length, date field) -> (characters, aggregates); holding the
+        # list keeps its id from being reused by another object
+        self._aggregate_cache: Dict[Tuple[int, int, str],
+                                    Tuple[List[Dict[str, Any]], ChartAggregates]] = {}
 
-        try:
-            import plotly.graph_objects as go
-            import plotly.express as px
-            from plotly.offline import plot
-            self.go = go
-            self.px = px
-            self.plot = plot
-            self.plotly_available = True
-            self.logger.info("Plotly available for interactive charts")
-        except ImportError:
-            self.logger.warning("Plotly not available - limited chart functionality")
+    # Plotting libraries take a long time to import, so they are only
+    # looked up here and imported when a chart first needs them
 
-        try:
-            import matplotlib.pyplot as plt
-            import seaborn as sns
-            self.plt = plt
-            self.sns = sns
-            self.matplotlib_available = True
-            self.logger.info("Matplotlib/Seaborn available for static charts")
-        except ImportError:
+    @cached_property
+    def plotly_available(self) -> bool:
+        """Whether plotly is installed (checked without importing it)."""
+        available = importlib.util.find_spec('plotly') is not None
+        if not available:
+            self.logger.warning("Plotly not available - limited chart functionality")
+        return available
+
+    @cached_property
+    def matplotlib_available(self) -> bool:
+        """Whether matplotlib and seaborn are installed."""
+        available = all(
+            importlib.util.find_spec(name) is not None for name in ('matplotlib', 'seaborn')
+        )
+        if not available:
             self.logger.warning("Matplotlib not available - limited static chart functionality")
+        return available
+
+    @cached_property
+    def go(self):
+        """plotly.graph_objects, imported on first use."""
+        import plotly.graph_objects as go
+        return go
+
+    @cached_property
+    def px(self):
+        """plotly.express, imported on first use."""
+        import plotly.express as px
+        return px
+
+    @cached_property
+    def pio(self):
+        """plotly.io, imported on first use."""
+        import plotly.io as pio
+        return pio
+
+    @cached_property
+    def plt(self):
+        """matplotlib.pyplot, imported on first use."""
+        import matplotlib.pyplot as plt
+        return plt
+
+    @cached_property
+    def sns(self):
+        """seaborn, imported on first use."""
+        import seaborn as sns
+        return sns
 
     def generate_character_distribution(self, characters: List[Dict[str, Any]],
                                       group_by: str = 'source') -> Dict[str, Any]:
@@ -118,24 +187,18 @@ class ChartGenerator:
                 return {'success': False, 'error': 'Plotly not available for chart generation'}
 
             # Create pie chart
-            fig = self.go.Figure(data=[
-                self.go.Pie(
-                    labels=list(distribution.keys()),
-                    values=list(distribution.values()),
-                    hole=0.3,  # Donut chart
-                    textinfo='label+percent',
-                    textposition='outside',
-                    marker=dict(colors=self.config['colors']['palette'])
-                )
-            ])
-
-            fig.update_layout(
-                title=f'Character Distribution by {group_by.title()}',
-                font=dict(size=self.config['styling']['axis_font_size']),
-                width=self.config['chart_size']['width'],
-                height=self.config['chart_size']['height'],
-                margin=self.config['styling']['margin']
-            )
+            fig = {
+                'data': [{
+                    'type': 'pie',
+                    'labels': list(distribution.keys()),
+                    'values': list(distribution.values()),
+                    'hole': 0.3,  # Donut chart
+                    'textinfo': 'label+percent',
+                    'textposition': 'outside',
+                    'marker': {'colors': self.config['colors']['palette']}
+                }],
+                'layout': self._base_layout(f'Character Distribution by {group_by.title()}')
+            }
 
             # Generate output
             result = self._export_chart(fig, f'character_distribution_{group_by}')
@@ -179,33 +242,36 @@ class ChartGenerator:
                 return {'success': False, 'error': 'Plotly not available for chart generation'}
 
             # Create histogram of quality scores
-            fig = self.go.Figure(data=[
-                self.go.Histogram(
-                    x=quality_data['scores'],
-                    nbinsx=20,
-                    marker=dict(color=self.config['colors']['primary'], opacity=0.7),
-                    name='Quality Scores'
-                )
-            ])
-
-            fig.update_layout(
-                title='Data Quality Score Distribution',
-                xaxis_title='Quality Score',
-                yaxis_title='Number of Characters',
-                font=dict(size=self.config['styling']['axis_font_size']),
-                width=self.config['chart_size']['width'],
-                height=self.config['chart_size']['height'],
-                margin=self.config['styling']['margin']
+            layout = self._base_layout(
+                'Data Quality Score Distribution', 'Quality Score', 'Number of Characters'
             )
 
-            # Add average line
+            # Add average line spanning the full plot height
             avg_score = sum(quality_data['scores']) / len(quality_data['scores'])
-            fig.add_vline(
-                x=avg_score,
-                line_dash="dash",
-                line_color=self.config['colors']['warning'],
-                annotation_text=f"Average: {avg_score:.2f}"
-            )
+            layout['shapes'] = [{
+                'type': 'line',
+                'xref': 'x', 'yref': 'paper',
+                'x0': avg_score, 'x1': avg_score, 'y0': 0, 'y1': 1,
+                'line': {'dash': 'dash', 'color': self.config['colors']['warning']}
+            }]
+            layout['annotations'] = [{
+                'xref': 'x', 'yref': 'paper',
+                'x': avg_score, 'y': 1,
+                'xanchor': 'left', 'yanchor': 'top',
+                'text': f"Average: {avg_score:.2f}",
+                'showarrow': False
+            }]
+
+            fig = {
+                'data': [{
+                    'type': 'histogram',
+                    'x': quality_data['scores'],
+                    'nbinsx': 20,
+                    'marker': {'color': self.config['colors']['primary'], 'opacity': 0.7},
+                    'name': 'Quality Scores'
+                }],
+                'layout': layout
+            }
 
             result = self._export_chart(fig, 'quality_overview')
             result['chart_type'] = 'histogram'
@@ -240,7 +306,7 @@ class ChartGenerator:
 
         try:
             # Extract and count categories
-            category_counts = self._count_categories(characters)
+            category_counts, characters_with_categories = self._count_categories(characters)
 
             if not category_counts:
                 return {'success': False, 'error': 'No categories found in character data'}
@@ -248,40 +314,34 @@ class ChartGenerator:
             if not self.plotly_available:
                 return {'success': False, 'error': 'Plotly not available for chart generation'}
 
-            # Sort categories by frequency
-            sorted_categories = sorted(category_counts.items(), key=lambda x: x[1], reverse=True)
-
-            # Take top 15 categories to avoid overcrowding
-            top_categories = sorted_categories[:15]
+            # Take top 15 categories by frequency to avoid overcrowding
+            top_categories = category_counts.most_common(15)
             categories, counts = zip(*top_categories) if top_categories else ([], [])
 
             # Create horizontal bar chart for better label readability
-            fig = self.go.Figure(data=[
-                self.go.Bar(
-                    y=categories,
-                    x=counts,
-                    orientation='h',
-                    marker=dict(color=self.config['colors']['secondary']),
-                    text=counts,
-                    textposition='auto'
-                )
-            ])
-
-            fig.update_layout(
-                title='Most Common Character Categories',
-                xaxis_title='Number of Characters',
-                yaxis_title='Category',
-                font=dict(size=self.config['styling']['axis_font_size']),
-                width=self.config['chart_size']['width'],
-                height=max(400, len(categories) * 30),  # Dynamic height based on categories
-                margin=self.config['styling']['margin']
+            layout = self._base_layout(
+                'Most Common Character Categories', 'Number of Characters', 'Category'
             )
+            layout['height'] = max(400, len(categories) * 30)  # Dynamic height based on categories
+
+            fig = {
+                'data': [{
+                    'type': 'bar',
+                    'y': list(categories),
+                    'x': list(counts),
+                    'orientation': 'h',
+                    'marker': {'color': self.config['colors']['secondary']},
+                    'text': list(counts),
+                    'textposition': 'auto'
+                }],
+                'layout': layout
+            }
 
             result = self._export_chart(fig, 'category_analysis')
             result['chart_type'] = 'horizontal_bar'
             result['data_summary'] = {
                 'total_categories': len(category_counts),
-                'characters_with_categories': sum(1 for char in characters if char.get('categories')),
+                'characters_with_categories': characters_with_categories,
                 'most_common_category': categories[0] if categories else None,
                 'top_categories': dict(top_categories)
             }
@@ -314,6 +374,8 @@ class ChartGenerator:
 
             from plotly.subplots import make_subplots
 
+            aggregates = self._compute_all_aggregates(characters)
+
             # Create subplot layout
             fig = make_subplots(
                 rows=2, cols=2,
@@ -323,7 +385,7 @@ class ChartGenerator:
             )
 
             # 1. Source distribution (pie chart)
-            source_dist = self._aggregate_by_field(characters, 'source')
+            source_dist = aggregates.sources
             if source_dist:
                 fig.add_trace(
                     self.go.Pie(
@@ -335,7 +397,7 @@ class ChartGenerator:
                 )
 
             # 2. Quality scores (histogram)
-            quality_data = self._extract_quality_data(characters)
+            quality_data = aggregates.quality
             if quality_data['scores']:
                 fig.add_trace(
                     self.go.Histogram(
@@ -347,10 +409,14 @@ class ChartGenerator:
                 )
 
             # 3. Timeline (line chart)
-            timeline_data = self._process_timeline_data(characters, 'scraped_at')
+            timeline_data = aggregates.timeline
             if timeline_data:
-                dates = list(timeline_data.keys())
-                counts = list(timeline_data.values())
+                # At most one point per pixel of the half-width subplot, which
+                # stays below _WEBGL_THRESHOLD, so SVG scatter is enough here
+                dates, counts = self._downsample_timeline(
+                    list(timeline_data.keys()), list(timeline_data.values()),
+                    _DASHBOARD_SIZE['width'] // 2
+                )
                 fig.add_trace(
                     self.go.Scatter(
                         x=dates,
@@ -362,9 +428,9 @@ class ChartGenerator:
                 )
 
             # 4. Top categories (bar chart)
-            category_counts = self._count_categories(characters)
+            category_counts = aggregates.categories
             if category_counts:
-                top_cats = sorted(category_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+                top_cats = category_counts.most_common(10)
                 cats, counts = zip(*top_cats) if top_cats else ([], [])
                 fig.add_trace(
                     self.go.Bar(
@@ -379,8 +445,8 @@ class ChartGenerator:
             fig.update_layout(
                 title_text="Character Data Dashboard",
                 showlegend=False,
-                height=800,
-                width=1200,
+                height=_DASHBOARD_SIZE['height'],
+                width=_DASHBOARD_SIZE['width'],
                 margin=self.config['styling']['margin']
             )
 
@@ -398,132 +464,283 @@ class ChartGenerator:
             self.logger.error(error_msg)
             return {'success': False, 'error': error_msg}
 
-    def _aggregate_by_field(self, characters: List[Dict[str, Any]], field: str) -> Dict[str, int]:
-        """Aggregate character data by specified field."""
-        aggregation = {}
+    def _compute_all_aggregates(self, characters: List[Dict[str, Any]],
+                                date_field: str = 'scraped_at') -> ChartAggregates:
+        """
+        Compute the source, quality, timeline and category aggregates in one
+        pass over the characters.
 
-        for character in characters:
-            value = character.get(field, 'Unknown')
-            if value is None:
-                value = 'Unknown'
+        Results are memoized per list object and length, so regenerating a
+        dashboard for the same list skips the pass. Call clear_cache() after
+        editing characters of a list in place.
+
+        Args:
+            characters: List of character data
+            date_field: Field containing date information
+
+        Returns:
+            Aggregates for each dashboard panel
+        """
+        key = (id(characters), len(characters), date_field)
+        cached = self._aggregate_cache.get(key)
+        if cached is not None:
+            return cached[1]
+
+        aggregates = self._build_aggregates(characters, date_field)
 
-            value_str = str(value)
-            aggregation[value_str] = aggregation.get(value_str, 0) + 1
+        self._aggregate_cache[key] = (characters, aggregates)
+        if len(self._aggregate_cache) > _AGGREGATE_CACHE_SIZE:
+            # Evict the oldest entry
+            del self._aggregate_cache[next(iter(self._aggregate_cache))]
 
-        return aggregation
+        return aggregates
+
+    def _build_aggregates(self, characters: List[Dict[str, Any]],
+                          date_field: str) -> ChartAggregates:
+        """Compute the dashboard aggregates (see _compute_all_aggregates)."""
+        sources: 'Counter[str]' = Counter()
+        categories: 'Counter[str]' = Counter()
+        raw_scores = []
+        raw_dates = []
+
+        for character in characters:
+            value = character.get('source')
+            sources['Unknown' if value is None else str(value)] += 1
+            raw_scores.append(self._find_quality_score(character))
+            raw_dates.append(character.get(date_field))
+            self._add_categories(categories, character)
+
+        return ChartAggregates(
+            sources=sources,
+            quality=self._summarize_quality(raw_scores),
+            timeline=self._count_dates(raw_dates),
+            categories=categories
+        )
+
+    def clear_cache(self):
+        """Forget memoized dashboard aggregates."""
+        self._aggregate_cache.clear()
+
+    def _aggregate_by_field(self, characters: List[Dict[str, Any]], field: str) -> 'Counter[str]':
+        """Aggregate character data by specified field."""
+        # Counter counts the generator in C instead of a get/set per character
+        return Counter(
+            'Unknown' if (value := character.get(field)) is None else str(value)
+            for character in characters
+        )
 
     def _process_timeline_data(self, characters: List[Dict[str, Any]],
                               date_field: str) -> Dict[str, int]:
         """Process timeline data from characters."""
-        from datetime import datetime
-        from collections import defaultdict
+        return self._count_dates(character.get(date_field) for character in characters)
 
-        daily_counts = defaultdict(int)
+    def _count_dates(self, raw_dates: Iterable[Any]) -> Dict[str, int]:
+        """Count date values per day, sorted by date."""
+        import pandas as pd
 
-        for character in characters:
-            date_str = character.get(date_field)
-            if not date_str:
+        daily_counts: 'Counter[str]' = Counter()
+        date_strings = []
+
+        for value in raw_dates:
+            if not value:
+                continue
+
+            if isinstance(value, str):
+                date_strings.append(value)
                 continue
 
             try:
-                # Parse date string
-                if isinstance(date_str, str):
-                    date_str = date_str.replace('Z', '+00:00')
-                    date_obj = datetime.fromisoformat(date_str)
-                else:
-                    date_obj = date_str
+                # Group datetime objects by date (without time)
+                daily_counts[value.date().isoformat()] += 1
+            except Exception as e:
+                self.logger.warning(f"Failed to parse date '{value}': {e}")
 
-                # Group by date (without time)
-                date_key = date_obj.date().isoformat()
-                daily_counts[date_key] += 1
+        if date_strings:
+            # Parse all strings in one call. Dropping the UTC offset keeps
+            # each timestamp on the calendar day it was recorded in.
+            local = pd.Series(date_strings, dtype=object).str.replace(
+                _TZ_SUFFIX_PATTERN, '', regex=True
+            )
+            parsed = pd.to_datetime(local, format='ISO8601', errors='coerce')
 
-            except Exception as e:
-                self.logger.warning(f"Failed to parse date '{date_str}': {e}")
-                continue
+            invalid = int(parsed.isna().sum())
+            if invalid:
+                self.logger.warning(
+                    f"Failed to parse {invalid} of {len(date_strings)} date values"
+                )
+
+            daily_counts.update(
+                parsed.dropna().dt.strftime('%Y-%m-%d').value_counts().to_dict()
+            )
 
         # Sort by date
         sorted_dates = sorted(daily_counts.items())
         return dict(sorted_dates)
 
+    def _downsample_timeline(self, dates: List[str], counts: List[int],
+                             target: int) -> Tuple[List[str], List[int]]:
+        """
+        Reduce a daily timeline to at most ``target`` points for plotting.
+
+        Uses Largest-Triangle-Three-Buckets, which keeps the first and last
+        day and, per bucket, the day that best preserves the visual shape
+        (peaks and dips) of the line.
+
+        Args:
+            dates: ISO dates in ascending order
+            counts: Count for each date
+            target: Maximum number of points to keep
+
+        Returns:
+            Tuple of the kept dates and counts
+        """
+        n = len(dates)
+        if n <= target or target < 3:
+            return dates, counts
+
+        import numpy as np
+
+        x = np.array(
+            [date.fromisoformat(d).toordinal() for d in dates], dtype=np.float64
+        )
+        y = np.asarray(counts, dtype=np.float64)
+
+        # Split the points between the first and last into target - 2 buckets
+        edges = np.linspace(1, n - 1, target - 1).astype(np.intp)
+        kept = [0]
+
+        for i in range(target - 2):
+            start, end = edges[i], edges[i + 1]
+            if i + 2 < len(edges):
+                next_start, next_end = end, edges[i + 2]
+            else:
+                next_start, next_end = n - 1, n
+
+            # Triangle between the last kept point, each bucket point and
+            # the average of the next bucket
+            prev = kept[-1]
+            avg_x = x[next_start:next_end].mean()
+            avg_y = y[next_start:next_end].mean()
+            areas = np.abs(
+                (x[prev] - avg_x) * (y[start:end] - y[prev])
+                - (x[prev] - x[start:end]) * (avg_y - y[prev])
+            )
+            kept.append(int(start + np.argmax(areas)))
+
+        kept.append(n - 1)
+        return [dates[i] for i in kept], [counts[i] for i in kept]
+
     def _extract_quality_data(self, characters: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Extract quality scores and distribution from characters."""
-        scores = []
-        distribution = {'excellent': 0, 'good': 0, 'fair': 0, 'poor': 0}
+        return self._summarize_quality(
+            self._find_quality_score(character) for character in characters
+        )
+
+    @staticmethod
+    def _find_quality_score(character: Dict[str, Any]) -> Any:
+        """Look for a quality score in the common locations of a character."""
+        for path in _QUALITY_PATHS:
+            value = character
+            for key in path:
+                if not isinstance(value, dict):
+                    value = None
+                    break
+                value = value.get(key)
+
+            if value is not None:
+                return value
+
+        return None
+
+    def _summarize_quality(self, raw_scores: Iterable[Any]) -> Dict[str, Any]:
+        """Convert raw quality scores to floats and bucket them."""
+        import numpy as np
 
-        for character in characters:
-            # Look for quality score in various possible locations
-            score = None
-
-            # Check common quality score locations
-            quality_locations = [
-                'quality_score',
-                'overall_score',
-                '_quality_metadata.overall_score',
-                'fusion_metadata.confidence_score'
-            ]
+        scores = []
+        for score in raw_scores:
+            if score is None:
+                continue
 
-            for location in quality_locations:
-                if '.' in location:
-                    # Nested field
-                    parts = location.split('.')
-                    value = character
-                    for part in parts:
-                        if isinstance(value, dict) and part in value:
-                            value = value[part]
-                        else:
-                            value = None
-                            break
-                    if value is not None:
-                        score = value
-                        break
-                else:
-                    # Direct field
-                    score = character.get(location)
-                    if score is not None:
-                        break
+            try:
+                scores.append(float(score))
+            except (ValueError, TypeError):
+                continue
 
-            if score is not None:
-                try:
-                    score_float = float(score)
-                    scores.append(score_float)
-
-                    # Categorize score
-                    if score_float >= 0.9:
-                        distribution['excellent'] += 1
-                    elif score_float >= 0.75:
-                        distribution['good'] += 1
-                    elif score_float >= 0.6:
-                        distribution['fair'] += 1
-                    else:
-                        distribution['poor'] += 1
-
-                except (ValueError, TypeError):
-                    continue
+        # Bucket all scores at once; NaN compares below every bound, as before
+        values = np.asarray(scores, dtype=np.float64)
+        values[np.isnan(values)] = -np.inf
+        counts = np.bincount(
+            np.digitize(values, _QUALITY_BINS), minlength=len(_QUALITY_LABELS)
+        )
 
         return {
             'scores': scores,
-            'distribution': distribution
+            'distribution': dict(zip(_QUALITY_LABELS, counts[::-1].tolist()))
         }
 
-    def _count_categories(self, characters: List[Dict[str, Any]]) -> Dict[str, int]:
-        """Count occurrences of each category across all characters."""
-        category_counts = {}
+    def _count_categories(self, characters: List[Dict[str, Any]]) -> Tuple['Counter[str]', int]:
+        """
+        Count occurrences of each category across all characters.
+
+        Returns:
+            Tuple of the category counts and the number of characters that
+            have categories
+        """
+        category_counts = Counter()
+        characters_with_categories = 0
 
         for character in characters:
-            categories = character.get('categories', [])
-            if not isinstance(categories, list):
-                continue
+            characters_with_categories += self._add_categories(category_counts, character)
 
-            for category in categories:
-                if category and isinstance(category, str):
-                    category = category.strip()
-                    if category:
-                        category_counts[category] = category_counts.get(category, 0) + 1
+        return category_counts, characters_with_categories
 
-        return category_counts
+    @staticmethod
+    def _add_categories(category_counts: 'Counter[str]', character: Dict[str, Any]) -> bool:
+        """
+        Add the categories of one character to a running count.
+
+        Returns:
+            Whether the character has a non-empty categories value
+        """
+        categories = character.get('categories', [])
+        if not isinstance(categories, list):
+            return bool(categories)
+
+        stripped = (
+            category.strip() for category in categories
+            if isinstance(category, str)
+        )
+        category_counts.update(category for category in stripped if category)
+        return bool(categories)
+
+    def _base_layout(self, title: str, x_title: Optional[str] = None,
+                     y_title: Optional[str] = None) -> Dict[str, Any]:
+        """Build the layout dict shared by the single-figure charts."""
+        layout = {
+            'title': {'text': title},
+            'font': {'size': self.config['styling']['axis_font_size']},
+            'width': self.config['chart_size']['width'],
+            'height': self.config['chart_size']['height'],
+            'margin': self.config['styling']['margin']
+        }
+        if x_title:
+            layout['xaxis'] = {'title': {'text': x_title}}
+        if y_title:
+            layout['yaxis'] = {'title': {'text': y_title}}
+        return layout
 
     def _export_chart(self, fig, filename: str) -> Dict[str, Any]:
-        """Export chart to configured format."""
+        """
+        Export chart to configured format.
+
+        Args:
+            fig: Plotly figure, or a plain ``{'data': ..., 'layout': ...}``
+                figure dict
+            filename: Base name of the output file
+
+        Returns:
+            Export result
+        """
         try:
             output_dir = Path(self.config['export']['output_dir'])
             output_dir.mkdir(parents=True, exist_ok=True)
@@ -540,33 +757,60 @@ class ChartGenerator:
                     'responsive': self.config['export']['responsive']
                 }
 
-                self.plot(
+                # Figure dicts are written out as built, and plotly figures
+                # were validated on construction; skip the validation pass
+                # and deep copy that plotly.offline.plot does
+                html = self.pio.to_html(
                     fig,
-                    filename=str(output_path),
-                    auto_open=False,
                     config=config,
-                    include_plotlyjs='cdn'
+                    include_plotlyjs='cdn',
+                    full_html=True,
+                    validate=False
                 )
+                _write_text_chunked(output_path, html)
 
             elif format_type == 'json':
                 output_path = output_dir / f"{filename}_{timestamp}.json"
 
-                # Export as JSON
+                # Export as JSON; to_dict() gives plain data/layout dicts
                 chart_data = {
-                    'data': fig.data,
-                    'layout': fig.layout,
+                    **(fig if isinstance(fig, dict) else fig.to_dict()),
                     'config': self.config,
                     'generated_at': datetime.now().isoformat()
                 }
 
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    json.dump(chart_data, f, indent=2, default=str)
+                try:
+                    import orjson
+                except ImportError:
+                    with open(output_path, 'w', encoding='utf-8') as f:
+                        json.dump(chart_data, f, indent=2, default=_json_default)
+                else:
+                    output_path.write_bytes(orjson.dumps(
+                        chart_data,
+                        default=_json_default,
+                        option=(orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                                | orjson.OPT_NON_STR_KEYS)
+                    ))
+
+            elif format_type in ('png', 'svg'):
+                if importlib.util.find_spec('kaleido') is None:
+                    return {
+                        'success': False,
+                        'error': f'Export format {format_type} requires the kaleido package'
+                    }
+
+                output_path = output_dir / f"{filename}_{timestamp}.{format_type}"
+
+                # plotly keeps a single kaleido renderer alive for the whole
+                # process, so repeated exports do not start a new browser
+                self.pio.write_image(
+                    fig, str(output_path), format=format_type, validate=False
+                )
 
             else:
-                # For PNG/SVG, would need kaleido package
                 return {
                     'success': False,
-                    'error': f'Export format {format_type} requires additional dependencies'
+                    'error': f'Unsupported export format: {format_type}'
                 }
 
             file_size = output_path.stat().st_size
@@ -604,34 +848,30 @@ class ChartGenerator:
             if not self.plotly_available:
                 return {'success': False, 'error': 'Plotly not available for chart generation'}
 
-            # Sort by count
-            sorted_sources = sorted(source_stats.items(), key=lambda x: x[1], reverse=True)
+            # Sort by count; every source is charted, so this is a full sort
+            sorted_sources = source_stats.most_common()
             sources, counts = zip(*sorted_sources) if sorted_sources else ([], [])
 
             # Create bar chart
-            fig = self.go.Figure(data=[
-                self.go.Bar(
-                    x=sources,
-                    y=counts,
-                    marker=dict(color=self.config['colors']['primary']),
-                    text=counts,
-                    textposition='auto'
-                )
-            ])
-
-            fig.update_layout(
-                title='Character Count by Source',
-                xaxis_title='Source',
-                yaxis_title='Number of Characters',
-                font=dict(size=self.config['styling']['axis_font_size']),
-                width=self.config['chart_size']['width'],
-                height=self.config['chart_size']['height'],
-                margin=self.config['styling']['margin']
+            layout = self._base_layout(
+                'Character Count by Source', 'Source', 'Number of Characters'
             )
 
             # Rotate x-axis labels if too many sources
             if len(sources) > 5:
-                fig.update_xaxes(tickangle=45)
+                layout['xaxis']['tickangle'] = 45
+
+            fig = {
+                'data': [{
+                    'type': 'bar',
+                    'x': list(sources),
+                    'y': list(counts),
+                    'marker': {'color': self.config['colors']['primary']},
+                    'text': list(counts),
+                    'textposition': 'auto'
+                }],
+                'layout': layout
+            }
 
             result = self._export_chart(fig, 'source_statistics')
             result['chart_type'] = 'bar'
@@ -678,28 +918,25 @@ class ChartGenerator:
 
             dates = list(timeline_data.keys())
             counts = list(timeline_data.values())
+            plot_dates, plot_counts = self._downsample_timeline(
+                dates, counts, self.config['chart_size']['width']
+            )
 
             # Create line chart
-            fig = self.go.Figure(data=[
-                self.go.Scatter(
-                    x=dates,
-                    y=counts,
-                    mode='lines+markers',
-                    line=dict(color=self.config['colors']['primary'], width=2),
-                    marker=dict(size=6),
-                    fill='tonexty' if len(dates) > 1 else None
+            fig = {
+                'data': [{
+                    'type': 'scattergl' if len(plot_dates) > _WEBGL_THRESHOLD else 'scatter',
+                    'x': plot_dates,
+                    'y': plot_counts,
+                    'mode': 'lines+markers',
+                    'line': {'color': self.config['colors']['primary'], 'width': 2},
+                    'marker': {'size': 6},
+                    'fill': 'tonexty' if len(dates) > 1 else 'none'
+                }],
+                'layout': self._base_layout(
+                    'Character Data Collection Timeline', 'Date', 'Characters Collected'
                 )
-            ])
-
-            fig.update_layout(
-                title='Character Data Collection Timeline',
-                xaxis_title='Date',
-                yaxis_title='Characters Collected',
-                font=dict(size=self.config['styling']['axis_font_size']),
-                width=self.config['chart_size']['width'],
-                height=self.config['chart_size']['height'],
-                margin=self.config['styling']['margin']
-            )
+            }
 
             result = self._export_chart(fig, 'timeline_chart')
             result['chart_type'] = 'line'
@@ -719,6 +956,33 @@ class ChartGenerator:
             self.logger.error(error_msg)
             return {'success': False, 'error': error_msg}
 
+
+def _write_text_chunked(path: Path, text: str, chunk_size: int = 1 << 16) -> None:
+    """
+    Write text to a file in UTF-8 chunks.
+
+    Encoding slice by slice keeps only one small chunk of bytes alive next
+    to the string, where write_text() would encode a full copy of a large
+    chart at once.
+
+    Args:
+        path: Output file path
+        text: Text to write
+        chunk_size: Number of characters encoded per write
+    """
+    with open(path, 'wb', buffering=1 << 20) as f:
+        for start in range(0, len(text), chunk_size):
+            f.write(text[start:start + chunk_size].encode('utf-8'))
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize values the JSON encoder does not know (e.g. numpy arrays)."""
+    tolist = getattr(value, 'tolist', None)
+    if callable(tolist):
+        return tolist()
+    return str(value)
+
+
 def create_chart_config() -> Dict[str, Any]:
     """Create default configuration for chart generator."""
     return {